@@ -0,0 +1,92 @@
+"""
+Cold-start benchmark of the API: imports `cryptomesh.server` in fresh
+interpreters with `python -X importtime` and fails when the median import
+time exceeds the budget or a module that must stay lazy gets imported.
+
+    python -m benchmark.startup --runs 5 --budget-ms 1500
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Optional
+
+TARGET = "cryptomesh.server"
+# Integrations imported on first use only; importing them at startup slows every pod down.
+LAZY_MODULES = ["mictlanx", "axo", "humanfriendly", "pandas", "matplotlib", "seaborn"]
+
+
+class ImportProfile(NamedTuple):
+    total_us: int               # cumulative import time of the target
+    modules: Dict[str, int]     # module imported by the target -> cumulative time (us)
+
+
+def parse_importtime(stderr: str, target: str = TARGET) -> Dict[str, int]:
+    """
+    Cumulative time (us) of `target` and of every module imported while
+    importing it, from `-X importtime` output ("import time: self [us] |
+    cumulative | imported package", children listed before their parent).
+    Modules loaded by the interpreter before `target` (site, encodings) are left out.
+    """
+    modules: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, raw = line[len("import time:"):].split("|")
+        name = raw.strip()
+        if raw[1:2] != " ":
+            # Top-level import: either the target, or the end of an unrelated subtree.
+            if name == target:
+                modules[name] = int(cumulative)
+                return modules
+            modules = {}
+            continue
+        modules[name] = int(cumulative)
+    return modules
+
+
+def profile(target: str = TARGET) -> ImportProfile:
+    env = {**os.environ, "CRYPTO_MESH_LOG_TO_FILE": "0"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True, text=True, env=env,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {target} failed:\n{proc.stderr[-2000:]}")
+    modules = parse_importtime(proc.stderr, target)
+    return ImportProfile(total_us=modules.get(target, 0), modules=modules)
+
+
+def eager_lazy_modules(modules: Dict[str, int], lazy: List[str] = LAZY_MODULES) -> List[str]:
+    return sorted({name.split(".")[0] for name in modules if name.split(".")[0] in lazy})
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=f"Import time of {TARGET}")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=float(os.environ.get("CRYPTO_MESH_IMPORT_BUDGET_MS", "1500")))
+    parser.add_argument("--top", type=int, default=15, help="Slowest top-level dependencies to show")
+    args = parser.parse_args(argv)
+
+    profiles = [profile() for _ in range(args.runs)]
+    median_ms = statistics.median(p.total_us for p in profiles) / 1000
+    last = profiles[-1].modules
+    roots = {name: us for name, us in last.items() if "." not in name and name != TARGET.split(".")[0]}
+    print(f"{TARGET}: median {median_ms:.1f} ms over {args.runs} runs (budget {args.budget_ms:.0f} ms)")
+    for name, us in sorted(roots.items(), key=lambda kv: -kv[1])[:args.top]:
+        print(f"  {us / 1000:9.1f} ms  {name}")
+
+    failed = False
+    eager = eager_lazy_modules(last)
+    if eager:
+        print(f"FAIL: imported at startup: {', '.join(eager)}")
+        failed = True
+    if median_ms > args.budget_ms:
+        print(f"FAIL: {median_ms:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
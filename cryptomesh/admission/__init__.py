@@ -0,0 +1,7 @@
+from cryptomesh.admission.controller import AdmissionController, RouteClass
+from cryptomesh.admission.middleware import (
+    ADMISSION_CONTROLLER,
+    AdmissionMiddleware,
+    build_admission_controller,
+    classify,
+)
@@ -0,0 +1,150 @@
+import asyncio
+import math
+import time as T
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from cryptomesh.errors import CryptoMeshError, ServiceUnavailableError, TooManyRequestsError
+from cryptomesh.log.logger import get_logger
+
+L = get_logger(__name__)
+
+
+class RouteClass:
+    """
+    Concurrency budget of one kind of request (deploy, invoke, crud, telemetry).
+
+    Waiting requests sit in a FIFO queue. Shedding follows CoDel: the time a
+    request waited is measured when it is granted; once that delay has
+    stayed above `target` for a whole `interval`, queued requests are
+    rejected until the delay drops below target again. A short burst is
+    absorbed, but a standing queue is not allowed to grow latency for
+    everybody.
+    """
+
+    def __init__(self, name: str, priority: int, limit: int, max_queue: int, target: float, interval: float):
+        self.name      = name
+        self.priority  = priority        # lower is served first
+        self.limit     = limit
+        self.max_queue = max_queue
+        self.target    = target
+        self.interval  = interval
+        self.in_flight = 0
+        self.waiters: Deque[Tuple[float, asyncio.Future]] = deque()
+        self.first_above: Optional[float] = None
+        self.admitted = 0
+        self.queued   = 0
+        self.shed     = 0
+        self.last_delay = 0.0
+
+    def over_target(self, delay: float, now: float) -> bool:
+        """
+        CoDel state update; True when the request that waited `delay` must be dropped.
+        """
+        self.last_delay = delay
+        if delay < self.target:
+            self.first_above = None
+            return False
+        if self.first_above is None:
+            self.first_above = now + self.interval
+            return False
+        return now >= self.first_above
+
+    def retry_after(self) -> int:
+        return max(1, math.ceil(max(self.last_delay, self.interval)))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "priority": self.priority,
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queued_now": len(self.waiters),
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "shed": self.shed,
+            "last_delay": round(self.last_delay, 4),
+        }
+
+
+class AdmissionController:
+    """
+    Bounded concurrency per route class plus a global bound (`total_limit`).
+
+    A request runs immediately when both its class and the server have a
+    free slot and nobody of its class is already waiting. Otherwise it is
+    queued (or rejected at once when its queue is full). Freed slots go to
+    the waiting classes in priority order, so a flood of low-priority
+    telemetry cannot take the slots that deploys and invocations need.
+
+    Rejections carry Retry-After: 429 when the class is over its own
+    budget, 503 when the whole server is.
+    """
+
+    def __init__(self, classes: List[RouteClass], total_limit: int, clock: Callable[[], float] = T.monotonic):
+        self.classes     = {c.name: c for c in classes}
+        self.by_priority = sorted(classes, key=lambda c: c.priority)
+        self.total_limit = total_limit
+        self.clock       = clock
+        self.in_flight   = 0
+
+    def _reject(self, route_class: RouteClass, reason: str) -> CryptoMeshError:
+        route_class.shed += 1
+        L.warning({"event": "ADMISSION.SHED", "class": route_class.name, "reason": reason, "in_flight": self.in_flight})
+        if route_class.in_flight >= route_class.limit:
+            return TooManyRequestsError(f"Too many '{route_class.name}' requests: {reason}", retry_after=route_class.retry_after())
+        return ServiceUnavailableError(f"Server overloaded: {reason}", retry_after=route_class.retry_after())
+
+    def _has_capacity(self, route_class: RouteClass) -> bool:
+        return route_class.in_flight < route_class.limit and self.in_flight < self.total_limit
+
+    def _grant(self, route_class: RouteClass):
+        route_class.in_flight += 1
+        route_class.admitted  += 1
+        self.in_flight        += 1
+
+    async def acquire(self, name: str):
+        route_class = self.classes[name]
+        if not route_class.waiters and self._has_capacity(route_class):
+            self._grant(route_class)
+            return
+        if len(route_class.waiters) >= route_class.max_queue:
+            raise self._reject(route_class, "queue is full")
+
+        future = asyncio.get_running_loop().create_future()
+        route_class.waiters.append((self.clock(), future))
+        route_class.queued += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # Granted right when the caller went away: give the slot back.
+                self.release(name)
+            raise
+
+    def release(self, name: str):
+        route_class = self.classes[name]
+        route_class.in_flight -= 1
+        self.in_flight        -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        now = self.clock()
+        for route_class in self.by_priority:
+            while route_class.waiters and self._has_capacity(route_class):
+                enqueued_at, future = route_class.waiters.popleft()
+                if future.done():
+                    continue
+                if route_class.over_target(now - enqueued_at, now):
+                    future.set_exception(self._reject(route_class, f"queue delay above {route_class.target}s"))
+                    continue
+                self._grant(route_class)
+                future.set_result(None)
+            if self.in_flight >= self.total_limit:
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "total_limit": self.total_limit,
+            "classes": {name: c.stats() for name, c in self.classes.items()},
+        }
@@ -0,0 +1,114 @@
+import json
+import re
+from typing import Optional
+
+from cryptomesh import config
+from cryptomesh.admission.controller import AdmissionController, RouteClass
+from cryptomesh.errors import CryptoMeshError, ServiceUnavailableError, TooManyRequestsError
+from cryptomesh.health.monitor import PROBE_PATHS
+from cryptomesh.log.logger import get_logger
+
+L = get_logger(__name__)
+
+# Served first to last when several classes are waiting for a slot.
+PRIORITIES = {"deploy": 0, "invoke": 1, "crud": 2, "telemetry": 3}
+
+# Never queued: orchestrators must see the server alive while it sheds load.
+BYPASS_PATHS = (*PROBE_PATHS, "/docs", "/redoc", "/openapi.json")
+
+TELEMETRY_PATH = re.compile(r"^/(endpoint-states|function-states|function-results)(/|$)")
+INVOKE_PATH    = re.compile(r"^/functions/[^/]+/invoke/?$")
+DEPLOY_PATH    = re.compile(r"^/(endpoints/deploy|endpoints/detach/[^/]+|policies/import|active-objects(/deploy|/[^/]+/placement)?)/?$")
+WRITE_METHODS  = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def classify(method: str, path: str) -> Optional[str]:
+    """
+    Route class of a request, or None when it is not subject to admission control.
+    """
+    if path.startswith(BYPASS_PATHS):
+        return None
+    prefix = config.CRYPTO_MESH_API_PREFIX.rstrip("/")
+    if prefix and path.startswith(prefix):
+        path = path[len(prefix):] or "/"
+    if method in WRITE_METHODS and INVOKE_PATH.match(path):
+        return "invoke"
+    if method in WRITE_METHODS and (DEPLOY_PATH.match(path) or (method == "PUT" and path.startswith("/blobs/"))):
+        return "deploy"
+    if method in ("POST", "PUT") and TELEMETRY_PATH.match(path):
+        return "telemetry"
+    return "crud"
+
+
+def parse_limits(spec: str) -> dict:
+    """
+    "deploy:16,invoke:256" -> {"deploy": 16, "invoke": 256}
+    """
+    limits = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, value = item.partition(":")
+        if name.strip() not in PRIORITIES:
+            raise ValueError(f"Unknown admission class '{name.strip()}' (expected one of {', '.join(PRIORITIES)})")
+        limits[name.strip()] = int(value)
+    return limits
+
+
+def build_admission_controller() -> AdmissionController:
+    limits = parse_limits(config.CRYPTO_MESH_ADMISSION_LIMITS)
+    classes = [
+        RouteClass(
+            name,
+            priority=priority,
+            limit=limits.get(name, config.CRYPTO_MESH_ADMISSION_TOTAL),
+            max_queue=config.CRYPTO_MESH_ADMISSION_MAX_QUEUE,
+            target=config.CRYPTO_MESH_ADMISSION_TARGET_DELAY,
+            interval=config.CRYPTO_MESH_ADMISSION_INTERVAL,
+        )
+        for name, priority in PRIORITIES.items()
+    ]
+    return AdmissionController(classes, total_limit=config.CRYPTO_MESH_ADMISSION_TOTAL)
+
+
+ADMISSION_CONTROLLER = build_admission_controller()
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware that holds every API request until the admission
+    controller grants its route class a slot, and answers 429/503 with
+    Retry-After when the request is shed instead. The slot is held until
+    the response has been sent (streaming bodies included).
+    """
+
+    def __init__(self, app, controller: AdmissionController = None):
+        self.app        = app
+        self.controller = controller or ADMISSION_CONTROLLER
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        route_class = classify(scope["method"], scope["path"])
+        if route_class is None:
+            return await self.app(scope, receive, send)
+        try:
+            await self.controller.acquire(route_class)
+        except (TooManyRequestsError, ServiceUnavailableError) as e:
+            return await self._reject(e, send)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(route_class)
+
+    @staticmethod
+    async def _reject(error: CryptoMeshError, send):
+        body = json.dumps({"detail": error.to_dict()}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": error.code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, int(round(error.retry_after)))).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
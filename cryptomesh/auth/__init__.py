@@ -0,0 +1,9 @@
+from cryptomesh.auth.tokens import (
+    Principal,
+    StaticTokenVerifier,
+    HMACTokenVerifier,
+    ChainedTokenVerifier,
+    CachedTokenVerifier,
+)
+from cryptomesh.auth.engine import AuthorizationEngine, AUTHORIZATION_ENGINE, compile_tables
+from cryptomesh.auth.dependencies import authorize, authenticate
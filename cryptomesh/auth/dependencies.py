@@ -0,0 +1,123 @@
+from typing import Dict, Optional
+
+from fastapi import HTTPException, Request
+
+from cryptomesh import config
+from cryptomesh.auth.engine import AUTHORIZATION_ENGINE
+from cryptomesh.auth.tokens import (
+    CachedTokenVerifier,
+    ChainedTokenVerifier,
+    HMACTokenVerifier,
+    Principal,
+    StaticTokenVerifier,
+)
+from cryptomesh.db import get_collection
+from cryptomesh.errors import CryptoMeshError
+from cryptomesh.health.monitor import PROBE_PATHS
+from cryptomesh.log.logger import get_logger
+from cryptomesh.repositories.token_revocations_repository import REVOCATIONS_COLLECTION, TokenRevocationsRepository
+
+L = get_logger(__name__)
+
+METHOD_ACTIONS = {
+    "GET": "read",
+    "HEAD": "read",
+    "OPTIONS": "read",
+    "POST": "write",
+    "PUT": "write",
+    "PATCH": "write",
+    "DELETE": "delete",
+}
+
+
+def revocations_store() -> Optional[TokenRevocationsRepository]:
+    collection = get_collection(REVOCATIONS_COLLECTION)
+    return None if collection is None else TokenRevocationsRepository(collection)
+
+
+def build_token_verifier() -> CachedTokenVerifier:
+    verifiers = [StaticTokenVerifier.from_spec(config.CRYPTO_MESH_AUTH_TOKENS)]
+    if config.CRYPTO_MESH_AUTH_SECRET:
+        verifiers.append(HMACTokenVerifier(
+            config.CRYPTO_MESH_AUTH_SECRET,
+            max_lifetime = config.CRYPTO_MESH_AUTH_MAX_TOKEN_LIFETIME,
+        ))
+    return CachedTokenVerifier(
+        ChainedTokenVerifier(verifiers),
+        ttl                = config.CRYPTO_MESH_AUTH_TOKEN_CACHE_TTL,
+        negative_ttl       = config.CRYPTO_MESH_AUTH_NEGATIVE_TTL,
+        max_size           = config.CRYPTO_MESH_AUTH_TOKEN_CACHE_MAX_SIZE,
+        max_token_lifetime = config.CRYPTO_MESH_AUTH_MAX_TOKEN_LIFETIME,
+        sync_interval      = config.CRYPTO_MESH_AUTH_REVOCATION_SYNC_INTERVAL,
+        store              = revocations_store,
+    )
+
+
+TOKEN_VERIFIER = build_token_verifier()
+
+# route path template -> resource name, e.g. "/api/v1/services/{service_id}/" -> "services"
+_RESOURCES: Dict[str, str] = {}
+
+
+def route_resource(request: Request) -> str:
+    route = request.scope.get("route")
+    path = getattr(route, "path", request.url.path)
+    resource = _RESOURCES.get(path)
+    if resource is None:
+        relative = path[len(config.CRYPTO_MESH_API_PREFIX):] if path.startswith(config.CRYPTO_MESH_API_PREFIX) else path
+        resource = next((segment for segment in relative.split("/") if segment), "")
+        _RESOURCES[path] = resource
+    return resource
+
+
+def bearer_token(request: Request) -> Optional[str]:
+    header = request.headers.get("authorization")
+    if not header:
+        return None
+    scheme, _, token = header.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return token.strip()
+
+
+async def authenticate(request: Request) -> Optional[Principal]:
+    token = bearer_token(request)
+    if token is None:
+        return None
+    return await TOKEN_VERIFIER.verify(token)
+
+
+async def authorize(request: Request) -> Optional[Principal]:
+    """
+    Global dependency: checks the bearer token of the request against the
+    compiled tables of the API security policy (CRYPTO_MESH_AUTH_POLICY).
+    The required permission is derived from the route, e.g. GET /services ->
+    "read" or "services:read". Does nothing unless CRYPTO_MESH_AUTH_ENABLED,
+    nor for the health probes.
+
+    Tokens are only verified when the policy has requires_authentication,
+    and verified claims come from TOKEN_VERIFIER's cache.
+    """
+    if not config.CRYPTO_MESH_AUTH_ENABLED or request.url.path in PROBE_PATHS:
+        return None
+    resource = route_resource(request)
+    action = METHOD_ACTIONS.get(request.method, "write")
+    try:
+        sp_id = config.CRYPTO_MESH_AUTH_POLICY or None
+        await AUTHORIZATION_ENGINE.ensure_fresh()
+        if not AUTHORIZATION_ENGINE.requires_authentication(sp_id):
+            return None
+        principal = await authenticate(request)
+        AUTHORIZATION_ENGINE.authorize(principal, sp_id, resource, action)
+    except CryptoMeshError as e:
+        L.warning({
+            "event": "AUTH.DENIED",
+            "resource": resource,
+            "action": action,
+            "code": e.code,
+            "reason": e.message
+        })
+        headers = {"WWW-Authenticate": "Bearer"} if e.code == 401 else None
+        raise HTTPException(status_code=e.code, detail=e.to_dict(), headers=headers)
+    request.state.principal = principal
+    return principal
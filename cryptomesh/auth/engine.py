@@ -0,0 +1,196 @@
+import asyncio
+import time as T
+from typing import Callable, Dict, FrozenSet, Hashable, Iterable, NamedTuple, Optional, Set, Tuple
+
+from cryptomesh import config
+from cryptomesh.auth.tokens import Principal
+from cryptomesh.db import get_collection
+from cryptomesh.errors import ForbiddenError, UnauthorizedError
+from cryptomesh.log.logger import get_logger
+from cryptomesh.models import RoleModel, SecurityPolicyModel
+from cryptomesh.repositories.roles_repository import RolesRepository
+from cryptomesh.repositories.security_policy_repository import SecurityPolicyRepository
+from cryptomesh.repositories.versions_repository import CollectionVersionsRepository
+from cryptomesh.services.roles_service import ROLE_CACHE
+from cryptomesh.services.security_policy_service import POLICY_CACHE
+
+L = get_logger(__name__)
+
+AUTH_COLLECTIONS = ("roles", "security_policies")
+WILDCARD = "*"
+
+
+class CompiledPolicy(NamedTuple):
+    sp_id: Optional[str]
+    requires_authentication: bool
+    # role (role_id or name) -> bitmask of the permissions it grants
+    role_masks: Dict[str, int]
+
+
+class AuthorizationTables(NamedTuple):
+    bits: Dict[str, int]
+    policies: Dict[Optional[str], CompiledPolicy]
+
+
+def compile_tables(roles: Iterable[RoleModel], policies: Iterable[SecurityPolicyModel]) -> AuthorizationTables:
+    """
+    Assigns one bit per distinct permission string and folds every policy's
+    roles into {role: mask}. The None policy holds every role and is used
+    when no policy is configured for the API.
+    """
+    bits: Dict[str, int] = {}
+    role_masks: Dict[str, int] = {}
+    # Policies reference roles by id or, in the YAML files, by name; tokens may carry either.
+    aliases: Dict[str, Set[str]] = {}
+    for role in roles:
+        mask = 0
+        for permission in role.permissions:
+            bit = bits.setdefault(permission, 1 << len(bits))
+            mask |= bit
+        names = (role.role_id, role.name)
+        for alias in names:
+            role_masks[alias] = role_masks.get(alias, 0) | mask
+            aliases.setdefault(alias, set()).update(names)
+
+    compiled: Dict[Optional[str], CompiledPolicy] = {
+        None: CompiledPolicy(None, True, role_masks),
+    }
+    for policy in policies:
+        granted: Dict[str, int] = {}
+        for reference in policy.roles:
+            for alias in aliases.get(reference, ()):
+                granted[alias] = role_masks[alias]
+        compiled[policy.sp_id] = CompiledPolicy(policy.sp_id, policy.requires_authentication, granted)
+    return AuthorizationTables(bits, compiled)
+
+
+class AuthorizationEngine:
+    """
+    Role/permission tables compiled once from Mongo and checked in memory.
+
+    Permissions are plain strings ("read", "services:write", "*"); each one
+    gets a bit, so a check is a couple of dict lookups and an AND. The masks of
+    a principal's role set are memoized per policy. The tables are recompiled
+    only when a role or a security policy changes (version bumps of local
+    writes, cache invalidations coming from change streams) or after
+    `refresh_interval` seconds, which bounds the staleness of writes made by
+    other processes when change streams are off.
+    """
+
+    def __init__(self, refresh_interval: float, clock: Callable[[], float] = T.monotonic):
+        self.refresh_interval = refresh_interval
+        self.clock            = clock
+        self.tables           = AuthorizationTables({}, {None: CompiledPolicy(None, True, {})})
+        self.compiled         = False
+        self.stale            = False
+        self.compilations     = 0
+        self._compiled_at     = 0.0
+        self._required: Dict[Tuple[str, str], int] = {}
+        self._masks: Dict[Tuple[Optional[str], FrozenSet[str]], int] = {}
+        self._lock            = asyncio.Lock()
+
+    # ----------------------------
+    # Compilation
+    # ----------------------------
+    def load(self, tables: AuthorizationTables):
+        self.tables        = tables
+        self._required     = {}
+        self._masks        = {}
+        self.compiled      = True
+        self.stale         = False
+        self.compilations += 1
+        self._compiled_at  = self.clock()
+
+    async def compile(self):
+        started = self.clock()
+        async with self._lock:
+            if self.compiled and not self.stale and self._compiled_at >= started:
+                return
+            t1 = T.time()
+            roles    = await RolesRepository(get_collection("roles")).get_all()
+            policies = await SecurityPolicyRepository(get_collection("security_policies")).get_all()
+            self.load(compile_tables(roles, policies))
+            L.info({
+                "event": "AUTH.TABLES.COMPILED",
+                "roles": len(roles),
+                "policies": len(policies),
+                "permissions": len(self.tables.bits),
+                "time": round(T.time() - t1, 4)
+            })
+
+    async def ensure_fresh(self):
+        if self.compiled and not self.stale and self.clock() - self._compiled_at < self.refresh_interval:
+            return
+        await self.compile()
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """
+        TTLCache listener: any change of a role or policy makes the tables stale.
+        """
+        self.stale = True
+
+    def on_version_bump(self, collection: str, token: str):
+        if collection in AUTH_COLLECTIONS:
+            self.stale = True
+
+    # ----------------------------
+    # Checks
+    # ----------------------------
+    def required_mask(self, resource: str, action: str) -> int:
+        key = (resource, action)
+        mask = self._required.get(key)
+        if mask is None:
+            bits = self.tables.bits
+            mask = 0
+            for permission in (action, f"{resource}:{action}", f"{resource}:{WILDCARD}", WILDCARD):
+                mask |= bits.get(permission, 0)
+            self._required[key] = mask
+        return mask
+
+    def principal_mask(self, policy: CompiledPolicy, roles: FrozenSet[str]) -> int:
+        key = (policy.sp_id, roles)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = 0
+            for role in roles:
+                mask |= policy.role_masks.get(role, 0)
+            self._masks[key] = mask
+        return mask
+
+    def requires_authentication(self, sp_id: Optional[str]) -> bool:
+        policy = self.tables.policies.get(sp_id)
+        return policy is None or policy.requires_authentication
+
+    def is_allowed(self, principal: Optional[Principal], sp_id: Optional[str], resource: str, action: str) -> bool:
+        policy = self.tables.policies.get(sp_id)
+        if policy is None:
+            return False
+        if not policy.requires_authentication:
+            return True
+        if principal is None:
+            return False
+        return bool(self.principal_mask(policy, principal.roles) & self.required_mask(resource, action))
+
+    def authorize(self, principal: Optional[Principal], sp_id: Optional[str], resource: str, action: str):
+        if self.is_allowed(principal, sp_id, resource, action):
+            return
+        policy = self.tables.policies.get(sp_id)
+        if principal is None and (policy is None or policy.requires_authentication):
+            raise UnauthorizedError("Missing or invalid bearer token")
+        raise ForbiddenError(f"'{resource}:{action}' is not granted by security policy '{sp_id or '*'}'")
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "compiled": self.compiled,
+            "stale": self.stale,
+            "compilations": self.compilations,
+            "permissions": len(self.tables.bits),
+            "policies": len(self.tables.policies) - 1,
+            "memoized_masks": len(self._masks),
+        }
+
+
+AUTHORIZATION_ENGINE = AuthorizationEngine(refresh_interval=config.CRYPTO_MESH_AUTH_REFRESH_INTERVAL)
+POLICY_CACHE.subscribe(AUTHORIZATION_ENGINE.invalidate)
+ROLE_CACHE.subscribe(AUTHORIZATION_ENGINE.invalidate)
+CollectionVersionsRepository.subscribe(AUTHORIZATION_ENGINE.on_version_bump)
@@ -0,0 +1,330 @@
+import base64
+import hashlib
+import hmac
+import json
+import time as T
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Protocol
+
+from cryptomesh.cache import TTLCache
+from cryptomesh.log.logger import get_logger
+
+L = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Principal:
+    subject: str
+    roles: FrozenSet[str]
+    token_id: Optional[str] = None
+    issued_at: Optional[float] = None
+    expires_at: Optional[float] = None
+
+
+class TokenVerifier(Protocol):
+    async def verify(self, token: str) -> Optional[Principal]: ...
+
+
+class StaticTokenVerifier:
+    """
+    Maps opaque bearer tokens to principals from a static table, configured as
+    "token:role1|role2,other-token:role3" (CRYPTO_MESH_AUTH_TOKENS).
+    """
+
+    def __init__(self, tokens: Dict[str, Principal]):
+        self.tokens = tokens
+
+    @classmethod
+    def from_spec(cls, spec: str) -> "StaticTokenVerifier":
+        tokens: Dict[str, Principal] = {}
+        for index, entry in enumerate(filter(None, (e.strip() for e in spec.split(",")))):
+            token, _, roles = entry.partition(":")
+            tokens[token] = Principal(
+                subject = f"static-{index}",
+                roles   = frozenset(r.strip() for r in roles.split("|") if r.strip()),
+            )
+        return cls(tokens)
+
+    async def verify(self, token: str) -> Optional[Principal]:
+        return self.tokens.get(token)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class HMACTokenVerifier:
+    """
+    Verifies HS256 JWTs signed with a shared secret (CRYPTO_MESH_AUTH_SECRET).
+
+    Claims: sub, roles (list), exp and optionally iat/jti. Any malformed,
+    badly signed or expired token is rejected (None). With `max_lifetime`,
+    tokens must carry iat and live at most that long, which bounds how long
+    a revocation has to be remembered.
+    """
+    HEADER = _b64encode(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+
+    def __init__(
+        self,
+        secret: str,
+        leeway: float = 0.0,
+        max_lifetime: Optional[float] = None,
+        clock: Callable[[], float] = T.time,
+    ):
+        self.secret = secret.encode()
+        self.leeway = leeway
+        self.max_lifetime = max_lifetime
+        self.clock  = clock
+
+    def _sign(self, signing_input: str) -> str:
+        return _b64encode(hmac.new(self.secret, signing_input.encode(), hashlib.sha256).digest())
+
+    def issue(self, subject: str, roles: List[str], ttl: float = 3600) -> str:
+        now = self.clock()
+        if self.max_lifetime is not None:
+            ttl = min(ttl, self.max_lifetime)
+        claims = {"sub": subject, "roles": list(roles), "iat": int(now), "exp": int(now + ttl), "jti": uuid.uuid4().hex}
+        signing_input = f"{self.HEADER}.{_b64encode(json.dumps(claims, separators=(',', ':')).encode())}"
+        return f"{signing_input}.{self._sign(signing_input)}"
+
+    async def verify(self, token: str) -> Optional[Principal]:
+        try:
+            header, payload, signature = token.split(".")
+            if not hmac.compare_digest(self._sign(f"{header}.{payload}"), signature):
+                return None
+            if json.loads(_b64decode(header)).get("alg") != "HS256":
+                return None
+            claims: Dict[str, Any] = json.loads(_b64decode(payload))
+        except (ValueError, TypeError):
+            return None
+        expires_at = claims.get("exp")
+        now = self.clock()
+        if not isinstance(expires_at, (int, float)) or expires_at + self.leeway <= now:
+            return None
+        issued_at = claims.get("iat")
+        if self.max_lifetime is not None:
+            if not isinstance(issued_at, (int, float)) or issued_at > now + self.leeway:
+                return None
+            if expires_at - issued_at > self.max_lifetime:
+                return None
+        return Principal(
+            subject    = str(claims.get("sub", "")),
+            roles      = frozenset(claims.get("roles") or ()),
+            token_id   = claims.get("jti"),
+            issued_at  = issued_at,
+            expires_at = float(expires_at),
+        )
+
+
+class ChainedTokenVerifier:
+    """
+    Tries each verifier in order; the first principal wins.
+    """
+
+    def __init__(self, verifiers: List[TokenVerifier]):
+        self.verifiers = verifiers
+
+    async def verify(self, token: str) -> Optional[Principal]:
+        for verifier in self.verifiers:
+            principal = await verifier.verify(token)
+            if principal is not None:
+                return principal
+        return None
+
+
+_REJECTED = object()
+
+
+class CachedTokenVerifier:
+    """
+    Memoizes the outcome of an expensive verifier (signature check,
+    introspection) keyed by the SHA-256 of the token, so raw tokens are never
+    kept in memory.
+
+    Accepted tokens are cached for `ttl` seconds but never past their own
+    expiration; rejected tokens are cached for `negative_ttl` seconds so that
+    floods of bad tokens do not reach the verifier. Revoking a token or a
+    subject drops the cached claims and blocks them on the slow path as well.
+
+    Revocations are not cached entries: a revoked token is remembered until it
+    expires (forever if it never does), a revoked token id or subject for
+    `max_token_lifetime` seconds, the longest any token may live. With a
+    `store` (a callable returning the shared TokenRevocationsRepository, or
+    None while MongoDB is not connected) revocations are persisted, and every
+    `sync_interval` seconds the ones made by other workers are loaded.
+    """
+    # Revocations made this long before the newest one seen are read again on
+    # every sync, so writes from hosts with a lagging clock are not missed.
+    SYNC_OVERLAP = 60.0
+
+    def __init__(
+        self,
+        verifier: TokenVerifier,
+        ttl: float,
+        negative_ttl: float,
+        max_size: int,
+        max_token_lifetime: float = 86400,
+        sync_interval: float = 2.0,
+        store: Optional[Callable[[], Any]] = None,
+        clock: Callable[[], float] = T.time,
+    ):
+        self.verifier  = verifier
+        self.clock     = clock
+        self.cache: TTLCache = TTLCache(name="auth_tokens", ttl=ttl, max_size=max_size, clock=clock)
+        self.negative_ttl = negative_ttl
+        self.max_token_lifetime = max_token_lifetime
+        self.sync_interval = sync_interval
+        self.store = store
+        # token hash / token id (jti) -> expiration of the revocation (None: never)
+        self.revoked: Dict[str, Optional[float]] = {}
+        # subject -> revocation time: tokens issued up to then are rejected
+        self.revoked_subjects: Dict[str, float] = {}
+        self.verifications = 0
+        self.rejections    = 0
+        self._maintained_at = float("-inf")
+        self._synced_until  = float("-inf")
+
+    @staticmethod
+    def key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    async def verify(self, token: str) -> Optional[Principal]:
+        await self.maintain()
+        key = self.key(token)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return None if cached is _REJECTED else cached
+
+        self.verifications += 1
+        principal = None if key in self.revoked else await self.verifier.verify(token)
+        if principal is not None and self._is_revoked(principal):
+            principal = None
+        if principal is None:
+            self.rejections += 1
+            self.cache.set(key, _REJECTED, ttl=self.negative_ttl)
+            return None
+
+        ttl = self.cache.ttl
+        if principal.expires_at is not None:
+            ttl = min(ttl, principal.expires_at - self.clock())
+        self.cache.set(key, principal, ttl=ttl)
+        return principal
+
+    def _is_revoked(self, principal: Principal) -> bool:
+        if principal.token_id is not None and principal.token_id in self.revoked:
+            return True
+        revoked_at = self.revoked_subjects.get(principal.subject)
+        if revoked_at is None:
+            return False
+        return principal.issued_at is None or principal.issued_at <= revoked_at
+
+    # ----------------------------
+    # Revocation hooks
+    # ----------------------------
+    async def revoke(self, token: Optional[str] = None, token_id: Optional[str] = None, expires_at: Optional[float] = None):
+        """
+        Revokes a token (until it expires) and/or a token id (until `expires_at`
+        or, when unknown, for max_token_lifetime).
+        """
+        now = self.clock()
+        if token is not None:
+            key = self.key(token)
+            principal = await self.verifier.verify(token)
+            token_expires_at = principal.expires_at if principal is not None else now + self.max_token_lifetime
+            self._apply("token", key, now, token_expires_at)
+            self.cache.invalidate(key)
+            await self._persist("token", key, now, token_expires_at)
+        if token_id is not None:
+            token_expires_at = expires_at if expires_at is not None else now + self.max_token_lifetime
+            self._apply("jti", token_id, now, token_expires_at)
+            # Claims are keyed by token hash; revocations are rare, so just drop them all.
+            self.cache.clear()
+            await self._persist("jti", token_id, now, token_expires_at)
+        L.info({"event": "AUTH.TOKEN.REVOKED", "token_id": token_id, "by_token": token is not None})
+
+    async def revoke_subject(self, subject: str):
+        """
+        Rejects every token of `subject` issued until now.
+        """
+        now = self.clock()
+        self._apply("subject", subject, now, now + self.max_token_lifetime)
+        self.cache.clear()
+        await self._persist("subject", subject, now, now + self.max_token_lifetime)
+        L.info({"event": "AUTH.SUBJECT.REVOKED", "subject": subject})
+
+    def _apply(self, kind: str, value: str, revoked_at: float, expires_at: Optional[float]) -> bool:
+        """
+        Records a revocation in memory; False when it was already known or has lapsed.
+        """
+        now = self.clock()
+        if kind == "subject":
+            if revoked_at + self.max_token_lifetime <= now:
+                return False
+            if self.revoked_subjects.get(value, float("-inf")) >= revoked_at:
+                return False
+            self.revoked_subjects[value] = revoked_at
+            return True
+        if value in self.revoked or (expires_at is not None and expires_at <= now):
+            return False
+        self.revoked[value] = expires_at
+        return True
+
+    async def _persist(self, kind: str, value: str, revoked_at: float, expires_at: Optional[float]):
+        store = self.store() if self.store is not None else None
+        if store is None:
+            return
+        try:
+            await store.add(kind, value, revoked_at, expires_at)
+        except Exception as e:
+            # Still enforced by this worker; other workers miss it until it is revoked again.
+            L.error({"event": "AUTH.REVOCATION.PERSIST.FAIL", "kind": kind, "error": str(e)})
+
+    def prune(self):
+        """
+        Forgets revocations that can no longer match a valid token.
+        """
+        now = self.clock()
+        for key in [key for key, expires_at in self.revoked.items() if expires_at is not None and expires_at <= now]:
+            del self.revoked[key]
+        for subject in [s for s, revoked_at in self.revoked_subjects.items() if revoked_at + self.max_token_lifetime <= now]:
+            del self.revoked_subjects[subject]
+
+    async def maintain(self, force: bool = False):
+        """
+        At most once per sync_interval (unless `force`): prunes expired
+        revocations and loads the ones persisted by other workers.
+        """
+        now = self.clock()
+        if not force and now - self._maintained_at < self.sync_interval:
+            return
+        self._maintained_at = now
+        self.prune()
+        store = self.store() if self.store is not None else None
+        if store is None:
+            return
+        try:
+            docs = await store.since(self._synced_until - self.SYNC_OVERLAP)
+        except Exception as e:
+            L.error({"event": "AUTH.REVOCATIONS.SYNC.FAIL", "error": str(e)})
+            return
+        changed = False
+        for doc in docs:
+            changed = self._apply(doc["kind"], doc["value"], doc["revoked_at"], doc.get("expires_at")) or changed
+            self._synced_until = max(self._synced_until, doc["revoked_at"])
+        if changed:
+            self.cache.clear()
+            L.info({"event": "AUTH.REVOCATIONS.SYNCED", "revocations": len(docs), "time": round(self.clock() - now, 4)})
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.cache.stats(),
+            "verifications": self.verifications,
+            "rejections": self.rejections,
+            "revoked": len(self.revoked),
+            "revoked_subjects": len(self.revoked_subjects),
+        }
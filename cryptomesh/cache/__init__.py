@@ -0,0 +1,93 @@
+import time as T
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+InvalidationListener = Callable[[Optional[Hashable]], None]
+
+
+class TTLCache(Generic[V]):
+    """
+    In-process cache bounded by size (LRU eviction) and by age (TTL).
+
+    It is not thread-safe on purpose: every instance lives inside a single
+    event loop, so plain dict operations are atomic from the caller's point of view.
+    Invalidations are published to subscribers (local pub/sub) so that
+    derived state, e.g. compiled authorization tables, can be dropped too.
+    """
+
+    def __init__(self, name: str, ttl: float, max_size: int, clock: Callable[[], float] = T.monotonic):
+        self.name          = name
+        self.ttl           = ttl
+        self.max_size      = max_size
+        self.clock         = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._listeners: List[InvalidationListener] = []
+        self.hits          = 0
+        self.misses        = 0
+        self.evictions     = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > self.clock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None):
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (self.clock() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        self._entries.pop(key, None)
+        self.invalidations += 1
+        self._publish(key)
+
+    def clear(self):
+        self._entries.clear()
+        self.invalidations += 1
+        self._publish(None)
+
+    def subscribe(self, listener: InvalidationListener):
+        """
+        Registers a callback invoked with the invalidated key (None means the whole cache).
+        """
+        self._listeners.append(listener)
+
+    def _publish(self, key: Optional[Hashable]):
+        for listener in self._listeners:
+            listener(key)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
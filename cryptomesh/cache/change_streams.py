@@ -0,0 +1,49 @@
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import PyMongoError
+from cryptomesh.cache import TTLCache
+from cryptomesh.log.logger import get_logger
+
+L = get_logger(__name__)
+
+
+async def watch_invalidations(collection: AsyncIOMotorCollection, cache: TTLCache, id_field: str, retry_delay: float = 5.0):
+    """
+    Invalidates `cache` entries from a Mongo change stream so that writes made
+    by other processes are seen. Change streams need a replica set; on a
+    standalone server the watcher logs once and exits, leaving the local
+    pub/sub invalidation and the TTL as the only mechanisms.
+    """
+    while True:
+        try:
+            async with collection.watch(full_document="updateLookup") as stream:
+                L.info({
+                    "event": "CACHE.CHANGE_STREAM.STARTED",
+                    "cache": cache.name,
+                    "collection": collection.name
+                })
+                async for change in stream:
+                    document = change.get("fullDocument") or {}
+                    key      = document.get(id_field)
+                    if key is None:
+                        # Deletes only carry the _id, so drop everything (the caches are tiny).
+                        cache.clear()
+                    else:
+                        cache.invalidate(key)
+        except asyncio.CancelledError:
+            raise
+        except PyMongoError as e:
+            if getattr(e, "code", None) == 40573 or "replica set" in str(e):
+                L.warning({
+                    "event": "CACHE.CHANGE_STREAM.UNSUPPORTED",
+                    "cache": cache.name,
+                    "reason": str(e)
+                })
+                return
+            L.error({
+                "event": "CACHE.CHANGE_STREAM.ERROR",
+                "cache": cache.name,
+                "reason": str(e)
+            })
+            cache.clear()
+            await asyncio.sleep(retry_delay)
@@ -0,0 +1,45 @@
+import asyncio
+from typing import Dict, Optional
+from pymongo.errors import PyMongoError
+from cryptomesh.repositories.versions_repository import CollectionVersionsRepository
+from cryptomesh.log.logger import get_logger
+
+L = get_logger(__name__)
+
+
+class VersionPoller:
+    """
+    Replays the collection version bumps made by other processes (API
+    workers or replicas) to the local listeners, so their routes, compiled
+    tables and caches are invalidated within `interval` seconds. Works on a
+    standalone MongoDB, unlike change streams: it reads the small
+    collection_versions collection once per interval.
+
+    The first poll only records the current tokens. Tokens this process
+    bumped itself were already announced by bump() and are skipped.
+    """
+
+    def __init__(self, repository: CollectionVersionsRepository, interval: float):
+        self.repository = repository
+        self.interval   = interval
+        self.known: Optional[Dict[str, str]] = None
+        self.replayed   = 0
+
+    async def poll_once(self):
+        tokens = await self.repository.get_all()
+        if self.known is not None:
+            for name, token in tokens.items():
+                if self.known.get(name) != token and CollectionVersionsRepository.local_tokens.get(name) != token:
+                    self.replayed += 1
+                    CollectionVersionsRepository.notify(name, token)
+        self.known = tokens
+
+    async def run(self):
+        while True:
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except PyMongoError as e:
+                L.error({"event": "CACHE.VERSION_POLL.ERROR", "reason": str(e)})
+            await asyncio.sleep(self.interval)
@@ -22,3 +22,109 @@ CRYPTO_MESH_LOG_ROTATION_WHEN = os.environ.get("CRYPTO_MESH_LOG_ROTATION_WHEN",
 CRYPTO_MESH_LOG_ROTATION_INTERVAL = int(os.environ.get("CRYPTO_MESH_LOG_ROTATION_INTERVAL", "10"))
 CRYPTO_MESH_LOG_TO_FILE = bool(int(os.environ.get("CRYPTO_MESH_LOG_TO_FILE", "1")))
 CRYPTO_MESH_LOG_ERROR_FILE = bool(int(os.environ.get("CRYPTO_MESH_LOG_ERROR_FILE", "0")))
+# Suffix log files with the process id (set by the launcher when running several workers)
+CRYPTO_MESH_LOG_PER_PROCESS = bool(int(os.environ.get("CRYPTO_MESH_LOG_PER_PROCESS", "0")))
+
+# Caching
+CRYPTO_MESH_POLICY_CACHE_TTL = float(os.environ.get("CRYPTO_MESH_POLICY_CACHE_TTL", "60"))
+CRYPTO_MESH_POLICY_CACHE_MAX_SIZE = int(os.environ.get("CRYPTO_MESH_POLICY_CACHE_MAX_SIZE", "1024"))
+CRYPTO_MESH_ROLE_CACHE_TTL = float(os.environ.get("CRYPTO_MESH_ROLE_CACHE_TTL", "60"))
+CRYPTO_MESH_ROLE_CACHE_MAX_SIZE = int(os.environ.get("CRYPTO_MESH_ROLE_CACHE_MAX_SIZE", "1024"))
+CRYPTO_MESH_CACHE_CHANGE_STREAMS = bool(int(os.environ.get("CRYPTO_MESH_CACHE_CHANGE_STREAMS", "0")))
+# Seconds between polls of collection_versions that replay other processes' writes to local caches (0 disables)
+CRYPTO_MESH_VERSION_POLL_INTERVAL = float(os.environ.get("CRYPTO_MESH_VERSION_POLL_INTERVAL", "1"))
+
+# Hierarchy snapshot
+CRYPTO_MESH_HIERARCHY_SYNC_INTERVAL = float(os.environ.get("CRYPTO_MESH_HIERARCHY_SYNC_INTERVAL", "2"))
+CRYPTO_MESH_HIERARCHY_REBUILD_INTERVAL = float(os.environ.get("CRYPTO_MESH_HIERARCHY_REBUILD_INTERVAL", "300"))
+
+# Authentication / authorization
+CRYPTO_MESH_AUTH_ENABLED = bool(int(os.environ.get("CRYPTO_MESH_AUTH_ENABLED", "0")))
+# Security policy (sp_id) guarding the API; empty means every role of the principal counts.
+CRYPTO_MESH_AUTH_POLICY = os.environ.get("CRYPTO_MESH_AUTH_POLICY", "")
+# Static bearer tokens: "token:role1|role2,other-token:role3"
+CRYPTO_MESH_AUTH_TOKENS = os.environ.get("CRYPTO_MESH_AUTH_TOKENS", "")
+CRYPTO_MESH_AUTH_REFRESH_INTERVAL = float(os.environ.get("CRYPTO_MESH_AUTH_REFRESH_INTERVAL", "60"))
+# HS256 secret for signed bearer tokens (empty disables them)
+CRYPTO_MESH_AUTH_SECRET = os.environ.get("CRYPTO_MESH_AUTH_SECRET", "")
+CRYPTO_MESH_AUTH_TOKEN_CACHE_TTL = float(os.environ.get("CRYPTO_MESH_AUTH_TOKEN_CACHE_TTL", "300"))
+CRYPTO_MESH_AUTH_TOKEN_CACHE_MAX_SIZE = int(os.environ.get("CRYPTO_MESH_AUTH_TOKEN_CACHE_MAX_SIZE", "10000"))
+CRYPTO_MESH_AUTH_NEGATIVE_TTL = float(os.environ.get("CRYPTO_MESH_AUTH_NEGATIVE_TTL", "30"))
+# Longest lifetime (exp - iat) accepted for signed tokens; revocations are remembered this long.
+CRYPTO_MESH_AUTH_MAX_TOKEN_LIFETIME = float(os.environ.get("CRYPTO_MESH_AUTH_MAX_TOKEN_LIFETIME", "86400"))
+# Seconds between loads of the revocations persisted by other workers
+CRYPTO_MESH_AUTH_REVOCATION_SYNC_INTERVAL = float(os.environ.get("CRYPTO_MESH_AUTH_REVOCATION_SYNC_INTERVAL", "2"))
+
+# Blob uploads
+CRYPTO_MESH_UPLOAD_CHUNK_SIZE = int(os.environ.get("CRYPTO_MESH_UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+CRYPTO_MESH_UPLOAD_MAX_BYTES = int(os.environ.get("CRYPTO_MESH_UPLOAD_MAX_BYTES", str(4 * 1024 ** 3)))
+
+# Storage backend: "mictlanx" (object store router) or "local" (content-addressed files under CRYPTO_MESH_LOCAL_STORAGE_PATH)
+CRYPTO_MESH_STORAGE_BACKEND = os.environ.get("CRYPTO_MESH_STORAGE_BACKEND", "mictlanx").lower()
+CRYPTO_MESH_LOCAL_STORAGE_PATH = os.environ.get("CRYPTO_MESH_LOCAL_STORAGE_PATH", "./data/blobs")
+
+# Function invocation gateway
+CRYPTO_MESH_INVOKE_TIMEOUT = float(os.environ.get("CRYPTO_MESH_INVOKE_TIMEOUT", "30"))
+CRYPTO_MESH_INVOKE_CONNECT_TIMEOUT = float(os.environ.get("CRYPTO_MESH_INVOKE_CONNECT_TIMEOUT", "5"))
+# Invocations in flight across all endpoints; callers wait up to ACQUIRE_TIMEOUT for a slot, then get 503
+CRYPTO_MESH_INVOKE_MAX_IN_FLIGHT = int(os.environ.get("CRYPTO_MESH_INVOKE_MAX_IN_FLIGHT", "256"))
+CRYPTO_MESH_INVOKE_ACQUIRE_TIMEOUT = float(os.environ.get("CRYPTO_MESH_INVOKE_ACQUIRE_TIMEOUT", "0.1"))
+CRYPTO_MESH_INVOKE_POOL_SIZE = int(os.environ.get("CRYPTO_MESH_INVOKE_POOL_SIZE", "16"))
+CRYPTO_MESH_INVOKE_POOL_IDLE_TIMEOUT = float(os.environ.get("CRYPTO_MESH_INVOKE_POOL_IDLE_TIMEOUT", "60"))
+CRYPTO_MESH_INVOKE_MAX_FRAME_BYTES = int(os.environ.get("CRYPTO_MESH_INVOKE_MAX_FRAME_BYTES", str(64 * 1024 * 1024)))
+CRYPTO_MESH_INVOKE_ROUTE_TTL = float(os.environ.get("CRYPTO_MESH_INVOKE_ROUTE_TTL", "10"))
+CRYPTO_MESH_INVOKE_MAX_PENDING_RESULTS = int(os.environ.get("CRYPTO_MESH_INVOKE_MAX_PENDING_RESULTS", "1000"))
+
+# Memoized results of functions marked cacheable: "memory" (per process) or "mongo" (shared, TTL index)
+CRYPTO_MESH_RESULT_CACHE_BACKEND = os.environ.get("CRYPTO_MESH_RESULT_CACHE_BACKEND", "memory").lower()
+CRYPTO_MESH_RESULT_CACHE_TTL = float(os.environ.get("CRYPTO_MESH_RESULT_CACHE_TTL", "300"))
+CRYPTO_MESH_RESULT_CACHE_MAX_SIZE = int(os.environ.get("CRYPTO_MESH_RESULT_CACHE_MAX_SIZE", "10000"))
+# Results whose JSON encoding is larger than this are not cached
+CRYPTO_MESH_RESULT_CACHE_MAX_ENTRY_BYTES = int(os.environ.get("CRYPTO_MESH_RESULT_CACHE_MAX_ENTRY_BYTES", str(1024 * 1024)))
+
+# Background blob reclamation
+CRYPTO_MESH_RECLAIM_BATCH_SIZE = int(os.environ.get("CRYPTO_MESH_RECLAIM_BATCH_SIZE", "32"))
+CRYPTO_MESH_RECLAIM_CONCURRENCY = int(os.environ.get("CRYPTO_MESH_RECLAIM_CONCURRENCY", "8"))
+CRYPTO_MESH_RECLAIM_MAX_ATTEMPTS = int(os.environ.get("CRYPTO_MESH_RECLAIM_MAX_ATTEMPTS", "5"))
+CRYPTO_MESH_RECLAIM_BACKOFF = float(os.environ.get("CRYPTO_MESH_RECLAIM_BACKOFF", "1"))
+CRYPTO_MESH_RECLAIM_QUEUE_SIZE = int(os.environ.get("CRYPTO_MESH_RECLAIM_QUEUE_SIZE", "10000"))
+
+# Admission control: concurrent requests per route class ("class:limit,..."), queued requests beyond that
+# are shed with 429/503 + Retry-After once their queue delay stays above TARGET_DELAY for INTERVAL seconds
+CRYPTO_MESH_ADMISSION_ENABLED = bool(int(os.environ.get("CRYPTO_MESH_ADMISSION_ENABLED", "1")))
+CRYPTO_MESH_ADMISSION_LIMITS = os.environ.get("CRYPTO_MESH_ADMISSION_LIMITS", "deploy:16,invoke:256,crud:128,telemetry:64")
+CRYPTO_MESH_ADMISSION_TOTAL = int(os.environ.get("CRYPTO_MESH_ADMISSION_TOTAL", "384"))
+CRYPTO_MESH_ADMISSION_MAX_QUEUE = int(os.environ.get("CRYPTO_MESH_ADMISSION_MAX_QUEUE", "512"))
+CRYPTO_MESH_ADMISSION_TARGET_DELAY = float(os.environ.get("CRYPTO_MESH_ADMISSION_TARGET_DELAY", "0.05"))
+CRYPTO_MESH_ADMISSION_INTERVAL = float(os.environ.get("CRYPTO_MESH_ADMISSION_INTERVAL", "0.5"))
+
+# Active object dependency deployment: nodes of one topological layer deployed at the same time
+CRYPTO_MESH_DEPLOY_CONCURRENCY = int(os.environ.get("CRYPTO_MESH_DEPLOY_CONCURRENCY", "8"))
+
+# Gossip topology computed at deploy time: AXO_GOSSIP_SEEDS gets up to FANOUT live peers of the same network.
+# A peer is healthy if its latest endpoint state is warm/warming and newer than HEARTBEAT_TTL seconds;
+# peers that never reported a state are only used to fill the remaining slots.
+CRYPTO_MESH_GOSSIP_FANOUT = int(os.environ.get("CRYPTO_MESH_GOSSIP_FANOUT", "3"))
+CRYPTO_MESH_TOPOLOGY_HEARTBEAT_TTL = float(os.environ.get("CRYPTO_MESH_TOPOLOGY_HEARTBEAT_TTL", "60"))
+CRYPTO_MESH_TOPOLOGY_REFRESH = float(os.environ.get("CRYPTO_MESH_TOPOLOGY_REFRESH", "5"))
+
+# Placement of active objects onto endpoints: score = DATA_WEIGHT * data affinity - LOAD_WEIGHT * (hosted objects per CPU)
+CRYPTO_MESH_PLACEMENT_DATA_WEIGHT = float(os.environ.get("CRYPTO_MESH_PLACEMENT_DATA_WEIGHT", "1.0"))
+CRYPTO_MESH_PLACEMENT_LOAD_WEIGHT = float(os.environ.get("CRYPTO_MESH_PLACEMENT_LOAD_WEIGHT", "0.25"))
+
+# Production launcher (python -m cryptomesh.launcher): worker processes (0 = one per CPU) and uvicorn tuning.
+# Admission and invocation limits above apply per worker. Caches of the other workers
+# follow a write within CRYPTO_MESH_VERSION_POLL_INTERVAL, so a single worker is the default.
+CRYPTO_MESH_WORKERS = int(os.environ.get("CRYPTO_MESH_WORKERS", "1"))
+CRYPTO_MESH_BACKLOG = int(os.environ.get("CRYPTO_MESH_BACKLOG", "2048"))
+CRYPTO_MESH_KEEP_ALIVE = int(os.environ.get("CRYPTO_MESH_KEEP_ALIVE", "5"))
+# Connections per worker before uvicorn answers 503 (0 = unlimited)
+CRYPTO_MESH_LIMIT_CONCURRENCY = int(os.environ.get("CRYPTO_MESH_LIMIT_CONCURRENCY", "0"))
+CRYPTO_MESH_GRACEFUL_SHUTDOWN = int(os.environ.get("CRYPTO_MESH_GRACEFUL_SHUTDOWN", "30"))
+CRYPTO_MESH_ACCESS_LOG = bool(int(os.environ.get("CRYPTO_MESH_ACCESS_LOG", "1")))
+
+# Health probes: /readyz serves the result of dependency checks run every HEALTH_INTERVAL seconds
+# (each bounded by HEALTH_TIMEOUT). READY_REQUIRED lists the checks (mongo, summoner, mictlanx) that must pass.
+CRYPTO_MESH_HEALTH_INTERVAL = float(os.environ.get("CRYPTO_MESH_HEALTH_INTERVAL", "5"))
+CRYPTO_MESH_HEALTH_TIMEOUT = float(os.environ.get("CRYPTO_MESH_HEALTH_TIMEOUT", "2"))
+CRYPTO_MESH_READY_REQUIRED = os.environ.get("CRYPTO_MESH_READY_REQUIRED", "mongo")
@@ -10,3 +10,7 @@ from cryptomesh.controllers.function_result_controller import router as function
 from cryptomesh.controllers.activeobjects_controller import router as activeobjects_router
 from cryptomesh.controllers.hierarchy_controller import router as hierarchy_router
 from cryptomesh.controllers.cryptomesh_controller import router as cryptomesh_router    
+from cryptomesh.controllers.policies_controller import router as policies_router
+from cryptomesh.controllers.auth_controller import router as auth_router
+from cryptomesh.controllers.blobs_controller import router as blobs_router
+from cryptomesh.controllers.health_controller import router as health_router
@@ -1,48 +1,36 @@
-from typing import List
+from typing import List, Optional
 import time as T
-import os
+import json
 # from uuid import uuid4
 # 
-from fastapi import APIRouter, Depends, HTTPException, status, Response
-from mictlanx import AsyncClient
-from axo.storage import AxoStorage
-from axo.storage.services import MictlanXStorageService
-# 
-from cryptomesh.services import ActiveObjectsService,StorageService
+from fastapi import APIRouter, Depends, HTTPException, status, Response, Request, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from cryptomesh.services import ActiveObjectsService,StorageService,DeploymentService,PlacementService
+from cryptomesh.services.placement_service import PlacementDecision
+from cryptomesh.repositories.microservices_repository import MicroservicesRepository
+from cryptomesh.controllers.endpoints_controller import get_endpoints_service
+from cryptomesh.repositories.endpoints_repository import EndpointsRepository
+from cryptomesh.storage.backends import get_axo_storage, get_blob_store
 from cryptomesh.repositories.activeobjects_repository import ActiveObjectsRepository
 from cryptomesh.db import get_collection
 from cryptomesh.log.logger import get_logger
 from cryptomesh.errors import handle_crypto_errors
-from cryptomesh.dtos import ActiveObjectCreateDTO, ActiveObjectResponseDTO, ActiveObjectUpdateDTO
+from cryptomesh.dtos import ActiveObjectCreateDTO, ActiveObjectResponseDTO, ActiveObjectUpdateDTO, ActiveObjectDeployDTO
 from cryptomesh.utils import Utils
+from cryptomesh.utils.etag import quote_etag, etag_matches, make_etag, not_modified
 # 
 
-MICTLANX_URI =os.environ.get("MICTLANX_URI", "mictlanx://mictlanx-router-0@localhost:60666?/api_version=4&protocol=http")
+FIELDS_DESCRIPTION = "Lista separada por comas de campos a devolver (sparse fieldset). Por defecto se omiten axo_code y axo_schema."
 
-def mictlanx_storage_service() -> MictlanXStorageService:
-    MICTLANX = AsyncClient(
-        uri              = MICTLANX_URI,
-        log_output_path  = os.environ.get("MICTLANX_LOG_PATH", "/log/cryptomesh-mictlanx.log"),
-        capacity_storage = "4GB",
-        client_id        = "cryptomesh",
-        debug            = True,
-        eviction_policy  = "LRU",
-    )
-    return MictlanXStorageService(
-        client=MICTLANX
+def storage_service() -> StorageService:
+    # Backend selected by CRYPTO_MESH_STORAGE_BACKEND (mictlanx | local); clients are shared per process.
+    return StorageService(
+        axo_storage = get_axo_storage(),
+        blob_store  = get_blob_store()
     )
 
 
-def storage_service(mictlanx_ss: MictlanXStorageService = Depends(mictlanx_storage_service)) -> AxoStorage:
-    s = AxoStorage(
-        storage = mictlanx_ss
-    )
-    ss = StorageService(
-        axo_storage= s
-    )
-    return ss
-
-
 
 
 
@@ -54,6 +42,21 @@ def get_activeobjects_service() -> ActiveObjectsService:
     repository = ActiveObjectsRepository(collection)
     return ActiveObjectsService(repository)
 
+def get_placement_service() -> PlacementService:
+    return PlacementService(
+        activeobjects = get_activeobjects_service(),
+        microservices = MicroservicesRepository(get_collection("microservices")),
+    )
+
+def get_deployment_service() -> DeploymentService:
+    endpoints_service = get_endpoints_service()
+    return DeploymentService(
+        activeobjects   = ActiveObjectsRepository(get_collection("active_objects")),
+        endpoints       = EndpointsRepository(get_collection("endpoints")),
+        deploy_endpoint = lambda endpoint_id, dependencies: endpoints_service.deploy(endpoint_id=endpoint_id, dependencies=dependencies),
+        placement       = get_placement_service(),
+    )
+
 
 @router.post(
     "/active-objects/",
@@ -84,6 +87,61 @@ async def create_active_object(
     return ActiveObjectResponseDTO.from_model(created)
 
 
+@router.post(
+    "/active-objects/deploy",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    summary="Desplegar ActiveObjects con sus dependencias",
+    description=(
+        "Construye el DAG de axo_dependencies entre ActiveObjects y sus endpoints (incluyendo "
+        "AXO_ENDPOINT_DEPENDENCIES), asigna endpoint a los ActiveObjects que no lo tienen, rechaza "
+        "ciclos (422) y despliega cada capa topológica en paralelo. "
+        "El progreso se transmite como NDJSON (un evento JSON por línea)."
+    )
+)
+@handle_crypto_errors
+async def deploy_active_objects(
+    dto: ActiveObjectDeployDTO,
+    svc: DeploymentService = Depends(get_deployment_service)
+):
+    t1   = T.time()
+    plan = await svc.plan(dto.active_object_ids)
+    L.info({
+        "event": "API.ACTIVE_OBJECT.DEPLOY.PLANNED",
+        "roots": plan.roots,
+        "layers": len(plan.layers),
+        "nodes": len(plan.nodes),
+        "time": round(T.time() - t1, 4)
+    })
+
+    async def events():
+        async for event in svc.execute(plan):
+            yield json.dumps(jsonable_encoder(event)) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/active-objects/{active_object_id}/placement",
+    response_model=PlacementDecision,
+    status_code=status.HTTP_200_OK,
+    summary="Asignar endpoint a un ActiveObject",
+    description=(
+        "Elige el endpoint donde se ejecuta el ActiveObject según la localidad de sus buckets (objetos que ya "
+        "usan los mismos buckets, MICTLANX_BUCKET_ID o routers de MictlanX compartidos), la carga actual y si "
+        "sus recursos alcanzan para el microservicio, y lo registra en axo_endpoint_id. Con force=true "
+        "recalcula la ubicación aunque ya tenga endpoint."
+    )
+)
+@handle_crypto_errors
+async def place_active_object(
+    active_object_id: str,
+    force: bool = Query(default=False),
+    svc: PlacementService = Depends(get_placement_service)
+):
+    return await svc.place(active_object_id, force=force)
+
+
 @router.get(
     "/active-objects/",
     response_model=List[ActiveObjectResponseDTO],
@@ -93,8 +151,29 @@ async def create_active_object(
     description="Recupera todos los ActiveObjects almacenados en la base de datos."
 )
 @handle_crypto_errors
-async def list_active_objects(svc: ActiveObjectsService = Depends(get_activeobjects_service)):
+async def list_active_objects(
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(default=None, description=FIELDS_DESCRIPTION),
+    svc: ActiveObjectsService = Depends(get_activeobjects_service)
+):
     t1 = T.time()
+    selected = ActiveObjectsService.parse_fields(fields)
+    etag     = make_etag("active_objects", await svc.collection_version(), ",".join(selected or []))
+    cached   = not_modified(request, etag)
+    if cached:
+        return cached
+
+    if selected:
+        docs = await svc.list_active_objects_fields(selected)
+        L.debug({
+            "event": "API.ACTIVE_OBJECT.LISTED",
+            "count": len(docs),
+            "fields": selected,
+            "time": round(T.time() - t1, 4)
+        })
+        return JSONResponse(content=jsonable_encoder(docs), headers={"ETag": etag})
+
     active_objects = await svc.list_active_objects()
     elapsed = round(T.time() - t1, 4)
     L.debug({
@@ -102,6 +181,7 @@ async def list_active_objects(svc: ActiveObjectsService = Depends(get_activeobje
         "count": len(active_objects),
         "time": elapsed
     })
+    response.headers["ETag"] = etag
     return [ActiveObjectResponseDTO.from_model(ao) for ao in active_objects]
 
 
@@ -114,15 +194,38 @@ async def list_active_objects(svc: ActiveObjectsService = Depends(get_activeobje
     description="Devuelve un ActiveObject específico dado su ID único."
 )
 @handle_crypto_errors
-async def get_active_object(active_object_id: str, svc: ActiveObjectsService = Depends(get_activeobjects_service)):
+async def get_active_object(
+    active_object_id: str,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(default=None, description=FIELDS_DESCRIPTION),
+    svc: ActiveObjectsService = Depends(get_activeobjects_service)
+):
     t1 = T.time()
-    ao = await svc.get_active_object(active_object_id)
+    selected = ActiveObjectsService.parse_fields(fields)
+    etag     = make_etag("active_objects", await svc.collection_version(), active_object_id, ",".join(selected or []))
+    cached   = not_modified(request, etag)
+    if cached:
+        return cached
+
+    if selected:
+        doc = await svc.get_active_object_fields(active_object_id, selected)
+        L.info({
+            "event": "API.ACTIVE_OBJECT.FETCHED",
+            "active_object_id": active_object_id,
+            "fields": selected,
+            "time": round(T.time() - t1, 4)
+        })
+        return JSONResponse(content=jsonable_encoder(doc), headers={"ETag": etag})
+
+    ao = await svc.get_active_object(active_object_id, include_heavy=False)
     elapsed = round(T.time() - t1, 4)
     L.info({
         "event": "API.ACTIVE_OBJECT.FETCHED",
         "active_object_id": active_object_id,
         "time": elapsed
     })
+    response.headers["ETag"] = etag
     return ActiveObjectResponseDTO.from_model(ao)
 
 
@@ -168,6 +271,51 @@ async def delete_active_object(active_object_id: str, svc: ActiveObjectsService
     })
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
+@router.get(
+    "/active-objects/{active_object_id}/code",
+    status_code=status.HTTP_200_OK,
+    summary="Obtener el código fuente de un ActiveObject",
+    description="Devuelve el código fuente (axo_code) de un ActiveObject. Soporta ETag / If-None-Match.",
+    responses={304: {"description": "El código no ha cambiado"}}
+)
+@handle_crypto_errors
+async def get_active_object_code(
+    active_object_id: str,
+    request: Request,
+    svc: ActiveObjectsService = Depends(get_activeobjects_service)
+):
+    t1            = T.time()
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Only the hash is read here, so a revalidation never transfers the code.
+        code_hash = await svc.get_code_hash(active_object_id)
+        if code_hash and etag_matches(if_none_match, quote_etag(code_hash)):
+            L.debug({
+                "event": "API.ACTIVE_OBJECT.CODE.NOT_MODIFIED",
+                "active_object_id": active_object_id,
+                "time": round(T.time() - t1, 4)
+            })
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": quote_etag(code_hash)})
+
+    code, code_hash = await svc.get_code(active_object_id)
+    etag            = quote_etag(code_hash)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    # axo_code is a field of the stored document: it is already in memory, so it is sent in one body.
+    data = code.encode("utf-8")
+    L.info({
+        "event": "API.ACTIVE_OBJECT.CODE.FETCHED",
+        "active_object_id": active_object_id,
+        "size": len(data),
+        "time": round(T.time() - t1, 4)
+    })
+    return Response(
+        content    = data,
+        media_type = "text/x-python; charset=utf-8",
+        headers    = {"ETag": etag}
+    )
+
 @router.get("/active-objects/{active_object_id}/schema")
 async def get_oa_schema(active_object_id: str,  svc: ActiveObjectsService = Depends(get_activeobjects_service)):
     oa = await svc.get_active_object(active_object_id)
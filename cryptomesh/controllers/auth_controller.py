@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Response, status
+import time as T
+
+from cryptomesh.auth import dependencies as Auth
+from cryptomesh.dtos.auth_dto import TokenRevocationDTO
+from cryptomesh.errors import handle_crypto_errors
+from cryptomesh.log.logger import get_logger
+
+router = APIRouter()
+L = get_logger(__name__)
+
+
+@router.post(
+    "/auth/revoke",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Revocar tokens",
+    description=(
+        "Revoca un token, un identificador de token (jti) o todos los tokens de un sujeto. "
+        "Las credenciales verificadas en caché se descartan de inmediato y la revocación "
+        "se persiste para el resto de los workers."
+    )
+)
+@handle_crypto_errors
+async def revoke_tokens(dto: TokenRevocationDTO):
+    t1 = T.time()
+    if dto.token or dto.token_id:
+        await Auth.TOKEN_VERIFIER.revoke(token=dto.token, token_id=dto.token_id)
+    if dto.subject:
+        await Auth.TOKEN_VERIFIER.revoke_subject(dto.subject)
+    L.info({
+        "event": "API.AUTH.REVOKED",
+        "subject": dto.subject,
+        "token_id": dto.token_id,
+        "time": round(T.time() - t1, 4)
+    })
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
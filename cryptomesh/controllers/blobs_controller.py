@@ -0,0 +1,77 @@
+from typing import Optional
+import time as T
+
+from fastapi import APIRouter, Depends, Header, Request, status
+from fastapi.responses import StreamingResponse
+
+from cryptomesh.controllers.activeobjects_controller import storage_service
+from cryptomesh.dtos import BlobRefResponseDTO
+from cryptomesh.errors import handle_crypto_errors
+from cryptomesh.log.logger import get_logger
+from cryptomesh.services import StorageService
+
+router = APIRouter()
+L = get_logger(__name__)
+
+
+@router.put(
+    "/blobs/{bucket_id}/{key}",
+    response_model=BlobRefResponseDTO,
+    status_code=status.HTTP_201_CREATED,
+    summary="Subir un blob en streaming",
+    description=(
+        "Sube el cuerpo de la petición (p. ej. un bundle de modelo) al almacenamiento por partes, "
+        "sin cargarlo completo en memoria, y calcula su sha256 mientras se transmite. "
+        "Si se envía X-Content-SHA256 y no coincide, el blob se elimina y se responde 422. "
+        "La referencia devuelta se puede incluir en axo_artifacts al crear el ActiveObject."
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/octet-stream": {"schema": {"type": "string", "format": "binary"}}}
+        }
+    }
+)
+@handle_crypto_errors
+async def upload_blob(
+    bucket_id: str,
+    key: str,
+    request: Request,
+    x_content_sha256: Optional[str] = Header(default=None),
+    storage: StorageService = Depends(storage_service),
+):
+    t1 = T.time()
+    ref = await storage.put_stream(
+        bucket_id       = bucket_id,
+        key             = key,
+        chunks          = request.stream(),
+        expected_sha256 = x_content_sha256,
+        content_type    = request.headers.get("content-type"),
+    )
+    L.info({
+        "event": "API.BLOB.UPLOADED",
+        "bucket_id": bucket_id,
+        "key": key,
+        "size": ref.size,
+        "time": round(T.time() - t1, 4)
+    })
+    return BlobRefResponseDTO.from_model(ref)
+
+
+@router.get(
+    "/blobs/{bucket_id}/{key}",
+    response_class=StreamingResponse,
+    summary="Descargar un blob en streaming",
+    description=(
+        "Devuelve el contenido del blob por partes. Con el backend local los datos se leen "
+        "directamente de un mmap del archivo; los backends que no soportan lecturas responden 501."
+    ),
+    responses={200: {"content": {"application/octet-stream": {}}}}
+)
+@handle_crypto_errors
+async def download_blob(
+    bucket_id: str,
+    key: str,
+    storage: StorageService = Depends(storage_service),
+):
+    return StreamingResponse(storage.get_stream(bucket_id, key), media_type="application/octet-stream")
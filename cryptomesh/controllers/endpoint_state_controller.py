@@ -89,14 +89,21 @@ async def get_endpoint_state(state_id: str, svc: EndpointStateService = Depends(
     response_model=EndpointStateResponseDTO,
     status_code=status.HTTP_200_OK,
     summary="Actualizar estado de endpoint por ID",
-    description="Actualiza completamente un registro de estado de endpoint existente."
+    description=(
+        "Aplica una transición de estado de forma atómica (compare-and-set). La transición debe estar permitida "
+        "por la máquina de estados; si se envían expected_state/expected_version, solo se aplica cuando el "
+        "registro aún coincide. Responde 409 si la transición no es válida o el registro cambió concurrentemente."
+    )
 )
 @handle_crypto_errors
 async def update_endpoint_state(state_id: str, dto: EndpointStateUpdateDTO, svc: EndpointStateService = Depends(get_endpoint_state_service)):
     t1 = T.time()
-    existing = await svc.get_state(state_id)
-    updated_model = EndpointStateUpdateDTO.apply_updates(dto, existing)
-    updated = await svc.update_state(state_id, updated_model.model_dump(by_alias=True))
+    updated = await svc.update_state(
+        state_id,
+        dto.model_dump(exclude_unset=True, exclude={"expected_state", "expected_version"}),
+        expected_state=dto.expected_state,
+        expected_version=dto.expected_version
+    )
 
     elapsed = round(T.time() - t1, 4)
     L.info({
@@ -1,8 +1,7 @@
-import os
 from fastapi import APIRouter, Depends, HTTPException, status, Response
 from typing import List
-from cryptomesh.models import EndpointModel,SummonerParams
-from cryptomesh.services.endpoints_services import EndpointsService
+from cryptomesh.models import EndpointModel
+from cryptomesh.services.endpoints_services import EndpointsService, summoner_params_from_env
 from cryptomesh.repositories.endpoints_repository import EndpointsRepository
 from cryptomesh.repositories.security_policy_repository import SecurityPolicyRepository
 from cryptomesh.services.security_policy_service import SecurityPolicyService
@@ -22,13 +21,7 @@ def get_endpoints_service() -> EndpointsService:
     sp_collection = get_collection("security_policies")
     sp_repository = SecurityPolicyRepository(sp_collection)
     security_policy_service = SecurityPolicyService(sp_repository)
-    x = SummonerParams(
-        ip_addr     = os.environ.get("CRYPTOMESH_SUMMONER_IP_ADDR","localhost"),
-        api_version = int(os.environ.get("CRYPTOMESH_SUMMONER_API_VERSION","3")),
-        port        = int(os.environ.get("CRYPTOMESH_SUMMONER_PORT","15000")),
-        protocol    = os.environ.get("CRYPTOMESH_SUMMONER_PROTOCOL","http")
-    )
-    return EndpointsService(repository, security_policy_service, summoner_params=x)
+    return EndpointsService(repository, security_policy_service, summoner_params=summoner_params_from_env())
 
 @router.post(
     "/",
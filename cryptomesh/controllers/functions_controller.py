@@ -8,7 +8,10 @@ from cryptomesh.log.logger import get_logger
 from cryptomesh.errors import handle_crypto_errors
 
 import time as T
-from cryptomesh.dtos.functions_dto import FunctionCreateDTO, FunctionResponseDTO, FunctionUpdateDTO
+from cryptomesh.dtos.functions_dto import FunctionCreateDTO, FunctionResponseDTO, FunctionUpdateDTO, FunctionInvokeDTO, FunctionInvokeResponseDTO
+from cryptomesh.gateway import InvocationGateway, INVOCATION_GATEWAY
+from cryptomesh.repositories.base_repository import READ_FLIGHTS
+from cryptomesh.services.activeobjects_service import SCHEMA_FLIGHTS
 
 router = APIRouter()
 L = get_logger(__name__)
@@ -18,6 +21,9 @@ def get_functions_service() -> FunctionsService:
     repository = FunctionsRepository(collection)
     return FunctionsService(repository)
 
+def get_invocation_gateway() -> InvocationGateway:
+    return INVOCATION_GATEWAY
+
 @router.post(
     "/functions/",
     response_model=FunctionResponseDTO,
@@ -60,6 +66,23 @@ async def list_functions(svc: FunctionsService = Depends(get_functions_service))
     })
     return [FunctionResponseDTO.from_model(f) for f in functions]
 
+@router.get(
+    "/functions/invoke/stats",
+    status_code=status.HTTP_200_OK,
+    summary="Estadísticas del gateway de invocación",
+    description=(
+        "Devuelve los contadores de este proceso: invocaciones, rechazos por saturación, aciertos de la caché "
+        "de resultados, estado del pool de conexiones y peticiones colapsadas (single-flight) en el gateway, "
+        "en las lecturas por ID de los repositorios y en la extracción de esquemas."
+    )
+)
+@handle_crypto_errors
+async def invoke_stats(gateway: InvocationGateway = Depends(get_invocation_gateway)):
+    return {
+        **gateway.stats(),
+        "single_flight": [READ_FLIGHTS.stats(), SCHEMA_FLIGHTS.stats()],
+    }
+
 @router.get(
     "/functions/{function_id}/",
     response_model=FunctionResponseDTO,
@@ -122,3 +145,30 @@ async def delete_function(function_id: str, svc: FunctionsService = Depends(get_
         "time": elapsed
     })
     return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post(
+    "/functions/{function_id}/invoke",
+    response_model=FunctionInvokeResponseDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Invocar una función",
+    description=(
+        "Resuelve el ActiveObject y el endpoint que sirven la función y reenvía la invocación a su socket "
+        "req/res mediante un pool de conexiones persistentes. Responde 503 (con Retry-After) si hay demasiadas "
+        "invocaciones en curso y 504 si el endpoint no responde a tiempo. El resultado se registra en "
+        "function_results en segundo plano."
+    )
+)
+@handle_crypto_errors
+async def invoke_function(
+    function_id: str,
+    dto: FunctionInvokeDTO,
+    gateway: InvocationGateway = Depends(get_invocation_gateway)
+):
+    result = await gateway.invoke(
+        function_id = function_id,
+        call_params = dto.call_params,
+        init_params = dto.init_params,
+        timeout     = dto.timeout
+    )
+    return FunctionInvokeResponseDTO.from_result(result)
@@ -0,0 +1,35 @@
+import os
+import time as T
+
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+from cryptomesh.health import HEALTH_MONITOR
+
+router = APIRouter()
+
+
+@router.get(
+    "/healthz",
+    status_code = status.HTTP_200_OK,
+    summary     = "Liveness",
+    description = "Indica que el proceso está vivo y su event loop responde. No consulta dependencias."
+)
+async def healthz():
+    return {"status": "ok", "pid": os.getpid(), "uptime": round(T.time() - HEALTH_MONITOR.started_at, 4)}
+
+
+@router.get(
+    "/readyz",
+    status_code = status.HTTP_200_OK,
+    summary     = "Readiness",
+    description = (
+        "Devuelve el último resultado de las verificaciones de dependencias (MongoDB, Summoner, MictlanX), "
+        "ejecutadas en segundo plano. Responde 503 mientras el proceso inicia, se detiene o falla una "
+        "dependencia requerida (CRYPTO_MESH_READY_REQUIRED)."
+    )
+)
+async def readyz():
+    report = HEALTH_MONITOR.report()
+    code = status.HTTP_200_OK if HEALTH_MONITOR.ready else status.HTTP_503_SERVICE_UNAVAILABLE
+    return JSONResponse(status_code=code, content=report)
@@ -1,23 +1,13 @@
 # cryptomesh/controllers/hierarchy_controller.py
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from typing import List
+import time as T
 
-from cryptomesh.dtos.hierarchy_dto import (
-    ServiceHierarchyDTO,
-    MicroserviceHierarchyDTO,
-    ActiveObjectHierarchyDTO,
-    FunctionHierarchyDTO,
-    ParameterDTO,
-)
-from cryptomesh.services.services_services import ServicesService
-from cryptomesh.services.microservices_services import MicroservicesService
-from cryptomesh.services.activeobjects_service import ActiveObjectsService
-
-from cryptomesh.repositories.services_repository import ServicesRepository
-from cryptomesh.repositories.microservices_repository import MicroservicesRepository
-from cryptomesh.repositories.activeobjects_repository import ActiveObjectsRepository
-from cryptomesh.db import get_collection
+from cryptomesh.dtos.hierarchy_dto import ServiceHierarchyDTO
+from cryptomesh.services.hierarchy_service import HierarchySnapshot, HIERARCHY_SNAPSHOT
 from cryptomesh.log.logger import get_logger
+from cryptomesh.errors import handle_crypto_errors
+from cryptomesh.utils.etag import make_etag, not_modified
 
 L = get_logger(__name__)
 router = APIRouter()
@@ -25,96 +15,66 @@ router = APIRouter()
 # -------------------------------
 # Factories para inyección de dependencias
 # -------------------------------
-def get_services_service() -> ServicesService:
-    collection = get_collection("services")
-    repo = ServicesRepository(collection)
-    return ServicesService(repo)
+async def get_hierarchy_snapshot() -> HierarchySnapshot:
+    await HIERARCHY_SNAPSHOT.ensure_fresh()
+    return HIERARCHY_SNAPSHOT
 
-def get_microservices_service() -> MicroservicesService:
-    collection = get_collection("microservices")
-    repo = MicroservicesRepository(collection)
-    return MicroservicesService(repo)
 
-def get_active_objects_service() -> ActiveObjectsService:
-    collection = get_collection("active_objects")
-    repo = ActiveObjectsRepository(collection)
-    return ActiveObjectsService(repo)
+def _json(body: bytes, etag: str) -> Response:
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 # -------------------------------
 # Endpoint de jerarquía
 # -------------------------------
-@router.get("/hierarchy", response_model=List[ServiceHierarchyDTO])
+@router.get(
+    "/hierarchy",
+    response_model=List[ServiceHierarchyDTO],
+    summary="Obtener la jerarquía completa",
+    responses={304: {"description": "La jerarquía no ha cambiado (If-None-Match)"}}
+)
+@handle_crypto_errors
 async def get_hierarchy(
-    services_service: ServicesService = Depends(get_services_service),
-    microservices_service: MicroservicesService = Depends(get_microservices_service),
-    active_objects_service: ActiveObjectsService = Depends(get_active_objects_service),
+    request: Request,
+    snapshot: HierarchySnapshot = Depends(get_hierarchy_snapshot),
 ):
     """
     Devuelve la jerarquía completa:
     Service -> Microservice -> ActiveObject -> Functions -> Params
-    """
-    hierarchy: List[ServiceHierarchyDTO] = []
-
-    services = await services_service.list_services()
-
-    for svc in services:
-        svc_microservices = await microservices_service.list_by_service(svc.service_id)
-        microservices_dto: List[MicroserviceHierarchyDTO] = []
-
-        for ms in svc_microservices:
-            ms_active_objects = await active_objects_service.list_by_microservice(ms.microservice_id)
-            active_objects_dto: List[ActiveObjectHierarchyDTO] = []
-
-            for ao in ms_active_objects:
-                functions_dto: List[FunctionHierarchyDTO] = []
-
-                for f in ao.functions:
-                    # Convertimos init y call params en DTOs
-                    init_params = [
-                        ParameterDTO(**p.model_dump()) if hasattr(p, "model_dump") else ParameterDTO(**p)
-                        for p in f.init_params
-                    ]
-                    call_params = [
-                        ParameterDTO(**p.model_dump()) if hasattr(p, "model_dump") else ParameterDTO(**p)
-                        for p in f.call_params
-                    ]
-
-                    functions_dto.append(
-                        FunctionHierarchyDTO(
-                            function_id=f.function_id,
-                            name=f.name,
-                            init_params=init_params,
-                            call_params=call_params,
-                        )
-                    )
 
-
-                active_objects_dto.append(
-                    ActiveObjectHierarchyDTO(
-                        active_object_id=ao.active_object_id,
-                        object_name=ao.axo_class_name,
-                        alias=ao.axo_alias,
-                        version=ao.axo_version,
-                        functions=functions_dto,
-                    )
-                )
-
-            microservices_dto.append(
-                MicroserviceHierarchyDTO(
-                    microservice_id=ms.microservice_id,
-                    microservice_name=ms.name,
-                    active_objects=active_objects_dto,
-                )
-            )
-
-        hierarchy.append(
-            ServiceHierarchyDTO(
-                service_id=svc.service_id,
-                service_name=svc.name,
-                microservices=microservices_dto,
-            )
-        )
-
-    L.info({"event": "API.HIERARCHY.FETCHED", "services": len(services)})
-    return hierarchy
+    Se sirve desde una instantánea en memoria que se actualiza con cada escritura;
+    el ETag es el hash del contenido.
+    """
+    t1 = T.time()
+    body, digest = snapshot.render()
+    etag = make_etag("hierarchy", digest)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    L.debug({"event": "API.HIERARCHY.FETCHED", "bytes": len(body), "time": round(T.time() - t1, 4)})
+    return _json(body, etag)
+
+
+@router.get(
+    "/hierarchy/{service_id}",
+    response_model=ServiceHierarchyDTO,
+    summary="Obtener la jerarquía de un service",
+    responses={304: {"description": "El subárbol no ha cambiado (If-None-Match)"}}
+)
+@handle_crypto_errors
+async def get_service_hierarchy(
+    service_id: str,
+    request: Request,
+    snapshot: HierarchySnapshot = Depends(get_hierarchy_snapshot),
+):
+    """
+    Devuelve el subárbol Service -> Microservice -> ActiveObject -> Functions de un solo service.
+    """
+    t1 = T.time()
+    body, digest = snapshot.render_service(service_id)
+    etag = make_etag("hierarchy", service_id, digest)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    L.debug({"event": "API.HIERARCHY.SERVICE.FETCHED", "service_id": service_id, "time": round(T.time() - t1, 4)})
+    return _json(body, etag)
@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Depends, Request, status
+import time as T
+import yaml
+
+from cryptomesh.db import get_database
+from cryptomesh.errors import handle_crypto_errors, InvalidYAML
+from cryptomesh.log.logger import get_logger
+from cryptomesh.policies import CMPolicyManager
+from cryptomesh.policies.importer import PolicyImporter
+
+router = APIRouter()
+L = get_logger(__name__)
+
+
+def get_policy_importer() -> PolicyImporter:
+    return PolicyImporter(get_database())
+
+
+@router.post(
+    "/policies/import",
+    status_code=status.HTTP_201_CREATED,
+    summary="Importar un archivo de políticas YAML",
+    description=(
+        "Recibe el contenido de un archivo de políticas YAML en el cuerpo de la petición "
+        "(Content-Type: application/yaml), lo valida con CMPolicyManager y escribe todas las "
+        "entidades con operaciones bulk dentro de una transacción (si el despliegue de Mongo la soporta)."
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/yaml": {"schema": {"type": "string"}}}
+        }
+    }
+)
+@handle_crypto_errors
+async def import_policy(request: Request, importer: PolicyImporter = Depends(get_policy_importer)):
+    t1 = T.time()
+    content = await request.body()
+    if not content.strip():
+        raise InvalidYAML("empty policy document")
+    try:
+        models = CMPolicyManager.from_content(content).as_models()
+    except (yaml.YAMLError, ValueError, TypeError) as e:
+        # pydantic's ValidationError is a ValueError as well.
+        raise InvalidYAML(str(e))
+
+    report = await importer.import_models(models)
+    L.info({
+        "event": "API.POLICY.IMPORTED",
+        "entities": report["entities"],
+        "time": round(T.time() - t1, 4)
+    })
+    return report
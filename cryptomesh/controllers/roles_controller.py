@@ -124,5 +124,12 @@ async def delete_role(role_id: str, svc: RolesService = Depends(get_roles_servic
     })
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
-
-
+@router.get(
+    "/roles/cache/stats",
+    status_code=status.HTTP_200_OK,
+    summary="Estadísticas de la caché de roles",
+    description="Devuelve los contadores de aciertos/fallos de la caché en memoria de este proceso."
+)
+@handle_crypto_errors
+async def role_cache_stats(svc: RolesService = Depends(get_roles_service)):
+    return svc.cache_stats()
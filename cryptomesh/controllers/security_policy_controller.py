@@ -120,4 +120,12 @@ async def delete_policy(sp_id: str, svc: SecurityPolicyService = Depends(get_sec
     })
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
-
+@router.get(
+    "/security-policies/cache/stats",
+    status_code=status.HTTP_200_OK,
+    summary="Estadísticas de la caché de políticas de seguridad",
+    description="Devuelve los contadores de aciertos/fallos de la caché en memoria de este proceso."
+)
+@handle_crypto_errors
+async def security_policy_cache_stats(svc: SecurityPolicyService = Depends(get_security_policy_service)):
+    return svc.cache_stats()
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, status, Response, HTTPException
+from fastapi import APIRouter, Depends, status, Response, HTTPException, Request
 from typing import List
 import time as T
 
@@ -9,6 +9,7 @@ from cryptomesh.services.security_policy_service import SecurityPolicyService
 from cryptomesh.db import get_collection
 from cryptomesh.log.logger import get_logger
 from cryptomesh.errors import handle_crypto_errors
+from cryptomesh.utils.etag import make_etag, not_modified
 from cryptomesh.dtos.services_dto import ServiceCreateDTO, ServiceResponseDTO, ServiceUpdateDTO
 
 
@@ -51,11 +52,17 @@ async def create_service(dto:ServiceCreateDTO, svc: ServicesService = Depends(ge
     response_model_by_alias=True,
     status_code=status.HTTP_200_OK,
     summary="Obtener todos los services",
-    description="Recupera todos los services almacenados en la base de datos."
+    description="Recupera todos los services almacenados en la base de datos. Soporta ETag / If-None-Match.",
+    responses={304: {"description": "Sin cambios desde el ETag enviado"}}
 )
 @handle_crypto_errors
-async def list_services(svc: ServicesService = Depends(get_services_service)):
+async def list_services(request: Request, response: Response, svc: ServicesService = Depends(get_services_service)):
     t1 = T.time()
+    etag = make_etag("services", await svc.collection_version())
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
     services = await svc.list_services()
     elapsed = round(T.time() - t1, 4)
     L.debug({
@@ -63,7 +70,8 @@ async def list_services(svc: ServicesService = Depends(get_services_service)):
         "count": len(services),
         "time": elapsed
     })
-    return [ServiceResponseDTO.from_model(s) for s in services] 
+    response.headers["ETag"] = etag
+    return [ServiceResponseDTO.from_model(s) for s in services]
 
 @router.get(
     "/services/{service_id}/",
@@ -71,11 +79,17 @@ async def list_services(svc: ServicesService = Depends(get_services_service)):
     response_model_by_alias=True,
     status_code=status.HTTP_200_OK,
     summary="Obtener un service por ID",
-    description="Devuelve un service específico dado su ID único."
+    description="Devuelve un service específico dado su ID único. Soporta ETag / If-None-Match.",
+    responses={304: {"description": "Sin cambios desde el ETag enviado"}}
 )
 @handle_crypto_errors
-async def get_service(service_id: str, svc: ServicesService = Depends(get_services_service)):
+async def get_service(service_id: str, request: Request, response: Response, svc: ServicesService = Depends(get_services_service)):
     t1 = T.time()
+    etag = make_etag("services", await svc.collection_version(), service_id)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
     service = await svc.get_service(service_id)
 
     elapsed = round(T.time() - t1, 4)
@@ -84,6 +98,7 @@ async def get_service(service_id: str, svc: ServicesService = Depends(get_servic
         "service_id": service_id,
         "time": elapsed
     })
+    response.headers["ETag"] = etag
     return ServiceResponseDTO.from_model(service)
 
 @router.put(
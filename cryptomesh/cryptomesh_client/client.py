@@ -11,6 +11,7 @@ from cryptomesh.errors import (
     UnauthorizedError,
     FunctionNotFound,
 )
+import asyncio
 import httpx
 import json
 import time
@@ -18,22 +19,126 @@ from cryptomesh.dtos import *
 from typing import Optional, Dict, Any, List
 from cryptomesh.log.logger import get_logger
 from option import Ok,Err,Result
+from cryptomesh.cache import TTLCache
+from cryptomesh.utils.dag import topological_layers
+from cryptomesh.policies.plan import PolicyPlan, PlanAction, compute_plan, translate_references, node_key, ID_FIELDS
+
+POLICY_PATHS = {
+    "endpoints": "/api/v1/endpoints/",
+    "functions": "/api/v1/functions/",
+    "microservices": "/api/v1/microservices/",
+    "services": "/api/v1/services/",
+}
 
 L = get_logger("cryptomesh-client")
 
 class CryptoMeshClient:
-    def __init__(self, base_url: str, token: Optional[str] = None):
+    def __init__(self, base_url: str, token: Optional[str] = None, revalidate: bool = True, etag_cache_size: int = 1024):
         self.base_url = base_url.rstrip("/")
         self.headers = {"Content-Type": "application/json"}
         if token:
             self.headers["Authorization"] = f"Bearer {token}"
-
-    async def interpret(self, policy_file: str):
+        # path -> (etag, body). GETs send If-None-Match and reuse the body on 304.
+        self.revalidate = revalidate
+        self.etag_cache: TTLCache = TTLCache(name="client-etags", ttl=float("inf"), max_size=etag_cache_size)
+
+    async def interpret(self, policy_file: str, max_concurrency: int = 16) -> Dict[str, Any]:
+        """
+        Creates every entity of a policy file. Entities are grouped in dependency
+        layers (service <- microservice <- function, endpoint -> security policy)
+        and each layer is created concurrently, bounded by `max_concurrency`.
+        Entities whose dependencies failed are skipped. Returns a per-layer report.
+        """
         logger = get_logger(__name__)
         
         try:
             manager = CMPolicyManager(policy_file)
             models = manager.as_models()
+            graph = manager.dependency_graph()
+        except Exception as e:
+            logger.error({
+                "event": "POLICY.LOAD.FAIL",
+                "reason": str(e),
+                "policy_file": policy_file
+            }, exc_info=True)
+            raise InvalidYAML(f"Failed to load policy file: {str(e)}")
+
+        creators = {
+            "endpoints": ("endpoint", self.create_endpoint),
+            "functions": ("function", self.create_function),
+            "microservices": ("microservice", self.create_microservice),
+            "services": ("service", self.create_service),
+        }
+        nodes = [(kind, eid) for kind in creators for eid in models[kind]]
+        layers = topological_layers(nodes, graph)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        failed: set = set()
+        report: Dict[str, Any] = {"policy_file": policy_file, "layers": [], "created": 0, "failed": [], "skipped": []}
+
+        async def create(node):
+            kind, eid = node
+            entity_type, creator = creators[kind]
+            if graph.get(node, set()) & failed:
+                failed.add(node)
+                report["skipped"].append(f"{kind}/{eid}")
+                logger.warning({"event": f"{entity_type.upper()}.SKIPPED", "id": eid, "reason": "dependency failed"})
+                return
+            async with semaphore:
+                try:
+                    result = await creator(models[kind][eid])
+                    if result.is_err:
+                        raise result.unwrap_err()
+                    report["created"] += 1
+                    logger.info({"event": f"{entity_type.upper()}.CREATED", "id": eid})
+                except Exception as e:
+                    failed.add(node)
+                    report["failed"].append(f"{kind}/{eid}")
+                    logger.error(CreationError(entity_type, eid, e).to_dict())
+
+        t0 = time.time()
+        for index, layer in enumerate(layers):
+            t1 = time.time()
+            await asyncio.gather(*(create(node) for node in layer))
+            elapsed = round(time.time() - t1, 3)
+            report["layers"].append({"layer": index, "size": len(layer), "time": elapsed})
+            logger.info({
+                "event": "POLICY.LAYER.APPLIED",
+                "layer": index,
+                "size": len(layer),
+                "time": elapsed
+            })
+        report["time"] = round(time.time() - t0, 3)
+        logger.info({
+            "event": "POLICY.INTERPRETED",
+            "policy_file": policy_file,
+            "layers": len(layers),
+            "created": report["created"],
+            "failed": len(report["failed"]),
+            "time": report["time"]
+        })
+        return report
+
+    async def fetch_state(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetches every entity kind managed by policies in one concurrent round.
+        """
+        kinds = list(POLICY_PATHS)
+        results = await asyncio.gather(*(self._get(POLICY_PATHS[kind]) for kind in kinds))
+        state = {}
+        for kind, result in zip(kinds, results):
+            state[kind] = result.unwrap()
+        return state
+
+    async def plan(self, policy_file: str, prune: bool = True) -> PolicyPlan:
+        """
+        Computes the creates, updates and deletes needed to make the server match `policy_file`.
+        """
+        logger = get_logger(__name__)
+        try:
+            manager = CMPolicyManager(policy_file)
+            models = manager.as_models()
+            graph = manager.dependency_graph()
         except Exception as e:
             logger.error({
                 "event": "POLICY.LOAD.FAIL",
@@ -42,37 +147,81 @@ class CryptoMeshClient:
             }, exc_info=True)
             raise InvalidYAML(f"Failed to load policy file: {str(e)}")
 
-        # Crear endpoints
-        for eid, endpoint in models["endpoints"].items():
-            try:
-                await self.create_endpoint(endpoint)
-                logger.info({"event": "ENDPOINT.CREATED", "id": eid})
-            except Exception as e:
-                logger.error(CreationError("endpoint", eid, e).to_dict())
-
-        # Crear funciones
-        for fid, function in models["functions"].items():
-            try:
-                await self.create_function(function)
-                logger.info({"event": "FUNCTION.CREATED", "id": fid})
-            except Exception as e:
-                logger.error(CreationError("function", fid, e).to_dict())
-
-        # Crear microservicios
-        for msid, microservice in models["microservices"].items():
-            try:
-                await self.create_microservice(microservice)
-                logger.info({"event": "MICROSERVICE.CREATED", "id": msid})
-            except Exception as e:
-                logger.error(CreationError("microservice", msid, e).to_dict())
-
-        # Crear servicios
-        for sid, service in models["services"].items():
-            try:
-                await self.create_service(service)
-                logger.info({"event": "SERVICE.CREATED", "id": sid})
-            except Exception as e:
-                logger.error(CreationError("service", sid, e).to_dict())
+        t1 = time.time()
+        state = await self.fetch_state()
+        plan = compute_plan(policy_file, models, graph, state, prune=prune)
+        logger.info({
+            "event": "POLICY.PLANNED",
+            "policy_file": policy_file,
+            **plan.summary(),
+            "time": round(time.time() - t1, 3)
+        })
+        return plan
+
+    async def apply(self, policy_file: str, dry_run: bool = False, prune: bool = True, max_concurrency: int = 16) -> Dict[str, Any]:
+        """
+        Plan/apply mode of `interpret`: only the entities that differ from the
+        server are written. Creates and updates run by dependency layer with
+        bounded concurrency, deletes run afterwards. With `dry_run` the plan is
+        returned without writing anything.
+        """
+        logger = get_logger(__name__)
+        plan = await self.plan(policy_file, prune=prune)
+        report: Dict[str, Any] = {
+            "policy_file": policy_file,
+            "dry_run": dry_run,
+            "summary": plan.summary(),
+            "actions": [a.model_dump(exclude={"payload"}) for a in plan.actions],
+            "applied": 0,
+            "failed": [],
+        }
+        if dry_run or plan.is_empty:
+            return report
+
+        resolved = dict(plan.resolved)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(action: PlanAction):
+            async with semaphore:
+                path = POLICY_PATHS[action.kind]
+                payload = translate_references(action.kind, action.payload, resolved)
+                if action.action == "create":
+                    result = await self._post(path, payload)
+                elif action.action == "update":
+                    result = await self._put(f"{path}{action.server_id}/", payload)
+                else:
+                    result = await self._delete(f"{path}{action.server_id}/")
+                if result.is_err:
+                    report["failed"].append(f"{action.action}:{action.kind}/{action.key}")
+                    logger.error({
+                        "event": "POLICY.ACTION.FAIL",
+                        "action": action.action,
+                        "kind": action.kind,
+                        "key": action.key,
+                        "reason": str(result.unwrap_err())
+                    })
+                    return
+                if action.action == "create":
+                    resolved[node_key(action.kind, action.key)] = result.unwrap().get(ID_FIELDS[action.kind], action.key)
+                report["applied"] += 1
+
+        t1 = time.time()
+        writes = [a for a in plan.actions if a.action != "delete"]
+        for layer in sorted({a.layer for a in writes}):
+            await asyncio.gather(*(run(a) for a in writes if a.layer == layer))
+        # Delete layers follow DELETE_ORDER: a parent is only deleted once its dependents are gone.
+        deletes = [a for a in plan.actions if a.action == "delete"]
+        for layer in sorted({a.layer for a in deletes}):
+            await asyncio.gather(*(run(a) for a in deletes if a.layer == layer))
+        report["time"] = round(time.time() - t1, 3)
+        logger.info({
+            "event": "POLICY.APPLIED",
+            "policy_file": policy_file,
+            "applied": report["applied"],
+            "failed": len(report["failed"]),
+            "time": report["time"]
+        })
+        return report
 
     async def _handle_response(self, response: httpx.Response) -> Any:
         """Centralized response handler with custom error processing"""
@@ -122,7 +271,7 @@ class CryptoMeshClient:
 
     async def list_functions(self) -> List[FunctionResponseDTO]:
         data = await self._get("/api/v1/functions/")
-        return [FunctionResponseDTO.model_validate(item) for item in data]
+        return [FunctionResponseDTO.model_validate(item) for item in data.unwrap()]
 
     async def update_function(self, function_id: str, function: FunctionUpdateDTO) -> Result[FunctionResponseDTO, Exception]:
         payload = function.model_dump(by_alias=True, exclude_none=True)
@@ -154,7 +303,7 @@ class CryptoMeshClient:
 
     async def list_services(self) -> List[ServiceResponseDTO]:
         data = await self._get("/api/v1/services/")
-        return [ServiceResponseDTO(**item) for item in data]
+        return [ServiceResponseDTO(**item) for item in data.unwrap()]
 
     async def update_service(self, service_id: str, service: ServiceUpdateDTO) -> Result[ServiceResponseDTO, Exception]:
         payload = service.model_dump(by_alias=True, exclude_none=True)
@@ -186,7 +335,7 @@ class CryptoMeshClient:
 
     async def list_microservices(self) -> List[MicroserviceResponseDTO]:
         data = await self._get("/api/v1/microservices/")
-        return [MicroserviceResponseDTO.model_validate(item) for item in data]
+        return [MicroserviceResponseDTO.model_validate(item) for item in data.unwrap()]
 
     async def update_microservice(self, microservice_id: str, microservice: MicroserviceUpdateDTO) -> Result[MicroserviceResponseDTO, Exception]:
         payload = microservice.model_dump(by_alias=True, exclude_none=True)
@@ -219,7 +368,7 @@ class CryptoMeshClient:
 
     async def list_endpoints(self) -> List[EndpointResponseDTO]:
         data = await self._get("/api/v1/endpoints/")
-        return [EndpointResponseDTO.model_validate(item) for item in data]
+        return [EndpointResponseDTO.model_validate(item) for item in data.unwrap()]
 
     async def update_endpoint(self, endpoint_id: str, endpoint: EndpointUpdateDTO) -> Result[EndpointResponseDTO, Exception]:
         payload = endpoint.model_dump(by_alias=True, exclude_none=True)
@@ -251,7 +400,7 @@ class CryptoMeshClient:
 
     async def list_security_policies(self) -> List[SecurityPolicyResponseDTO]:
         data = await self._get("/api/v1/security-policies/")
-        return [SecurityPolicyResponseDTO.model_validate(item) for item in data]
+        return [SecurityPolicyResponseDTO.model_validate(item) for item in data.unwrap()]
 
     async def update_security_policy(self, sp_id: str, policy: SecurityPolicyUpdateDTO) -> Result[SecurityPolicyResponseDTO, Exception]:
         payload = policy.model_dump(by_alias=True, exclude_none=True)
@@ -284,7 +433,7 @@ class CryptoMeshClient:
 
     async def list_roles(self) -> List[RoleResponseDTO]:
         data = await self._get("/api/v1/roles/")
-        return [RoleResponseDTO.model_validate(item) for item in data]
+        return [RoleResponseDTO.model_validate(item) for item in data.unwrap()]
 
     async def update_role(self, role_id: str, role: RoleUpdateDTO) -> Result[RoleResponseDTO, Exception]:
         payload = role.model_dump(by_alias=True, exclude_none=True)
@@ -316,7 +465,7 @@ class CryptoMeshClient:
     
     async def list_function_states(self) -> List[FunctionStateResponseDTO]:
         data = await self._get("/api/v1/function-states/")
-        return [FunctionStateResponseDTO.model_validate(item) for item in data]
+        return [FunctionStateResponseDTO.model_validate(item) for item in data.unwrap()]
 
     async def update_function_state(self, state_id: str, state: FunctionStateUpdateDTO) -> Result[FunctionStateResponseDTO, Exception]:
         payload = state.model_dump(by_alias=True, exclude_none=True)
@@ -348,7 +497,7 @@ class CryptoMeshClient:
         
     async def list_function_results(self) -> List[FunctionResultResponseDTO]:
         data = await self._get("/api/v1/function-results/")
-        return [FunctionResultResponseDTO.model_validate(item) for item in data]
+        return [FunctionResultResponseDTO.model_validate(item) for item in data.unwrap()]
 
     async def update_function_result(self, result_id: str, result: FunctionResultUpdateDTO) -> Result[FunctionResultResponseDTO, Exception]:
         payload = result.model_dump(by_alias=True, exclude_none=True)
@@ -374,7 +523,7 @@ class CryptoMeshClient:
     
     async def list_endpoint_states(self) -> List[EndpointStateResponseDTO]:
         data = await self._get("/api/v1/endpoint-states/")
-        return [EndpointStateResponseDTO.model_validate(item) for item in data]
+        return [EndpointStateResponseDTO.model_validate(item) for item in data.unwrap()]
 
     async def get_endpoint_state(self, state_id: str) -> Result[EndpointStateResponseDTO, Exception]:
         data = await self._get(f"/api/v1/endpoint-states/{state_id}/")
@@ -401,6 +550,9 @@ class CryptoMeshClient:
         try:
             url = f"{self.base_url}{path}"
             full_headers = {**self.headers, **headers}
+            cached = self.etag_cache.get(path) if self.revalidate else None
+            if cached:
+                full_headers["If-None-Match"] = cached[0]
             t1 = time.time()
             async with httpx.AsyncClient(headers=full_headers, follow_redirects=True) as client:
                 response = await client.get(url)
@@ -412,7 +564,13 @@ class CryptoMeshClient:
                 "elapsed": round(time.time() - t1, 3)
             })
 
+            if response.status_code == 304 and cached:
+                return Ok(cached[1])
+
             data = await self._handle_response(response)
+            etag = response.headers.get("etag")
+            if self.revalidate and etag:
+                self.etag_cache.set(path, (etag, data))
             return Ok(data)
 
         except Exception as e:
@@ -8,10 +8,13 @@ async def main():
     client = CryptoMeshClient(base_url="http://localhost:19000", token="my-secret")
 
     try:
-        await client.interpret("policies/example.yml")
+        report = await client.interpret("policies/example.yml")
         logger.info({
             "event": "POLICY.INDEX.SUCCESS",
-            "status": "All entities indexed successfully"
+            "created": report["created"],
+            "failed": report["failed"],
+            "layers": report["layers"],
+            "time": report["time"]
         })
     except Exception as e:
         logger.error({
@@ -4,6 +4,8 @@ from typing import Optional
 
 MONGODB_URI = os.environ.get("MONGODB_URI","mongodb://localhost:27017/cryptomesh")
 MONGO_DATABASE_NAME      = os.environ.get("MONGO_DATABASE_NAME","cryptomesh")
+# Connections per process; every worker of the launcher opens its own pool.
+MONGO_MAX_POOL_SIZE      = int(os.environ.get("MONGO_MAX_POOL_SIZE","100"))
 # Initialize MongoClient
 client = None
 
@@ -24,7 +26,7 @@ def get_collection(name:str)->AsyncIOMotorCollection:
 async def connect_to_mongo(uri:Optional[str]= None):
     _uri = uri if uri else MONGODB_URI
     global client
-    client = AsyncIOMotorClient(_uri)
+    client = AsyncIOMotorClient(_uri, maxPoolSize=MONGO_MAX_POOL_SIZE)
 
 # Shutdown event to close the MongoClient when the application shuts down
 async def close_mongo_connection():
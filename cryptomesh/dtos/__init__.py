@@ -9,7 +9,7 @@ from cryptomesh.dtos.role_dto import RoleCreateDTO, RoleResponseDTO, RoleUpdateD
 from cryptomesh.dtos.services_dto import ServiceCreateDTO, ServiceResponseDTO, ServiceUpdateDTO
 from cryptomesh.dtos.storage_dto import StorageDTO, StorageUpdateDTO
 from cryptomesh.dtos.endpoint_state_dto import EndpointStateCreateDTO, EndpointStateResponseDTO, EndpointStateUpdateDTO
-from cryptomesh.dtos.activeobject_dto import ActiveObjectCreateDTO, ActiveObjectResponseDTO, ActiveObjectUpdateDTO
+from cryptomesh.dtos.activeobject_dto import ActiveObjectCreateDTO, ActiveObjectResponseDTO, ActiveObjectUpdateDTO, ActiveObjectDeployDTO
 
 from pydantic import BaseModel,Field
 from typing import List,Dict,Optional
@@ -26,3 +26,4 @@ class SchemaDTO(BaseModel):
     class_name: str
     init: List[ParameterSpecDTO]
     methods: Dict[str, List[ParameterSpecDTO]]
+from cryptomesh.dtos.blob_dto import BlobRefResponseDTO
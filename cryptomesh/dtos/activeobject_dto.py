@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Dict, List, Optional
 import uuid
-from cryptomesh.models import ActiveObjectModel, FunctionModel
+from cryptomesh.models import ActiveObjectModel, BlobRefModel, FunctionModel
 
 
 # -------------------------------
@@ -28,6 +28,7 @@ class ActiveObjectCreateDTO(BaseModel):
     source_path: Optional[str] = "/axo/source"
     sink_path: Optional[str] = "/axo/sink"
     axo_code: Optional[str] = None
+    axo_artifacts: Optional[List[BlobRefModel]] = []
 
     def to_model(self, active_object_id: Optional[str] = None) -> ActiveObjectModel:
         """
@@ -51,7 +52,8 @@ class ActiveObjectCreateDTO(BaseModel):
             path=self.path,
             source_path=self.source_path,
             sink_path=self.sink_path,
-            axo_code=self.axo_code
+            axo_code=self.axo_code,
+            axo_artifacts=self.axo_artifacts or []
         )
 
     @staticmethod
@@ -76,7 +78,8 @@ class ActiveObjectCreateDTO(BaseModel):
             path=model.path,
             source_path=model.source_path,
             sink_path=model.sink_path,
-            axo_code=model.axo_code
+            axo_code=model.axo_code,
+            axo_artifacts=model.axo_artifacts
         )
 
 
@@ -106,7 +109,9 @@ class ActiveObjectResponseDTO(BaseModel):
     source_path: str
     sink_path: str
     axo_code: Optional[str]
+    axo_code_hash: Optional[str] = None
     axo_schema: Optional[Dict[str, object]] = None
+    axo_artifacts: List[BlobRefModel] = []
     functions: List[FunctionModel] = []
 
     @staticmethod
@@ -130,7 +135,9 @@ class ActiveObjectResponseDTO(BaseModel):
             source_path=model.source_path,
             sink_path=model.sink_path,
             axo_code=model.axo_code,
+            axo_code_hash=model.axo_code_hash,
             axo_schema=model.axo_schema,
+            axo_artifacts=model.axo_artifacts,
             functions=[
                 f if isinstance(f, FunctionModel) else FunctionModel(**f)
                 for f in (model.functions or [])
@@ -194,3 +201,10 @@ class ActiveObjectUpdateDTO(BaseModel):
             sink_path=model.sink_path,
             axo_code=model.axo_code
         )
+
+
+class ActiveObjectDeployDTO(BaseModel):
+    """
+    ActiveObjects a desplegar (por id o alias) junto con sus dependencias.
+    """
+    active_object_ids: List[str] = Field(min_length=1)
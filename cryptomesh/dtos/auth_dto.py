@@ -0,0 +1,18 @@
+from pydantic import BaseModel, model_validator
+from typing import Optional
+
+
+class TokenRevocationDTO(BaseModel):
+    """
+    DTO para revocar credenciales: un token concreto, su identificador (jti)
+    o todos los tokens emitidos hasta ahora para un sujeto.
+    """
+    token: Optional[str] = None
+    token_id: Optional[str] = None
+    subject: Optional[str] = None
+
+    @model_validator(mode="after")
+    def at_least_one(self):
+        if not (self.token or self.token_id or self.subject):
+            raise ValueError("One of token, token_id or subject is required")
+        return self
@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+from typing import Optional
+from cryptomesh.models import BlobRefModel
+
+
+# -------------------------------
+# DTO para respuesta al cliente
+# -------------------------------
+class BlobRefResponseDTO(BaseModel):
+    """
+    Referencia a un blob almacenado; se incluye en axo_artifacts al crear el ActiveObject.
+    """
+    bucket_id: str
+    key: str
+    size: int
+    sha256: str
+    content_type: Optional[str] = None
+
+    @staticmethod
+    def from_model(model: BlobRefModel) -> "BlobRefResponseDTO":
+        return BlobRefResponseDTO(
+            bucket_id=model.bucket_id,
+            key=model.key,
+            size=model.size,
+            sha256=model.sha256,
+            content_type=model.content_type
+        )
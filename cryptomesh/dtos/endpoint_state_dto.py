@@ -55,6 +55,7 @@ class EndpointStateResponseDTO(BaseModel):
     state: str
     metadata: Dict[str, str]
     timestamp: datetime
+    version: int = 0
 
     @staticmethod
     def from_model(model: EndpointStateModel) -> "EndpointStateResponseDTO":
@@ -66,7 +67,8 @@ class EndpointStateResponseDTO(BaseModel):
             endpoint_id=model.endpoint_id,
             state=model.state,
             metadata=model.metadata,
-            timestamp=model.timestamp
+            timestamp=model.timestamp,
+            version=model.version
         )
 
 
@@ -80,6 +82,9 @@ class EndpointStateUpdateDTO(BaseModel):
     """
     state: Optional[str] = None
     metadata: Optional[Dict[str, str]] = None
+    # Optional preconditions: the update only applies if the stored state/version still match (else 409)
+    expected_state: Optional[str] = None
+    expected_version: Optional[int] = None
 
     @staticmethod
     def apply_updates(dto: "EndpointStateUpdateDTO", model: EndpointStateModel) -> EndpointStateModel:
@@ -87,7 +92,7 @@ class EndpointStateUpdateDTO(BaseModel):
         Aplica los cambios del DTO sobre un EndpointStateModel existente.
         Solo actualiza los campos que el cliente envió.
         """
-        update_data = dto.model_dump(exclude_unset=True)
+        update_data = dto.model_dump(exclude_unset=True, exclude={"expected_state", "expected_version"})
         for field, value in update_data.items():
             setattr(model, field, value)
         return model
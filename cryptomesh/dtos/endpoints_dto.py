@@ -64,6 +64,7 @@ class EndpointResponseDTO(BaseModel):
     image: str
     resources: ResourcesDTO
     security_policy: str
+    policy_id: Optional[str] = None
 
     @staticmethod
     def from_model(model: EndpointModel) -> "EndpointResponseDTO":
@@ -75,7 +76,8 @@ class EndpointResponseDTO(BaseModel):
             name=model.name,
             image=model.image,
             resources=ResourcesDTO.from_model(model.resources),
-            security_policy=model.security_policy
+            security_policy=model.security_policy,
+            policy_id=model.policy_id
         )
 
 
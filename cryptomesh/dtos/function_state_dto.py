@@ -48,6 +48,7 @@ class FunctionStateResponseDTO(BaseModel):
     state: str
     metadata: Dict[str, str]
     timestamp: datetime
+    version: int = 0
 
     @staticmethod
     def from_model(model: FunctionStateModel) -> "FunctionStateResponseDTO":
@@ -56,7 +57,8 @@ class FunctionStateResponseDTO(BaseModel):
             function_id=model.function_id,
             state=model.state,
             metadata=model.metadata,
-            timestamp=model.timestamp
+            timestamp=model.timestamp,
+            version=model.version
         )
 
 
@@ -70,10 +72,13 @@ class FunctionStateUpdateDTO(BaseModel):
     """
     state: Optional[str] = None
     metadata: Optional[Dict[str, str]] = None
+    # Optional preconditions: the update only applies if the stored state/version still match (else 409)
+    expected_state: Optional[str] = None
+    expected_version: Optional[int] = None
 
     @staticmethod
     def apply_updates(dto: "FunctionStateUpdateDTO", model: FunctionStateModel) -> FunctionStateModel:
-        update_data = dto.model_dump(exclude_unset=True)
+        update_data = dto.model_dump(exclude_unset=True, exclude={"expected_state", "expected_version"})
         for field, value in update_data.items():
             setattr(model, field, value)
         return model
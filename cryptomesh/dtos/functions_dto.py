@@ -1,11 +1,14 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 from cryptomesh.models import FunctionModel
 from cryptomesh.dtos.resources_dto import ResourcesDTO, ResourcesUpdateDTO
 from cryptomesh.dtos.storage_dto import StorageDTO, StorageUpdateDTO
 import uuid
 
+if TYPE_CHECKING:
+    from cryptomesh.gateway.invoker import InvocationResult
+
 # -------------------------------
 # DTO para creación de funciones
 # -------------------------------
@@ -63,6 +66,7 @@ class FunctionResponseDTO(BaseModel):
     storage: StorageDTO
     microservice_id: str
     endpoint_id: str
+    policy_id: Optional[str] = None
 
     @staticmethod
     def from_model(model: FunctionModel) -> "FunctionResponseDTO":
@@ -77,7 +81,8 @@ class FunctionResponseDTO(BaseModel):
             resources=ResourcesDTO.from_model(model.resources),
             storage=StorageDTO.from_model(model.storage),
             microservice_id = model.microservice_id,
-            endpoint_id = model.endpoint_id 
+            endpoint_id = model.endpoint_id,
+            policy_id = model.policy_id
         )
 
 
@@ -125,3 +130,39 @@ class FunctionUpdateDTO(BaseModel):
             microservice_id=model.microservice_id,
             deployment_status=model.deployment_status
         )
+
+
+# -------------------------------
+# DTOs para invocación de funciones
+# -------------------------------
+class FunctionInvokeDTO(BaseModel):
+    """
+    Argumentos de una invocación: kwargs de __init__ del ActiveObject y kwargs de la función.
+    """
+    call_params: Dict[str, Any] = Field(default_factory=dict)
+    init_params: Dict[str, Any] = Field(default_factory=dict)
+    timeout: Optional[float] = Field(default=None, gt=0)
+
+
+class FunctionInvokeResponseDTO(BaseModel):
+    function_id: str
+    active_object_id: str
+    endpoint_id: str
+    ok: bool
+    result: Any = None
+    error: Optional[str] = None
+    elapsed: float
+    cached: bool = False
+
+    @staticmethod
+    def from_result(result: "InvocationResult") -> "FunctionInvokeResponseDTO":
+        return FunctionInvokeResponseDTO(
+            function_id=result.route.function_id,
+            active_object_id=result.route.active_object_id,
+            endpoint_id=result.route.endpoint_id,
+            ok=result.ok,
+            result=result.result,
+            error=result.error,
+            elapsed=round(result.elapsed, 6),
+            cached=result.cached
+        )
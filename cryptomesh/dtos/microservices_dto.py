@@ -56,6 +56,7 @@ class MicroserviceResponseDTO(BaseModel):
     name: str
     service_id: str
     resources: ResourcesDTO
+    policy_id: Optional[str] = None
 
     @staticmethod
     def from_model(model: MicroserviceModel) -> "MicroserviceResponseDTO":
@@ -67,6 +68,7 @@ class MicroserviceResponseDTO(BaseModel):
             name = model.name,
             service_id=model.service_id,
             resources=ResourcesDTO.from_model(model.resources),
+            policy_id=model.policy_id,
         )
 
 
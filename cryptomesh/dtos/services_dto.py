@@ -56,6 +56,7 @@ class ServiceResponseDTO(BaseModel):
     name: str
     resources: ResourcesDTO
     security_policy: str
+    policy_id: Optional[str] = None
 
     @staticmethod
     def from_model(model: ServiceModel) -> "ServiceResponseDTO":
@@ -66,7 +67,8 @@ class ServiceResponseDTO(BaseModel):
             service_id=model.service_id,
             name=model.name,
             resources=ResourcesDTO.from_model(model.resources),
-            security_policy=model.security_policy
+            security_policy=model.security_policy,
+            policy_id=model.policy_id
         )
 
 
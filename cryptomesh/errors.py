@@ -53,17 +53,71 @@ class UnauthorizedError(CryptoMeshError):
         super().__init__(detail, code=401)
 
 
+class ForbiddenError(CryptoMeshError):
+    def __init__(self, detail: str = "Forbidden"):
+        super().__init__(detail, code=403)
+
+
 class NotFoundError(CryptoMeshError):
     def __init__(self, resource: str):
         super().__init__(f"Resource '{resource}' not found", code=404)
 
 
+class PayloadTooLargeError(CryptoMeshError):
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Payload exceeds the maximum allowed size of {max_bytes} bytes", code=413)
+
+
+class ServiceUnavailableError(CryptoMeshError):
+    def __init__(self, detail: str = "Service temporarily unavailable", retry_after: float = 1):
+        self.retry_after = retry_after
+        super().__init__(detail, code=503)
+
+    def to_http_exception(self):
+        return HTTPException(
+            status_code=self.code,
+            detail=self.to_dict(),
+            headers={"Retry-After": str(max(1, int(round(self.retry_after))))}
+        )
+
+
+class TooManyRequestsError(CryptoMeshError):
+    def __init__(self, detail: str = "Too many requests", retry_after: float = 1):
+        self.retry_after = retry_after
+        super().__init__(detail, code=429)
+
+    def to_http_exception(self):
+        return HTTPException(
+            status_code=self.code,
+            detail=self.to_dict(),
+            headers={"Retry-After": str(max(1, int(round(self.retry_after))))}
+        )
+
+
+class ConflictError(CryptoMeshError):
+    def __init__(self, detail: str):
+        super().__init__(detail, code=409)
+
+
+class InvalidTransitionError(ConflictError):
+    def __init__(self, machine: str, current: str, target: str):
+        self.current = current
+        self.target  = target
+        super().__init__(f"Invalid {machine} transition '{current}' -> '{target}'")
+
+
 class CreationError(CryptoMeshError):
     def __init__(self, entity_type: str, entity_id: str, original_exception: Exception):
         message = f"Error creating {entity_type} '{entity_id}': {str(original_exception)}"
         super().__init__(message=message, code=500)
 
 
+class DependencyCycleError(CryptoMeshError):
+    def __init__(self, nodes: list):
+        self.nodes = list(nodes)
+        super().__init__(f"Dependency cycle detected between: {', '.join(map(str, self.nodes))}", code=422)
+
+
 # Decorator
 def handle_crypto_errors(func: Callable) -> Callable:
     """
@@ -0,0 +1,2 @@
+from cryptomesh.gateway.pool import ConnectionPool, EndpointConnection
+from cryptomesh.gateway.invoker import InvocationGateway, InvocationResult, FunctionRoute, INVOCATION_GATEWAY
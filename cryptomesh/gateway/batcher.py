@@ -0,0 +1,86 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+from cryptomesh.log.logger import get_logger
+
+L = get_logger(__name__)
+
+
+class BatchedCall(NamedTuple):
+    call_params: Dict[str, Any]
+    init_params: Dict[str, Any]
+    future: asyncio.Future
+
+
+BatchSender = Callable[[List[BatchedCall]], Awaitable[List[Any]]]
+
+
+class MicroBatcher:
+    """
+    Accumulates calls to one function on one endpoint and sends them as a
+    single batch when `max_size` calls are waiting or `max_wait` seconds
+    have passed since the first of them, whichever comes first. `send`
+    receives the calls and returns one response per call, in order; each
+    caller gets its own response back (or the exception if the batch failed).
+    """
+
+    def __init__(self, send: BatchSender, max_size: int, max_wait: float):
+        self.send     = send
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self.pending: List[BatchedCall] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._sending: set = set()
+        self.batches = 0
+        self.calls   = 0
+
+    async def submit(self, call_params: Dict[str, Any], init_params: Dict[str, Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append(BatchedCall(call_params, init_params, future))
+        if len(self.pending) >= self.max_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self.flush)
+        return await future
+
+    def flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # Callers that already gave up are not sent.
+        batch = [call for call in self.pending if not call.future.done()]
+        self.pending = []
+        if not batch:
+            return
+        self.batches += 1
+        self.calls   += len(batch)
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: List[BatchedCall]):
+        try:
+            responses = await self.send(batch)
+        except Exception as e:
+            for call in batch:
+                if not call.future.done():
+                    call.future.set_exception(e)
+            return
+        for call, response in zip(batch, responses):
+            if not call.future.done():
+                call.future.set_result(response)
+
+    def close(self):
+        """
+        Sends whatever is pending right away; the batcher must not be used afterwards.
+        """
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self.pending),
+            "batches": self.batches,
+            "calls": self.calls,
+            "mean_batch_size": round(self.calls / self.batches, 2) if self.batches else 0.0,
+        }
@@ -0,0 +1,383 @@
+import asyncio
+import json
+import time as T
+import uuid
+from typing import Any, Dict, List, NamedTuple, Optional, Set
+
+from cryptomesh import config
+from cryptomesh.cache import TTLCache
+from cryptomesh.db import get_collection
+from cryptomesh.errors import CryptoMeshError, FunctionNotFound, ServiceUnavailableError
+from cryptomesh.gateway.batcher import BatchedCall, MicroBatcher
+from cryptomesh.gateway.pool import Address, ConnectionPool
+from cryptomesh.gateway.result_cache import ResultCache, build_result_cache, cache_key
+from cryptomesh.log.logger import get_logger
+from cryptomesh.models import FunctionResultModel
+from cryptomesh.repositories.activeobjects_repository import ActiveObjectsRepository, LEAN_PROJECTION
+from cryptomesh.repositories.endpoints_repository import EndpointsRepository
+from cryptomesh.repositories.function_result_repository import FunctionResultRepository
+from cryptomesh.repositories.functions_repository import FunctionsRepository
+from cryptomesh.repositories.versions_repository import CollectionVersionsRepository
+from cryptomesh.utils.singleflight import SingleFlight
+
+L = get_logger(__name__)
+
+# Collections whose writes can change where a function is served.
+ROUTE_COLLECTIONS = ("functions", "active_objects", "endpoints")
+
+
+class FunctionRoute(NamedTuple):
+    function_id: str
+    method: str
+    active_object_id: str
+    axo_bucket_id: str
+    axo_key: str
+    axo_class_name: str
+    endpoint_id: str
+    address: Address
+    version: str
+    cacheable: bool = False
+    cache_ttl: Optional[float] = None
+    batch_max_size: int = 1
+    batch_max_wait: float = 0.0
+
+
+class InvocationResult(NamedTuple):
+    route: FunctionRoute
+    ok: bool
+    result: Any
+    error: Optional[str]
+    elapsed: float
+    cached: bool = False
+
+
+def endpoint_address(endpoint) -> Address:
+    """
+    Req/res socket of a deployed endpoint: the container is reachable by its
+    endpoint_id on the mesh network unless NODE_IP_ADDR overrides it.
+    """
+    host = endpoint.envs.get("NODE_IP_ADDR") or endpoint.endpoint_id
+    return host, int(endpoint.envs.get("AXO_REQ_RES_PORT", "16667"))
+
+
+class InvocationGateway:
+    """
+    Routes POST /functions/{id}/invoke to the endpoint serving the function.
+
+    The route (function -> active object -> endpoint address) is cached and
+    dropped whenever one of those collections changes. At most
+    `max_in_flight` invocations are forwarded at a time; callers that cannot
+    get a slot within `acquire_timeout` are rejected with 503 instead of
+    queueing without bound. Results are written to function_results by
+    background tasks, so the response never waits for Mongo.
+
+    Successful results of functions marked `cacheable` are memoized under
+    (function_id, active object version, hash of the arguments): a new
+    version of the active object never reuses results of the previous one.
+    Concurrent identical calls to a cacheable function are also coalesced
+    into one request to the endpoint.
+
+    Functions with batch_max_size > 1 go through a MicroBatcher per route
+    (function, endpoint address, active object version): concurrent calls
+    are sent as one batch request and the endpoint answers with one response
+    per call. Batchers are flushed and dropped together with the routes.
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        max_in_flight: int,
+        acquire_timeout: float,
+        timeout: float,
+        route_ttl: float,
+        max_pending_results: int,
+        result_cache: Optional[ResultCache] = None,
+    ):
+        self.pool                = pool
+        self.result_cache        = result_cache or build_result_cache()
+        self.acquire_timeout     = acquire_timeout
+        self.timeout             = timeout
+        self.max_pending_results = max_pending_results
+        self.routes: TTLCache = TTLCache(name="invoke_routes", ttl=route_ttl, max_size=10000)
+        self.flights = SingleFlight("invocations")
+        self.batchers: Dict[FunctionRoute, MicroBatcher] = {}
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._recording: Set[asyncio.Task] = set()
+        self.invocations = 0
+        self.cache_hits  = 0
+        self.failures    = 0
+        self.rejected    = 0
+        self.unrecorded  = 0
+        self.uncached    = 0
+
+    # ----------------------------
+    # Routing
+    # ----------------------------
+    async def resolve(self, function_id: str) -> FunctionRoute:
+        route = self.routes.get(function_id)
+        if route is not None:
+            return route
+
+        active_objects = ActiveObjectsRepository(get_collection("active_objects"))
+        matches = await active_objects.get_by_filter({"functions.function_id": function_id}, LEAN_PROJECTION)
+        if not matches:
+            if await FunctionsRepository(get_collection("functions")).get_by_id(function_id) is None:
+                raise FunctionNotFound(function_id)
+            raise CryptoMeshError(f"Function '{function_id}' is not bound to any active object", code=409)
+        active_object = matches[0]
+        function = next(f for f in active_object.functions if f.function_id == function_id)
+        if not active_object.axo_endpoint_id:
+            raise CryptoMeshError(f"Active object '{active_object.active_object_id}' is not deployed on an endpoint", code=409)
+        endpoint = await EndpointsRepository(get_collection("endpoints")).get_by_id(active_object.axo_endpoint_id)
+        if endpoint is None:
+            raise CryptoMeshError(f"Endpoint '{active_object.axo_endpoint_id}' of active object '{active_object.active_object_id}' does not exist", code=409)
+
+        route = FunctionRoute(
+            function_id      = function_id,
+            method           = function.name,
+            active_object_id = active_object.active_object_id,
+            axo_bucket_id    = active_object.axo_bucket_id,
+            axo_key          = active_object.axo_key,
+            axo_class_name   = active_object.axo_class_name,
+            endpoint_id      = endpoint.endpoint_id,
+            address          = endpoint_address(endpoint),
+            version          = f"{active_object.axo_version}-{(active_object.axo_code_hash or '')[:16]}",
+            cacheable        = function.cacheable,
+            cache_ttl        = function.cache_ttl,
+            batch_max_size   = function.batch_max_size,
+            batch_max_wait   = function.batch_max_wait,
+        )
+        self.routes.set(function_id, route)
+        return route
+
+    def on_version_bump(self, name: str, token: str):
+        if name in ROUTE_COLLECTIONS:
+            self.routes.clear()
+            self.close_batchers()
+
+    # ----------------------------
+    # Invocation
+    # ----------------------------
+    async def invoke(
+        self,
+        function_id: str,
+        call_params: Dict[str, Any],
+        init_params: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> InvocationResult:
+        route = await self.resolve(function_id)
+        key = None
+        if route.cacheable:
+            key = cache_key(function_id, route.version, init_params, call_params)
+            try:
+                hit, value = await self.result_cache.get(key)
+            except Exception as e:
+                hit, value = False, None
+                L.error({"event": "FUNCTION.RESULT_CACHE.GET.FAIL", "function_id": function_id, "reason": str(e)})
+            if hit:
+                self.cache_hits += 1
+                return InvocationResult(route=route, ok=True, result=value, error=None, elapsed=0.0, cached=True)
+            # Deterministic: identical calls already on their way to the endpoint are joined.
+            return await self.flights.do(key, lambda: self._forward(route, call_params, init_params, timeout, key))
+        return await self._forward(route, call_params, init_params, timeout)
+
+    async def _forward(
+        self,
+        route: FunctionRoute,
+        call_params: Dict[str, Any],
+        init_params: Dict[str, Any],
+        timeout: Optional[float],
+        key: Optional[str] = None,
+    ) -> InvocationResult:
+        function_id = route.function_id
+        try:
+            if self._in_flight.locked():
+                await asyncio.wait_for(self._in_flight.acquire(), timeout=self.acquire_timeout)
+            else:
+                await self._in_flight.acquire()
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            L.warning({"event": "FUNCTION.INVOKE.REJECTED", "function_id": function_id, "endpoint_id": route.endpoint_id})
+            raise ServiceUnavailableError("Too many invocations in flight", retry_after=1)
+
+        t1 = T.time()
+        try:
+            self.invocations += 1
+            timeout = min(timeout or self.timeout, self.timeout)
+            try:
+                if route.batch_max_size > 1:
+                    try:
+                        response = await asyncio.wait_for(self.batcher(route).submit(call_params, init_params), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        raise CryptoMeshError(f"Endpoint '{route.endpoint_id}' did not answer the batch within {timeout}s", code=504)
+                else:
+                    response = await self._request(route, {
+                        "init_params": init_params,
+                        "call_params": call_params,
+                    }, timeout=timeout)
+                if not isinstance(response, dict):
+                    raise ValueError("expected a JSON object")
+            except (CryptoMeshError, ValueError) as e:
+                self.failures += 1
+                # Failed routes may point to a moved endpoint; resolve them again next time.
+                self.routes.invalidate(function_id)
+                self.record(route, ok=False, result=None, error=str(e), elapsed=T.time() - t1)
+                if isinstance(e, CryptoMeshError):
+                    raise
+                raise CryptoMeshError(f"Invalid response from endpoint '{route.endpoint_id}': {e}", code=502)
+        finally:
+            self._in_flight.release()
+
+        result = InvocationResult(
+            route   = route,
+            ok      = bool(response.get("ok", True)),
+            result  = response.get("result"),
+            error   = response.get("error"),
+            elapsed = T.time() - t1,
+        )
+        self.record(route, result.ok, result.result, result.error, result.elapsed)
+        if key is not None and result.ok:
+            self.remember(key, route, result.result)
+        L.info({
+            "event": "FUNCTION.INVOKED",
+            "function_id": function_id,
+            "endpoint_id": route.endpoint_id,
+            "ok": result.ok,
+            "time": round(result.elapsed, 4)
+        })
+        return result
+
+    async def _request(self, route: FunctionRoute, body: Dict[str, Any], timeout: float) -> Any:
+        payload = json.dumps({
+            "request_id": uuid.uuid4().hex,
+            "bucket_id": route.axo_bucket_id,
+            "key": route.axo_key,
+            "class_name": route.axo_class_name,
+            "method": route.method,
+            **body,
+        }, default=str).encode()
+        return json.loads(await self.pool.request(route.address, payload, timeout=timeout))
+
+    # ----------------------------
+    # Micro-batching
+    # ----------------------------
+    def batcher(self, route: FunctionRoute) -> MicroBatcher:
+        # Keyed by the whole route, so a batch is always sent with the route its calls resolved.
+        batcher = self.batchers.get(route)
+        if batcher is None:
+            async def send(calls: List[BatchedCall]) -> List[Any]:
+                return await self._send_batch(route, calls)
+            batcher = self.batchers[route] = MicroBatcher(send, max_size=route.batch_max_size, max_wait=route.batch_max_wait)
+        return batcher
+
+    def close_batchers(self):
+        # Pending calls are still sent, with the route they were submitted for.
+        batchers, self.batchers = self.batchers, {}
+        for batcher in batchers.values():
+            batcher.close()
+
+    async def _send_batch(self, route: FunctionRoute, calls: List[BatchedCall]) -> List[Any]:
+        response = await self._request(route, {
+            "batch": [{"init_params": c.init_params, "call_params": c.call_params} for c in calls],
+        }, timeout=self.timeout)
+        responses = response.get("results") if isinstance(response, dict) else None
+        if not isinstance(responses, list) or len(responses) != len(calls):
+            raise ValueError(f"batch response does not match the {len(calls)} calls sent")
+        return responses
+
+    # ----------------------------
+    # Result recording
+    # ----------------------------
+    def record(self, route: FunctionRoute, ok: bool, result: Any, error: Optional[str], elapsed: float):
+        if len(self._recording) >= self.max_pending_results:
+            self.unrecorded += 1
+            L.warning({"event": "FUNCTION.RESULT.DROPPED", "function_id": route.function_id})
+            return
+        metadata = {
+            "status": "ok" if ok else "error",
+            "active_object_id": route.active_object_id,
+            "endpoint_id": route.endpoint_id,
+            "method": route.method,
+            "elapsed": str(round(elapsed, 6)),
+        }
+        if error is not None:
+            metadata["error"] = error
+        if result is not None:
+            metadata["result"] = json.dumps(result, default=str)
+        self._background(self._store(FunctionResultModel(function_id=route.function_id, metadata=metadata)))
+
+    def remember(self, key: str, route: FunctionRoute, result: Any):
+        # An explicit cache_ttl of 0 disables caching for the function.
+        ttl = config.CRYPTO_MESH_RESULT_CACHE_TTL if route.cache_ttl is None else route.cache_ttl
+        if ttl <= 0 or len(json.dumps(result, default=str)) > config.CRYPTO_MESH_RESULT_CACHE_MAX_ENTRY_BYTES:
+            return
+        # Cache writes share the max_pending_results budget with result records.
+        if len(self._recording) >= self.max_pending_results:
+            self.uncached += 1
+            L.warning({"event": "FUNCTION.RESULT_CACHE.SKIPPED", "function_id": route.function_id})
+            return
+        self._background(self._cache(key, route.function_id, result, ttl))
+
+    def _background(self, coro):
+        task = asyncio.get_running_loop().create_task(coro)
+        self._recording.add(task)
+        task.add_done_callback(self._recording.discard)
+
+    async def _cache(self, key: str, function_id: str, result: Any, ttl: float):
+        try:
+            await self.result_cache.set(key, result, ttl)
+        except Exception as e:
+            L.error({"event": "FUNCTION.RESULT_CACHE.SET.FAIL", "function_id": function_id, "reason": str(e)})
+
+    async def _store(self, model: FunctionResultModel):
+        try:
+            await FunctionResultRepository(get_collection("function_results")).create(model)
+        except Exception as e:
+            self.unrecorded += 1
+            L.error({"event": "FUNCTION.RESULT.RECORD.FAIL", "function_id": model.function_id, "reason": str(e)})
+
+    async def drain(self):
+        """
+        Waits until every pending result (and cache entry) has been written.
+        """
+        while self._recording:
+            await asyncio.gather(*list(self._recording), return_exceptions=True)
+
+    async def close(self):
+        self.close_batchers()
+        await self.drain()
+        await self.pool.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "invocations": self.invocations,
+            "cache_hits": self.cache_hits,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "pending_results": len(self._recording),
+            "unrecorded": self.unrecorded,
+            "uncached": self.uncached,
+            "coalescing": self.flights.stats(),
+            "batching": {
+                f"{route.function_id}@{route.address[0]}:{route.address[1]}": batcher.stats()
+                for route, batcher in self.batchers.items()
+            },
+            "routes": self.routes.stats(),
+            "pool": self.pool.stats(),
+        }
+
+
+INVOCATION_GATEWAY = InvocationGateway(
+    pool = ConnectionPool(
+        max_per_endpoint = config.CRYPTO_MESH_INVOKE_POOL_SIZE,
+        idle_timeout     = config.CRYPTO_MESH_INVOKE_POOL_IDLE_TIMEOUT,
+        connect_timeout  = config.CRYPTO_MESH_INVOKE_CONNECT_TIMEOUT,
+        max_frame_bytes  = config.CRYPTO_MESH_INVOKE_MAX_FRAME_BYTES,
+    ),
+    max_in_flight       = config.CRYPTO_MESH_INVOKE_MAX_IN_FLIGHT,
+    acquire_timeout     = config.CRYPTO_MESH_INVOKE_ACQUIRE_TIMEOUT,
+    timeout             = config.CRYPTO_MESH_INVOKE_TIMEOUT,
+    route_ttl           = config.CRYPTO_MESH_INVOKE_ROUTE_TTL,
+    max_pending_results = config.CRYPTO_MESH_INVOKE_MAX_PENDING_RESULTS,
+)
+CollectionVersionsRepository.subscribe(INVOCATION_GATEWAY.on_version_bump)
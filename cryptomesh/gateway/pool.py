@@ -0,0 +1,139 @@
+import asyncio
+import struct
+import time as T
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Tuple
+
+from cryptomesh.errors import CryptoMeshError
+from cryptomesh.log.logger import get_logger
+
+L = get_logger(__name__)
+
+Address = Tuple[str, int]
+Connector = Callable[[str, int], Awaitable[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]]
+
+FRAME_HEADER = struct.Struct("!I")
+
+
+class EndpointConnection:
+    """
+    Persistent connection to an endpoint's req/res socket. Messages are
+    length-prefixed frames (4-byte big-endian size + body) and the socket
+    carries one request at a time.
+    """
+
+    def __init__(self, address: Address, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, max_frame_bytes: int):
+        self.address         = address
+        self.reader          = reader
+        self.writer          = writer
+        self.max_frame_bytes = max_frame_bytes
+        self.last_used       = T.monotonic()
+
+    @property
+    def closed(self) -> bool:
+        return self.writer.is_closing() or self.reader.at_eof()
+
+    async def request(self, payload: bytes) -> bytes:
+        self.writer.write(FRAME_HEADER.pack(len(payload)) + payload)
+        await self.writer.drain()
+        (size,) = FRAME_HEADER.unpack(await self.reader.readexactly(FRAME_HEADER.size))
+        if size > self.max_frame_bytes:
+            raise CryptoMeshError(f"Response frame of {size} bytes from {self.address[0]}:{self.address[1]} exceeds the limit", code=502)
+        body = await self.reader.readexactly(size)
+        self.last_used = T.monotonic()
+        return body
+
+    def close(self):
+        self.writer.close()
+
+
+class ConnectionPool:
+    """
+    Keeps up to `max_per_endpoint` open connections per endpoint address and
+    reuses idle ones, so an invocation costs a write and a read instead of a
+    TCP handshake. Connections idle for longer than `idle_timeout` are
+    discarded on checkout; a connection whose request failed or timed out is
+    closed, since a late response would desynchronize it.
+    """
+
+    def __init__(
+        self,
+        max_per_endpoint: int,
+        idle_timeout: float,
+        connect_timeout: float,
+        max_frame_bytes: int,
+        connector: Connector = asyncio.open_connection,
+    ):
+        self.max_per_endpoint = max_per_endpoint
+        self.idle_timeout     = idle_timeout
+        self.connect_timeout  = connect_timeout
+        self.max_frame_bytes  = max_frame_bytes
+        self.connector        = connector
+        self._idle: Dict[Address, Deque[EndpointConnection]] = {}
+        self._slots: Dict[Address, asyncio.Semaphore] = {}
+        self.opened    = 0
+        self.reused    = 0
+        self.discarded = 0
+
+    def _slot(self, address: Address) -> asyncio.Semaphore:
+        slot = self._slots.get(address)
+        if slot is None:
+            slot = self._slots[address] = asyncio.Semaphore(self.max_per_endpoint)
+        return slot
+
+    async def _checkout(self, address: Address) -> EndpointConnection:
+        idle = self._idle.setdefault(address, deque())
+        now = T.monotonic()
+        while idle:
+            # Most recently used first: the likeliest to still be alive.
+            conn = idle.pop()
+            if conn.closed or now - conn.last_used > self.idle_timeout:
+                conn.close()
+                self.discarded += 1
+                continue
+            self.reused += 1
+            return conn
+        try:
+            reader, writer = await asyncio.wait_for(self.connector(*address), timeout=self.connect_timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            raise CryptoMeshError(f"Cannot connect to endpoint {address[0]}:{address[1]}: {e or 'timeout'}", code=502)
+        self.opened += 1
+        return EndpointConnection(address, reader, writer, self.max_frame_bytes)
+
+    def _checkin(self, conn: EndpointConnection):
+        if conn.closed:
+            self.discarded += 1
+            return
+        self._idle.setdefault(conn.address, deque()).append(conn)
+
+    async def request(self, address: Address, payload: bytes, timeout: float) -> bytes:
+        async with self._slot(address):
+            conn = await self._checkout(address)
+            try:
+                response = await asyncio.wait_for(conn.request(payload), timeout=timeout)
+            except asyncio.TimeoutError:
+                conn.close()
+                raise CryptoMeshError(f"Endpoint {address[0]}:{address[1]} did not answer within {timeout}s", code=504)
+            except (OSError, asyncio.IncompleteReadError) as e:
+                conn.close()
+                raise CryptoMeshError(f"Connection to endpoint {address[0]}:{address[1]} failed: {e}", code=502)
+            except BaseException:
+                conn.close()
+                raise
+            self._checkin(conn)
+            return response
+
+    async def close(self):
+        for idle in self._idle.values():
+            while idle:
+                idle.pop().close()
+        self._idle.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "endpoints": len(self._slots),
+            "idle": sum(len(idle) for idle in self._idle.values()),
+            "opened": self.opened,
+            "reused": self.reused,
+            "discarded": self.discarded,
+        }
@@ -0,0 +1,89 @@
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Protocol, Tuple
+
+from cryptomesh import config
+from cryptomesh.cache import TTLCache
+from cryptomesh.db import get_collection
+from cryptomesh.log.logger import get_logger
+
+L = get_logger(__name__)
+
+RESULT_CACHE_COLLECTION = "function_result_cache"
+
+
+def args_hash(init_params: Dict[str, Any], call_params: Dict[str, Any]) -> str:
+    """
+    Hash of the arguments in canonical form (sorted keys, no whitespace), so
+    {"a": 1, "b": 2} and {"b": 2, "a": 1} share an entry.
+    """
+    canonical = json.dumps({"init": init_params, "call": call_params}, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def cache_key(function_id: str, version: str, init_params: Dict[str, Any], call_params: Dict[str, Any]) -> str:
+    return f"{function_id}:{version}:{args_hash(init_params, call_params)}"
+
+
+class ResultCache(Protocol):
+    async def get(self, key: str) -> Tuple[bool, Any]: ...
+    async def set(self, key: str, value: Any, ttl: float) -> None: ...
+
+
+class MemoryResultCache:
+    """
+    Per-process LRU/TTL cache of invocation results.
+    """
+
+    def __init__(self, max_size: int):
+        self.cache: TTLCache = TTLCache(name="function_results", ttl=config.CRYPTO_MESH_RESULT_CACHE_TTL, max_size=max_size)
+
+    async def get(self, key: str) -> Tuple[bool, Any]:
+        # Values are boxed so that a cached None is still a hit.
+        entry = self.cache.get(key)
+        return (False, None) if entry is None else (True, entry[0])
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self.cache.set(key, (value,), ttl=ttl)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
+
+
+class MongoResultCache:
+    """
+    Result cache shared by every replica, stored in function_result_cache.
+    Mongo's TTL monitor removes expired entries (index on expires_at); reads
+    also check the expiration because the monitor only runs once a minute.
+    """
+
+    def __init__(self, collection_name: str = RESULT_CACHE_COLLECTION):
+        self.collection_name = collection_name
+        self._indexed = False
+
+    async def _collection(self):
+        collection = get_collection(self.collection_name)
+        if not self._indexed:
+            await collection.create_index("expires_at", expireAfterSeconds=0)
+            self._indexed = True
+        return collection
+
+    async def get(self, key: str) -> Tuple[bool, Any]:
+        collection = await self._collection()
+        doc = await collection.find_one({"_id": key, "expires_at": {"$gt": datetime.now(timezone.utc)}})
+        return (True, doc["value"]) if doc else (False, None)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        collection = await self._collection()
+        await collection.replace_one(
+            {"_id": key},
+            {"_id": key, "value": value, "expires_at": datetime.now(timezone.utc) + timedelta(seconds=ttl)},
+            upsert=True
+        )
+
+
+def build_result_cache() -> ResultCache:
+    if config.CRYPTO_MESH_RESULT_CACHE_BACKEND == "mongo":
+        return MongoResultCache()
+    return MemoryResultCache(max_size=config.CRYPTO_MESH_RESULT_CACHE_MAX_SIZE)
@@ -0,0 +1,2 @@
+from cryptomesh.health.monitor import CheckResult, HealthMonitor, HEALTH_MONITOR, PROBE_PATHS
+from cryptomesh.health.checks import default_checks, mictlanx_address, mongo_ping, tcp_check
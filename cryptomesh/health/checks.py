@@ -0,0 +1,43 @@
+import asyncio
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+from cryptomesh.db import get_client
+from cryptomesh.health.monitor import Check
+from cryptomesh.models import SummonerParams
+from cryptomesh.storage.backends import MICTLANX_URI, backend
+
+
+async def mongo_ping():
+    client = get_client()
+    if client is None:
+        raise ConnectionError("MongoDB client not connected")
+    await client.admin.command("ping")
+
+
+def tcp_check(host: str, port: int) -> Check:
+    """
+    Reachability of host:port: opens a TCP connection and closes it. Cheaper
+    for the dependency than an API call and needs no client library.
+    """
+    async def check():
+        _, writer = await asyncio.open_connection(host, port)
+        writer.close()
+        await writer.wait_closed()
+    return check
+
+
+def mictlanx_address(uri: str = MICTLANX_URI) -> Tuple[str, int]:
+    # mictlanx://<router-id>@<host>:<port>?/api_version=...
+    parts = urlsplit(uri)
+    return parts.hostname or "localhost", parts.port or 60666
+
+
+def default_checks(summoner: SummonerParams) -> Dict[str, Check]:
+    checks = {
+        "mongo": mongo_ping,
+        "summoner": tcp_check(summoner.ip_addr, summoner.port),
+    }
+    if backend() == "mictlanx":
+        checks["mictlanx"] = tcp_check(*mictlanx_address())
+    return checks
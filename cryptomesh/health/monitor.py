@@ -0,0 +1,145 @@
+import asyncio
+import time as T
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from pydantic import BaseModel
+
+from cryptomesh import config
+from cryptomesh.log.logger import get_logger
+
+L = get_logger(__name__)
+
+# Liveness and readiness routes; served without authentication or admission control.
+PROBE_PATHS = ("/healthz", "/readyz")
+
+# A check returns normally when the dependency is usable and raises otherwise.
+Check = Callable[[], Awaitable[Any]]
+
+
+class CheckResult(BaseModel):
+    name: str
+    ok: bool
+    required: bool
+    latency: float
+    checked_at: float
+    error: Optional[str] = None
+
+
+class HealthMonitor:
+    """
+    Runs the dependency checks in the background every `interval` seconds
+    (each bounded by `timeout`) and keeps the last result of each one, so
+    readiness probes are answered from memory: probes never add load to the
+    dependencies nor wait on a slow one.
+
+    The process is ready once a round has completed, every `required` check
+    passed in the latest round, and that round is recent (a monitor that
+    stopped running is not trusted). Checks that are not required are only
+    reported. stop() makes the process unready before shutdown so the
+    orchestrator drains it first.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        timeout: float,
+        required: Iterable[str] = (),
+        clock: Callable[[], float] = T.time,
+    ):
+        self.interval  = interval
+        self.timeout   = timeout
+        self.required  = set(required)
+        self.clock     = clock
+        self.checks: Dict[str, Check] = {}
+        self.results: Dict[str, CheckResult] = {}
+        self.rounds    = 0
+        self.stopping  = False
+        self.started_at = clock()
+        self._last_round = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, check: Check):
+        self.checks[name] = check
+
+    async def _run_check(self, name: str, check: Check) -> CheckResult:
+        t1 = T.time()
+        error = None
+        try:
+            await asyncio.wait_for(check(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            error = f"timed out after {self.timeout}s"
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        return CheckResult(
+            name       = name,
+            ok         = error is None,
+            required   = name in self.required,
+            latency    = round(T.time() - t1, 4),
+            checked_at = self.clock(),
+            error      = error,
+        )
+
+    async def run_once(self):
+        results = await asyncio.gather(*(self._run_check(name, check) for name, check in self.checks.items()))
+        for result in results:
+            previous = self.results.get(result.name)
+            if previous is None or previous.ok != result.ok:
+                log = L.info if result.ok else L.error
+                log({"event": "HEALTH.CHECK.CHANGED", "check": result.name, "ok": result.ok, "error": result.error, "time": result.latency})
+            self.results[result.name] = result
+        self.rounds += 1
+        self._last_round = self.clock()
+
+    async def run(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                L.error({"event": "HEALTH.ROUND.FAIL", "error": str(e)})
+            await asyncio.sleep(self.interval)
+
+    def start(self, checks: Optional[Dict[str, Check]] = None):
+        for name, check in (checks or {}).items():
+            self.register(name, check)
+        self.stopping = False
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self):
+        self.stopping = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def ready(self) -> bool:
+        if self.stopping or self.rounds == 0:
+            return False
+        # Results older than a few rounds mean the monitor itself is stuck.
+        if self.clock() - self._last_round > 3 * self.interval + self.timeout:
+            return False
+        return all(self.results.get(name) is not None and self.results[name].ok for name in self.required)
+
+    def report(self) -> Dict[str, Any]:
+        if self.stopping:
+            status = "stopping"
+        elif self.rounds == 0:
+            status = "starting"
+        else:
+            status = "ready" if self.ready else "unready"
+        return {
+            "status": status,
+            "age": round(self.clock() - self._last_round, 4) if self.rounds else None,
+            "checks": {name: result.model_dump(exclude={"name"}) for name, result in self.results.items()},
+        }
+
+
+HEALTH_MONITOR = HealthMonitor(
+    interval = config.CRYPTO_MESH_HEALTH_INTERVAL,
+    timeout  = config.CRYPTO_MESH_HEALTH_TIMEOUT,
+    required = [name.strip() for name in config.CRYPTO_MESH_READY_REQUIRED.split(",") if name.strip()],
+)
@@ -0,0 +1,99 @@
+"""
+Production entry point: serves cryptomesh.server:app with several uvicorn
+worker processes.
+
+    python -m cryptomesh.launcher --workers 4
+
+Workers are spawned (not forked) by the uvicorn supervisor and import the app
+on their own, so nothing is shared between them: each one opens its MongoDB
+client, invocation pools and caches in its own lifespan, and the admission
+and in-flight limits apply per worker. Writes served by one worker reach the
+caches of the others through collection_versions polling
+(CRYPTO_MESH_VERSION_POLL_INTERVAL) and token revocations through MongoDB,
+so they see them with that delay; one worker is the default. The supervisor
+restarts workers that die. uvloop and httptools are used when installed
+(uvicorn[standard]).
+"""
+import argparse
+import importlib.util
+import os
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+
+from cryptomesh import config
+
+APP = "cryptomesh.server:app"
+
+
+def available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def default_workers() -> int:
+    # CPUs this process may run on (cgroup/affinity aware where supported).
+    if hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    return os.cpu_count() or 1
+
+
+def server_options(
+    workers: Optional[int] = None,
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    backlog: Optional[int] = None,
+    keep_alive: Optional[int] = None,
+    limit_concurrency: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Keyword arguments for uvicorn.run. Unset values come from config; a
+    worker count of 0 means one worker per available CPU.
+    """
+    workers = config.CRYPTO_MESH_WORKERS if workers is None else workers
+    limit_concurrency = config.CRYPTO_MESH_LIMIT_CONCURRENCY if limit_concurrency is None else limit_concurrency
+    return {
+        "host": host or config.CRYPTO_MESH_HOST,
+        "port": port or config.CRYPTO_MESH_PORT,
+        "workers": workers or default_workers(),
+        "loop": "uvloop" if available("uvloop") else "asyncio",
+        "http": "httptools" if available("httptools") else "h11",
+        "backlog": backlog or config.CRYPTO_MESH_BACKLOG,
+        "timeout_keep_alive": config.CRYPTO_MESH_KEEP_ALIVE if keep_alive is None else keep_alive,
+        # 0 disables the limit; otherwise connections beyond it get 503 before reaching the app.
+        "limit_concurrency": limit_concurrency or None,
+        "timeout_graceful_shutdown": config.CRYPTO_MESH_GRACEFUL_SHUTDOWN,
+        "access_log": config.CRYPTO_MESH_ACCESS_LOG,
+        "proxy_headers": True,
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="cryptomesh-server", description="CryptoMesh API (multi-worker)")
+    parser.add_argument("--workers", type=int, help="Worker processes (0 = one per CPU)")
+    parser.add_argument("--host")
+    parser.add_argument("--port", type=int)
+    parser.add_argument("--backlog", type=int, help="Pending connections queued by the listening socket")
+    parser.add_argument("--keep-alive", type=int, help="Seconds an idle keep-alive connection is kept open")
+    parser.add_argument("--limit-concurrency", type=int, help="Connections per worker before answering 503 (0 = unlimited)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    options = server_options(
+        workers           = args.workers,
+        host              = args.host,
+        port              = args.port,
+        backlog           = args.backlog,
+        keep_alive        = args.keep_alive,
+        limit_concurrency = args.limit_concurrency,
+    )
+    if options["workers"] > 1:
+        # Workers inherit the environment: each one writes its own log file instead of
+        # rotating a shared one.
+        os.environ.setdefault("CRYPTO_MESH_LOG_PER_PROCESS", "1")
+    uvicorn.run(APP, **options)
+
+
+if __name__ == "__main__":
+    main()
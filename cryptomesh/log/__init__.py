@@ -5,7 +5,7 @@ from logging.handlers import TimedRotatingFileHandler
 import datetime
 import json
 import threading
-from option import NONE, Option
+from option import NONE, Option, Some
 from cryptomesh import config 
 
 
@@ -99,6 +99,7 @@ class Log(logging.Logger):
                 to_file: bool = config.CRYPTO_MESH_LOG_TO_FILE,
                 when: str = config.CRYPTO_MESH_LOG_ROTATION_WHEN,
                 interval: int = config.CRYPTO_MESH_LOG_ROTATION_INTERVAL,
+                per_process: bool = config.CRYPTO_MESH_LOG_PER_PROCESS,
                  ):
         """
         Initialize the logger with optional console and file handlers.
@@ -121,8 +122,12 @@ class Log(logging.Logger):
             to_file (bool): If True, enables file logging.
             when (str): TimedRotatingFileHandler `when` parameter (e.g., "m" for minutes).
             interval (int): TimedRotatingFileHandler `interval` parameter.
+            per_process (bool): If True, suffixes the log filenames with the process id.
         """
         super().__init__(name, level)
+        if per_process:
+            # Several workers rotating the same file would overwrite each other's rotations.
+            filename = Some(f"{filename.unwrap_or(name)}.{os.getpid()}")
 
         if not os.path.exists(path) and create_folder:
             os.makedirs(path)
@@ -51,6 +51,8 @@ class EndpointStateModel(BaseModel):
     state: str
     metadata: Dict[str, str]
     timestamp: datetime = Field(default_factory=lambda:datetime.now(timezone.utc))
+    # Incremented by every conditional transition (compare-and-set)
+    version: int = 0
 
 class ServiceModel(BaseModel):
     service_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -82,10 +84,23 @@ class FunctionModel(BaseModel):
     name: str                          # ej. "run"
     init_params: List[ParameterSpec] = Field(default_factory=list)  # kwargs de __init__
     call_params: List[ParameterSpec] = Field(default_factory=list)   # kwargs de la función
+    cacheable: bool = False             # resultado determinista dados init_params/call_params
+    cache_ttl: Optional[float] = None   # segundos; por defecto CRYPTO_MESH_RESULT_CACHE_TTL
+    batch_max_size: int = 1             # >1 agrupa invocaciones concurrentes en un solo lote al endpoint
+    batch_max_wait: float = 0.005       # segundos máximos que una invocación espera a completar el lote
     
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
 
+class BlobRefModel(BaseModel):
+    """Reference to an object stored in the blob store (e.g. an uploaded model bundle)"""
+    bucket_id: str
+    key: str
+    size: int
+    sha256: str
+    content_type: Optional[str] = None
+
+
 class ActiveObjectModel(BaseModel):
     """Serializable metafata stored alongside every active object"""
     model_config = ConfigDict(validate_assignment = True)
@@ -114,10 +129,18 @@ class ActiveObjectModel(BaseModel):
     axo_uri: Optional[str] = None
     axo_alias: Optional[str] = None
     axo_code: Optional[str] = None
+    axo_code_hash: Optional[str] = Field(
+        default=None,
+        description="sha256 of axo_code, used as the ETag of the code endpoint"
+    )
     axo_schema: Optional[Dict[str, object]] = Field(
         default=None,
         description="JSON schema of constructor args and methods extracted from axo_code"
     )
+    axo_artifacts: List[BlobRefModel] = Field(
+        default_factory=list,
+        description="Blobs uploaded with PUT /blobs/{bucket_id}/{key} that belong to this object"
+    )
     functions: List[FunctionModel] = Field(default_factory=list)
 
     created_at: datetime = Field(default_factory=lambda:datetime.now(timezone.utc))
@@ -146,6 +169,8 @@ class FunctionStateModel(BaseModel):
     state: str
     metadata: Dict[str, str]
     timestamp: datetime = Field(default_factory=lambda:datetime.now(timezone.utc))
+    # Incremented by every conditional transition (compare-and-set)
+    version: int = 0
 
 class FunctionResultModel(BaseModel):
     result_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
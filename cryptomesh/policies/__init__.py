@@ -1,8 +1,14 @@
 # cryptomesh/policies/__init__.py
 
+import hashlib
 import os
 import yaml
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+from cryptomesh.cache import TTLCache
+from cryptomesh.log.logger import get_logger
 
 from cryptomesh.models import (
     EndpointModel,
@@ -11,39 +17,200 @@ from cryptomesh.models import (
     ServiceModel,
 )
 
+L = get_logger(__name__)
+
+# libyaml is several times faster than the pure-Python loader; fall back when it is not compiled in.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+POLICY_SECTIONS = ("endpoints", "functions", "microservices", "services")
+POLICY_EXTENSIONS = (".yml", ".yaml")
+POLICY_CACHE_DIR = os.environ.get("CRYPTO_MESH_POLICY_COMPILED_CACHE_DIR")
+
+# fingerprint of the source files -> compiled policy (raw sections + models)
+COMPILED_POLICIES: TTLCache = TTLCache(
+    name="compiled-policies",
+    ttl=float("inf"),
+    max_size=int(os.environ.get("CRYPTO_MESH_POLICY_COMPILED_CACHE_SIZE", "32"))
+)
+
+# (kind, id) of an entity declared in a policy, e.g. ("services", "s_data").
+PolicyNode = Tuple[str, str]
+
+# kind -> {field: referenced kind}
+POLICY_REFERENCES: Dict[str, Dict[str, str]] = {
+    "endpoints": {"security_policy": "security_policies"},
+    "functions": {"microservice_id": "microservices", "endpoint_id": "endpoints"},
+    "microservices": {"service_id": "services"},
+    "services": {"security_policy": "security_policies"},
+}
+
+
+class CompiledPolicyModel(BaseModel):
+    """
+    On-disk form of a compiled policy. Stored as JSON and validated on read,
+    so a file in the cache directory can at most fail validation, never run code.
+    """
+    raw: Dict[str, Any] = Field(default_factory=dict)
+    endpoints: Dict[str, EndpointModel] = Field(default_factory=dict)
+    functions: Dict[str, FunctionModel] = Field(default_factory=dict)
+    microservices: Dict[str, MicroserviceModel] = Field(default_factory=dict)
+    services: Dict[str, ServiceModel] = Field(default_factory=dict)
+
+
+def _reference_id(value: Any, kind: str) -> Optional[str]:
+    # security_policy may be an id or an inline definition ({"sp_id": ..., "roles": [...]})
+    if isinstance(value, dict):
+        value = value.get("sp_id") if kind == "security_policies" else value.get("id")
+    return value if isinstance(value, str) else None
+
+
 class CMPolicyManager:
     """
     CMPolicyManager is responsible for managing the policy configuration
     for the CryptoMesh system.
+
+    `policy_file` may be a single YAML file, a directory of *.yml/*.yaml files
+    or an explicit list of files. Several files are merged per entity: files
+    later in the list (or later in lexicographic order inside a directory)
+    override entities with the same id declared by earlier ones.
+
+    Compiled models are cached in memory keyed by path + mtime + size and,
+    when `cache_dir` (or CRYPTO_MESH_POLICY_COMPILED_CACHE_DIR) is set, written
+    as JSON on disk keyed by the content hash, so unchanged policies are never parsed twice.
     """
-    def __init__(self, policy_file: str):
+    def __init__(self, policy_file: Union[str, Sequence[str], None] = None, cache_dir: Optional[str] = None):
         self.policy_file = policy_file
+        self.cache_dir = cache_dir or POLICY_CACHE_DIR
         self._raw_data: Dict[str, Any] = {}
+        self._content: Optional[bytes] = None
 
-    def load_policy(self) -> Dict[str, Any]:
+    @classmethod
+    def from_content(cls, content: Union[str, bytes]) -> "CMPolicyManager":
         """
-        Load the policy configuration from a YAML file.
+        Builds a manager for an in-memory policy document (e.g. an uploaded file).
         """
-        if not os.path.exists(self.policy_file):
-            raise FileNotFoundError(f"Policy not found: {self.policy_file}")
+        manager = cls()
+        manager._content = content.encode("utf-8") if isinstance(content, str) else content
+        return manager
 
-        with open(self.policy_file, "r") as f:
-            self._raw_data = yaml.safe_load(f)
+    def sources(self) -> List[str]:
+        """
+        Resolves the policy files in precedence order (lowest first).
+        """
+        if self.policy_file is None:
+            raise ValueError("No policy file was given")
+        paths = [self.policy_file] if isinstance(self.policy_file, str) else list(self.policy_file)
+        files: List[str] = []
+        for path in paths:
+            if os.path.isdir(path):
+                files.extend(
+                    os.path.join(path, name) for name in sorted(os.listdir(path))
+                    if name.endswith(POLICY_EXTENSIONS)
+                )
+            elif os.path.exists(path):
+                files.append(path)
+            else:
+                raise FileNotFoundError(f"Policy not found: {path}")
+        return files
 
+    @staticmethod
+    def merge(documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Merges policy documents section by section; later documents win per entity id.
+        Top-level keys other than the entity sections are overridden as a whole.
+        """
+        merged: Dict[str, Any] = {}
+        for document in documents:
+            if document is not None and not isinstance(document, dict):
+                raise ValueError("A policy document must be a mapping")
+            for key, value in (document or {}).items():
+                if key in POLICY_SECTIONS and isinstance(value, dict):
+                    merged.setdefault(key, {}).update(value)
+                else:
+                    merged[key] = value
+        return merged
+
+    def load_policy(self) -> Dict[str, Any]:
+        """
+        Load the policy configuration from the YAML file(s).
+        """
+        self._load_compiled()
         return self._raw_data
 
+    def _fingerprint(self, files: List[str]) -> Tuple[Tuple[str, int, int], ...]:
+        fingerprint = []
+        for path in files:
+            st = os.stat(path)
+            fingerprint.append((os.path.abspath(path), st.st_mtime_ns, st.st_size))
+        return tuple(fingerprint)
+
+    def _load_compiled(self) -> Dict[str, Any]:
+        if self._content is not None:
+            files = []
+            fingerprint = ("<content>", hashlib.sha256(self._content).hexdigest())
+        else:
+            files = self.sources()
+            fingerprint = self._fingerprint(files)
+        compiled = COMPILED_POLICIES.get(fingerprint)
+        if compiled is None:
+            contents = [self._content] if self._content is not None else []
+            for path in files:
+                with open(path, "rb") as f:
+                    contents.append(f.read())
+            digest = hashlib.sha256(b"\0".join(contents)).hexdigest()
+            compiled = self._read_disk_cache(digest)
+            if compiled is None:
+                raw = self.merge([yaml.load(content, Loader=YAML_LOADER) for content in contents])
+                compiled = {"raw": raw, "models": None}
+                try:
+                    compiled["models"] = self._build_models(raw)
+                except Exception as e:
+                    # Keep the raw sections usable (e.g. for dependency_graph); as_models re-raises.
+                    compiled["error"] = e
+                self._write_disk_cache(digest, compiled)
+            COMPILED_POLICIES.set(fingerprint, compiled)
+        self._raw_data = compiled["raw"]
+        return compiled
+
+    def _cache_path(self, digest: str) -> Optional[str]:
+        return os.path.join(self.cache_dir, f"policy-{digest}.json") if self.cache_dir else None
+
+    def _read_disk_cache(self, digest: str) -> Optional[Dict[str, Any]]:
+        path = self._cache_path(digest)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                stored = CompiledPolicyModel.model_validate_json(f.read())
+            return {
+                "raw": stored.raw,
+                "models": {section: getattr(stored, section) for section in POLICY_SECTIONS},
+            }
+        except Exception as e:
+            L.warning({"event": "POLICY.CACHE.READ.FAIL", "path": path, "reason": str(e)})
+            return None
+
+    def _write_disk_cache(self, digest: str, compiled: Dict[str, Any]):
+        path = self._cache_path(digest)
+        if not path or "error" in compiled:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            stored = CompiledPolicyModel(raw=compiled["raw"], **compiled["models"])
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(stored.model_dump_json())
+            os.replace(tmp, path)
+        except OSError as e:
+            L.warning({"event": "POLICY.CACHE.WRITE.FAIL", "path": path, "reason": str(e)})
+
     def parse(self) -> Dict[str, Dict[str, Any]]:
         if not self._raw_data:
             self.load_policy()
-        return {
-            "endpoints": self._raw_data.get("endpoints", {}),
-            "functions": self._raw_data.get("functions", {}),
-            "microservices": self._raw_data.get("microservices", {}),
-            "services": self._raw_data.get("services", {}),
-        }
+        return {section: self._raw_data.get(section) or {} for section in POLICY_SECTIONS}
 
-    def as_models(self) -> Dict[str, Dict[str, Any]]:
-        parsed = self.parse()
+    @staticmethod
+    def _build_models(raw: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        parsed = {section: raw.get(section) or {} for section in POLICY_SECTIONS}
         return {
             "endpoints": {
                 eid: EndpointModel(endpoint_id=eid, **edata)
@@ -62,3 +229,31 @@ class CMPolicyManager:
                 for sid, sdata in parsed["services"].items()
             },
         }
+
+    def as_models(self) -> Dict[str, Dict[str, Any]]:
+        compiled = self._load_compiled()
+        if "error" in compiled:
+            raise compiled["error"]
+        # Callers may mutate the models; the cached set must stay pristine.
+        return {
+            kind: {key: model.model_copy(deep=True) for key, model in models.items()}
+            for kind, models in compiled["models"].items()
+        }
+
+    def dependency_graph(self) -> Dict[PolicyNode, Set[PolicyNode]]:
+        """
+        Returns, for every entity of the policy, the entities it references and
+        therefore must be created before it (microservice -> service,
+        function -> microservice/endpoint, endpoint -> security policy).
+        """
+        parsed = self.parse()
+        graph: Dict[PolicyNode, Set[PolicyNode]] = {}
+        for kind, entities in parsed.items():
+            for entity_id, data in entities.items():
+                deps = set()
+                for field, ref_kind in POLICY_REFERENCES.get(kind, {}).items():
+                    ref = _reference_id((data or {}).get(field), ref_kind)
+                    if ref:
+                        deps.add((ref_kind, ref))
+                graph[(kind, entity_id)] = deps
+        return graph
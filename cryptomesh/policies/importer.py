@@ -0,0 +1,129 @@
+# cryptomesh/policies/importer.py
+
+import time as T
+from typing import Any, Dict, List
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.errors import OperationFailure
+
+from cryptomesh.log.logger import get_logger
+from cryptomesh.policies import CMPolicyManager
+from cryptomesh.policies.plan import ID_FIELDS, PLAN_KINDS
+from cryptomesh.repositories.versions_repository import CollectionVersionsRepository, VERSIONS_COLLECTION
+from cryptomesh.services.hierarchy_service import HIERARCHY_SNAPSHOT
+
+L = get_logger(__name__)
+
+# "Transaction numbers are only allowed on a replica set member or mongos"
+TRANSACTIONS_UNSUPPORTED = 20
+
+
+class PolicyImporter:
+    """
+    Writes every entity of a policy straight to Mongo with one bulk_write per
+    collection (upserts keyed by the policy id), inside a transaction when the
+    deployment supports it.
+
+    Used by POST /policies/import and by the standalone loader
+    (python -m cryptomesh.db.load_metadata).
+    """
+
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.database = database
+
+    async def ensure_indexes(self):
+        """
+        Unique index on the id field of every policy collection. Run once at
+        startup (and by the standalone loader), never per import; the upserts
+        of import_models rely on it. Non-unique indexes left by earlier
+        versions are replaced.
+        """
+        for kind in PLAN_KINDS:
+            collection = self.database[kind]
+            id_field   = ID_FIELDS[kind]
+            name       = f"{id_field}_1"
+            try:
+                existing = (await collection.index_information()).get(name)
+                if existing is not None and existing.get("unique"):
+                    continue
+                if existing is not None:
+                    await collection.drop_index(name)
+                await collection.create_index(id_field, unique=True, name=name)
+                L.info({"event": "POLICY.INDEX.CREATED", "collection": kind, "field": id_field, "replaced": existing is not None})
+            except OperationFailure as e:
+                # e.g. duplicated ids already stored: the API keeps working without the index.
+                L.error({"event": "POLICY.INDEX.FAIL", "collection": kind, "field": id_field, "reason": str(e)})
+
+    def build_operations(self, models: Dict[str, Dict[str, Any]]) -> Dict[str, List[UpdateOne]]:
+        operations: Dict[str, List[UpdateOne]] = {kind: [] for kind in PLAN_KINDS}
+        for kind in PLAN_KINDS:
+            id_field = ID_FIELDS[kind]
+            for entity_id, model in models.get(kind, {}).items():
+                doc = model.model_dump(exclude={"created_at"})
+                doc[id_field] = entity_id
+                update = {"$set": doc}
+                if "created_at" in type(model).model_fields:
+                    # Re-importing must not reset the creation date.
+                    update["$setOnInsert"] = {"created_at": model.created_at}
+                operations[kind].append(UpdateOne({id_field: entity_id}, update, upsert=True))
+
+        # service <-> microservice links computed in a single pass over the microservices.
+        links: Dict[str, List[str]] = {}
+        for microservice_id, microservice in models.get("microservices", {}).items():
+            links.setdefault(microservice.service_id, []).append(microservice_id)
+        for service_id, microservice_ids in links.items():
+            operations["services"].append(UpdateOne(
+                {"service_id": service_id},
+                {"$addToSet": {"microservices": {"$each": microservice_ids}}}
+            ))
+        return operations
+
+    async def _write(self, operations: Dict[str, List[UpdateOne]], session=None) -> Dict[str, Dict[str, int]]:
+        summary = {}
+        for kind, ops in operations.items():
+            if not ops:
+                continue
+            result = await self.database[kind].bulk_write(ops, ordered=True, session=session)
+            summary[kind] = {
+                "matched": result.matched_count,
+                "modified": result.modified_count,
+                "upserted": result.upserted_count,
+            }
+        return summary
+
+    async def import_models(self, models: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        t1 = T.time()
+        operations = self.build_operations(models)
+
+        transactional = True
+        try:
+            async with await self.database.client.start_session() as session:
+                async with session.start_transaction():
+                    summary = await self._write(operations, session=session)
+        except OperationFailure as e:
+            if e.code != TRANSACTIONS_UNSUPPORTED:
+                raise
+            L.warning({
+                "event": "POLICY.IMPORT.NO_TRANSACTION",
+                "reason": str(e)
+            })
+            transactional = False
+            summary = await self._write(operations)
+
+        versions = CollectionVersionsRepository(self.database[VERSIONS_COLLECTION])
+        for kind in summary:
+            await versions.bump(kind)
+        HIERARCHY_SNAPSHOT.invalidate()
+
+        report = {
+            "collections": summary,
+            "entities": sum(len(models.get(kind, {})) for kind in PLAN_KINDS),
+            "transaction": transactional,
+            "time": round(T.time() - t1, 4),
+        }
+        L.info({"event": "POLICY.IMPORTED", **report})
+        return report
+
+    async def import_policy(self, manager: CMPolicyManager) -> Dict[str, Any]:
+        return await self.import_models(manager.as_models())
@@ -0,0 +1,158 @@
+# cryptomesh/policies/plan.py
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from pydantic import BaseModel, Field
+
+from cryptomesh.policies import POLICY_REFERENCES, PolicyNode
+from cryptomesh.utils.dag import topological_layers
+
+# Order used for creates/updates inside a layer (the layers come from the reference DAG).
+PLAN_KINDS = ("endpoints", "functions", "microservices", "services")
+
+# Deletes run one kind at a time, dependents before the entities they reference (POLICY_REFERENCES):
+# functions point to microservices and endpoints, microservices point to services.
+DELETE_ORDER = ("functions", "microservices", "endpoints", "services")
+
+ID_FIELDS = {
+    "endpoints": "endpoint_id",
+    "functions": "function_id",
+    "microservices": "microservice_id",
+    "services": "service_id",
+}
+
+# Fields compared against the server (the ones the update DTOs accept).
+PLAN_FIELDS = {
+    "endpoints": ("name", "image", "resources", "security_policy"),
+    "functions": ("name", "image", "resources", "storage", "endpoint_id", "microservice_id"),
+    "microservices": ("name", "service_id", "resources"),
+    "services": ("name", "resources", "security_policy"),
+}
+
+
+class PlanAction(BaseModel):
+    action: str                                    # create | update | delete
+    kind: str
+    key: str                                       # policy key (server id for deletes)
+    layer: int = 0
+    server_id: Optional[str] = None
+    payload: Dict[str, Any] = Field(default_factory=dict)
+    changes: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+
+
+class PolicyPlan(BaseModel):
+    policy_file: str
+    actions: List[PlanAction] = Field(default_factory=list)
+    unchanged: int = 0
+    # (kind, policy key) -> server id of the entities that already exist
+    resolved: Dict[str, str] = Field(default_factory=dict)
+
+    def summary(self) -> Dict[str, int]:
+        counts = {"create": 0, "update": 0, "delete": 0, "unchanged": self.unchanged}
+        for action in self.actions:
+            counts[action.action] += 1
+        return counts
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.actions
+
+
+def node_key(kind: str, key: str) -> str:
+    return f"{kind}/{key}"
+
+
+def translate_references(kind: str, data: Dict[str, Any], resolved: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Replaces policy keys in reference fields (e.g. a microservice's service_id)
+    by the id the server assigned to that entity, when it is known.
+    """
+    translated = dict(data)
+    for field, ref_kind in POLICY_REFERENCES.get(kind, {}).items():
+        value = translated.get(field)
+        if isinstance(value, str):
+            translated[field] = resolved.get(node_key(ref_kind, value), value)
+    return translated
+
+
+def _index_current(docs: List[Dict[str, Any]], id_field: str) -> Tuple[Dict[str, dict], Dict[Tuple[Any, Any], dict]]:
+    by_id: Dict[str, dict] = {}
+    by_name: Dict[Tuple[Any, Any], Optional[dict]] = {}
+    for doc in docs:
+        by_id[doc.get(id_field)] = doc
+        natural = (doc.get("policy_id"), doc.get("name"))
+        # Ambiguous natural keys are never used for matching.
+        by_name[natural] = None if natural in by_name else doc
+    return by_id, {k: v for k, v in by_name.items() if v is not None}
+
+
+def compute_plan(
+    policy_file: str,
+    models: Dict[str, Dict[str, BaseModel]],
+    graph: Dict[PolicyNode, Set[PolicyNode]],
+    current: Dict[str, List[Dict[str, Any]]],
+    prune: bool = True,
+) -> PolicyPlan:
+    """
+    Structural diff between the models of a policy and the entities currently
+    stored on the server.
+
+    Entities are matched by id and, since the server assigns its own ids on
+    create, by their natural key (policy_id, name). Only the fields in
+    PLAN_FIELDS are compared. With `prune`, server entities that carry one of
+    the policy_ids of the file but are no longer declared are deleted.
+    """
+    plan = PolicyPlan(policy_file=policy_file)
+    desired: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    matched: Dict[str, Dict[str, dict]] = {}
+    policy_ids: Set[str] = set()
+
+    for kind in PLAN_KINDS:
+        id_field = ID_FIELDS[kind]
+        by_id, by_name = _index_current(current.get(kind, []), id_field)
+        desired[kind] = {}
+        matched[kind] = {}
+        for key, model in models.get(kind, {}).items():
+            data = model.model_dump(mode="json", by_alias=True)
+            desired[kind][key] = data
+            if data.get("policy_id"):
+                policy_ids.add(data["policy_id"])
+            doc = by_id.get(key) or by_name.get((data.get("policy_id"), data.get("name")))
+            if doc is not None:
+                matched[kind][key] = doc
+                plan.resolved[node_key(kind, key)] = doc[id_field]
+
+    nodes = [(kind, key) for kind in PLAN_KINDS for key in desired[kind]]
+    for index, layer in enumerate(topological_layers(nodes, graph)):
+        for kind, key in layer:
+            data = desired[kind][key]
+            doc = matched[kind].get(key)
+            if doc is None:
+                plan.actions.append(PlanAction(action="create", kind=kind, key=key, layer=index, payload=data))
+                continue
+            wanted = translate_references(kind, data, plan.resolved)
+            changes = {
+                field: {"from": doc.get(field), "to": wanted[field]}
+                for field in PLAN_FIELDS[kind]
+                if field in wanted and wanted[field] != doc.get(field)
+            }
+            if changes:
+                plan.actions.append(PlanAction(
+                    action="update", kind=kind, key=key, layer=index,
+                    server_id=doc[ID_FIELDS[kind]],
+                    payload={field: data[field] for field in changes},
+                    changes=changes,
+                ))
+            else:
+                plan.unchanged += 1
+
+    if prune and policy_ids:
+        for index, kind in enumerate(DELETE_ORDER):
+            id_field = ID_FIELDS[kind]
+            kept = {doc[id_field] for doc in matched[kind].values()}
+            for doc in current.get(kind, []):
+                if doc.get("policy_id") in policy_ids and doc.get(id_field) not in kept:
+                    plan.actions.append(PlanAction(
+                        action="delete", kind=kind, key=doc[id_field], layer=index, server_id=doc[id_field]
+                    ))
+    return plan
@@ -1,19 +1,52 @@
 from motor.motor_asyncio import AsyncIOMotorCollection
 from cryptomesh.models import ActiveObjectModel
-from cryptomesh.repositories.base_repository import BaseRepository
-from typing import Optional, List
+from cryptomesh.repositories.base_repository import BaseRepository, READ_FLIGHTS
+from cryptomesh.utils.singleflight import coalesced
+from typing import Optional, List, Dict, Any
+
+# Fields that carry the full source code / extracted schema. They are excluded
+# from list and read paths unless explicitly requested.
+HEAVY_FIELDS = ("axo_code", "axo_schema")
+LEAN_PROJECTION = {field: 0 for field in HEAVY_FIELDS}
 
 class ActiveObjectsRepository(BaseRepository):
+    versioned = True
+
     def __init__(self, collection: AsyncIOMotorCollection):
         super().__init__(collection, ActiveObjectModel)
 
-    async def get_by_id(self, active_object_id: str, id_field: str = "active_object_id")-> Optional[ActiveObjectModel]:
-        document = await self.collection.find_one({"active_object_id": active_object_id})
+    @coalesced(READ_FLIGHTS)
+    async def get_by_id(self, active_object_id: str, id_field: str = "active_object_id", projection: Optional[dict] = None)-> Optional[ActiveObjectModel]:
+        document = await self.collection.find_one({"active_object_id": active_object_id}, projection)
         return ActiveObjectModel(**document) if document else None
 
-    async def get_by_filter(self, filter: dict)-> List[ActiveObjectModel]:
+    async def get_by_filter(self, filter: dict, projection: Optional[dict] = None)-> List[ActiveObjectModel]:
         docs = []
-        cursor = self.collection.find(filter)
+        cursor = self.collection.find(filter, projection)
         async for doc in cursor:
             docs.append(ActiveObjectModel(**doc))
-        return docs
\ No newline at end of file
+        return docs
+
+    async def find_fields(self, filter: dict, fields: List[str]) -> List[Dict[str, Any]]:
+        """
+        Sparse fieldset read: returns raw documents containing only `fields`
+        (plus active_object_id) instead of full models.
+        """
+        projection = {"_id": 0, "active_object_id": 1, **{f: 1 for f in fields}}
+        docs = []
+        cursor = self.collection.find(filter, projection)
+        async for doc in cursor:
+            docs.append(doc)
+        return docs
+
+    async def get_code_hash(self, active_object_id: str) -> Optional[Dict[str, Any]]:
+        return await self.collection.find_one(
+            {"active_object_id": active_object_id},
+            {"_id": 0, "axo_code_hash": 1}
+        )
+
+    async def get_code(self, active_object_id: str) -> Optional[Dict[str, Any]]:
+        return await self.collection.find_one(
+            {"active_object_id": active_object_id},
+            {"_id": 0, "axo_code": 1, "axo_code_hash": 1}
+        )
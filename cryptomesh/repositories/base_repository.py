@@ -5,14 +5,53 @@ from pymongo import ReturnDocument
 from pymongo.errors import PyMongoError
 from fastapi import HTTPException
 from cryptomesh.log.logger import get_logger
+from cryptomesh.repositories.versions_repository import CollectionVersionsRepository, VERSIONS_COLLECTION
+from cryptomesh.utils.singleflight import SingleFlight
 
 T = TypeVar("T", bound=BaseModel)
 L = get_logger(__name__)
 
+# Concurrent identical get_by_id reads share one query (see utils.singleflight.coalesced).
+READ_FLIGHTS = SingleFlight("repository_reads")
+# After a write, reads of that collection stop joining queries started before it.
+CollectionVersionsRepository.subscribe(lambda name, token: READ_FLIGHTS.forget(lambda key: key[0] == name))
+
 class BaseRepository(Generic[T]):
+    # Collections that serve ETags or feed in-memory caches bump a collection_versions
+    # counter on every write. Telemetry collections leave this off so their writes
+    # stay a single round-trip.
+    versioned: bool = False
+
     def __init__(self, collection: AsyncIOMotorCollection, model: Type[T]):
         self.collection = collection
         self.model = model
+        self._versions: Optional[CollectionVersionsRepository] = None
+
+    @property
+    def versions(self) -> CollectionVersionsRepository:
+        if self._versions is None:
+            self._versions = CollectionVersionsRepository(self.collection.database[VERSIONS_COLLECTION])
+        return self._versions
+
+    async def touch(self) -> Optional[str]:
+        """
+        Bumps the write counter of a versioned collection (used for ETags and cache
+        invalidation); unversioned collections only drop their coalesced reads.
+        A failed bump raises: the write is done, but keeping the old version would
+        serve stale data behind a valid ETag.
+        """
+        name = self.collection.name
+        if not self.versioned:
+            READ_FLIGHTS.forget(lambda key: key[0] == name)
+            return None
+        try:
+            return await self.versions.bump(name)
+        except PyMongoError as e:
+            L.error({"event": "COLLECTION.VERSION.BUMP.FAIL", "collection": name, "error": str(e)})
+            raise
+
+    async def version_token(self) -> str:
+        return await self.versions.get(self.collection.name)
 
     async def find_one(self, query: dict) -> Optional[T]:
         try:
@@ -26,16 +65,17 @@ class BaseRepository(Generic[T]):
         try:
             result = await self.collection.insert_one(data.model_dump(by_alias=True, exclude_unset=True))
             if result.inserted_id:
+                await self.touch()
                 return data
             return None
         except PyMongoError as e:
             L.error({"error": str(e)})
             raise HTTPException(status_code=500, detail="Database error in create")
 
-    async def get_all(self) -> List[T]:
+    async def get_all(self, projection: Optional[dict] = None) -> List[T]:
         try:
             docs = []
-            cursor = self.collection.find({})
+            cursor = self.collection.find({}, projection)
             async for doc in cursor:
                 docs.append(self.model(**doc))
             return docs
@@ -59,16 +99,58 @@ class BaseRepository(Generic[T]):
                 return_document=ReturnDocument.AFTER
             )
 
-            return self.model(**updated_doc) if updated_doc else None
+            if not updated_doc:
+                return None
+            await self.touch()
+            return self.model(**updated_doc)
 
         except PyMongoError as e:
             L.error({"error": str(e)})
             raise HTTPException(status_code=500, detail="Database error in update")
 
+    async def compare_and_set(self, query: dict, expected: dict, updates: dict, expected_version: Optional[int] = None) -> Optional[T]:
+        """
+        Applies `updates` only if the document matching `query` still has the
+        `expected` field values (and `version`, when given), incrementing its
+        `version` in the same atomic find_one_and_update. Returns None when no
+        document matched: it does not exist or another writer got there first.
+        """
+        condition = {**query, **expected}
+        if expected_version is not None:
+            # Documents written before versioning have no field: they are version 0.
+            condition["version"] = {"$in": [0, None]} if expected_version == 0 else expected_version
+        updates = {k: v for k, v in updates.items() if k not in ("_id", "version")}
+        try:
+            updated_doc = await self.collection.find_one_and_update(
+                condition,
+                {"$set": updates, "$inc": {"version": 1}},
+                return_document=ReturnDocument.AFTER
+            )
+            if not updated_doc:
+                return None
+            await self.touch()
+            return self.model(**updated_doc)
+        except PyMongoError as e:
+            L.error({"error": str(e)})
+            raise HTTPException(status_code=500, detail="Database error in compare_and_set")
+
     async def delete(self, query: dict) -> bool:
         try:
             result = await self.collection.delete_one(query)
-            return result.deleted_count > 0
+            if result.deleted_count > 0:
+                await self.touch()
+                return True
+            return False
         except PyMongoError as e:
             L.error({"error": str(e)})
             raise HTTPException(status_code=500, detail="Database error in delete")
+
+    async def delete_many(self, query: dict) -> int:
+        try:
+            result = await self.collection.delete_many(query)
+            if result.deleted_count > 0:
+                await self.touch()
+            return result.deleted_count
+        except PyMongoError as e:
+            L.error({"error": str(e)})
+            raise HTTPException(status_code=500, detail="Database error in delete_many")
@@ -1,13 +1,37 @@
 # cryptomesh/repositories/endpoint_state_repository.py
 from motor.motor_asyncio import AsyncIOMotorCollection
 from cryptomesh.models import EndpointStateModel
-from cryptomesh.repositories.base_repository import BaseRepository
-from typing import Optional
+from cryptomesh.repositories.base_repository import BaseRepository, READ_FLIGHTS
+from cryptomesh.utils.singleflight import coalesced
+from typing import Any, Dict, List, Optional
+
+# Serves "latest state of each endpoint" as a DISTINCT_SCAN instead of a collection scan.
+LATEST_STATE_INDEX = [("endpoint_id", 1), ("timestamp", -1)]
 
 class EndpointStateRepository(BaseRepository[EndpointStateModel]):
     def __init__(self, collection: AsyncIOMotorCollection):
         super().__init__(collection, EndpointStateModel)
 
+    async def ensure_indexes(self):
+        await self.collection.create_index(LATEST_STATE_INDEX, name="endpoint_id_1_timestamp_-1")
+
+    async def latest_by_endpoint(self, endpoint_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        endpoint_id -> {"state", "timestamp"} of the newest state reported by
+        each of `endpoint_ids`. The $sort matches LATEST_STATE_INDEX so the
+        $group reads one index entry per endpoint.
+        """
+        latest = {}
+        cursor = self.collection.aggregate([
+            {"$match": {"endpoint_id": {"$in": endpoint_ids}}},
+            {"$sort": {"endpoint_id": 1, "timestamp": -1}},
+            {"$group": {"_id": "$endpoint_id", "state": {"$first": "$state"}, "timestamp": {"$first": "$timestamp"}}},
+        ])
+        async for doc in cursor:
+            latest[doc["_id"]] = doc
+        return latest
+
+    @coalesced(READ_FLIGHTS)
     async def get_by_id(self, state_id: str, id_field: str = "state_id") -> Optional[EndpointStateModel]:
         document = await self.collection.find_one({"state_id": state_id})
         return EndpointStateModel(**document) if document else None
@@ -1,16 +1,24 @@
 # cryptomesh/repositories/endpoints_repository.py
 from motor.motor_asyncio import AsyncIOMotorCollection
 from cryptomesh.models import EndpointModel
-from cryptomesh.repositories.base_repository import BaseRepository
-from typing import Optional
+from cryptomesh.repositories.base_repository import BaseRepository, READ_FLIGHTS
+from cryptomesh.utils.singleflight import coalesced
+from typing import List, Optional
 
 class EndpointsRepository(BaseRepository[EndpointModel]):
+    versioned = True
+
     def __init__(self, collection: AsyncIOMotorCollection):
         super().__init__(collection, EndpointModel)
 
+    @coalesced(READ_FLIGHTS)
     async def get_by_id(self, endpoint_id: str, id_field: str = "endpoint_id") -> Optional[EndpointModel]:
         document = await self.collection.find_one({"endpoint_id": endpoint_id})
         return EndpointModel(**document) if document else None
 
-
-
+    async def get_many(self, endpoint_ids: List[str]) -> List[EndpointModel]:
+        docs = []
+        cursor = self.collection.find({"endpoint_id": {"$in": list(endpoint_ids)}})
+        async for doc in cursor:
+            docs.append(EndpointModel(**doc))
+        return docs
@@ -1,12 +1,16 @@
 from motor.motor_asyncio import AsyncIOMotorCollection
 from cryptomesh.models import FunctionModel
-from cryptomesh.repositories.base_repository import BaseRepository
+from cryptomesh.repositories.base_repository import BaseRepository, READ_FLIGHTS
+from cryptomesh.utils.singleflight import coalesced
 from typing import Optional
 
 class FunctionsRepository(BaseRepository[FunctionModel]):
+    versioned = True
+
     def __init__(self, collection: AsyncIOMotorCollection):
         super().__init__(collection, FunctionModel)
 
+    @coalesced(READ_FLIGHTS)
     async def get_by_id(self, function_id: str, id_field: str = "function_id") -> Optional[FunctionModel]:
         document = await self.collection.find_one({"function_id": function_id})
         return FunctionModel(**document) if document else None
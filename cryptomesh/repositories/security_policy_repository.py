@@ -1,12 +1,16 @@
 from motor.motor_asyncio import AsyncIOMotorCollection
 from cryptomesh.models import SecurityPolicyModel
-from cryptomesh.repositories.base_repository import BaseRepository
+from cryptomesh.repositories.base_repository import BaseRepository, READ_FLIGHTS
+from cryptomesh.utils.singleflight import coalesced
 from typing import Optional
 
 class SecurityPolicyRepository(BaseRepository[SecurityPolicyModel]):
+    versioned = True
+
     def __init__(self, collection: AsyncIOMotorCollection):
         super().__init__(collection, SecurityPolicyModel)
 
+    @coalesced(READ_FLIGHTS)
     async def get_by_id(self, sp_id: str, id_field: str = "sp_id") -> Optional[SecurityPolicyModel]:
         # Llama al método base directamente sin super()
         document = await self.collection.find_one({"sp_id": sp_id})
@@ -1,12 +1,16 @@
 from motor.motor_asyncio import AsyncIOMotorCollection
 from cryptomesh.models import ServiceModel
-from cryptomesh.repositories.base_repository import BaseRepository
+from cryptomesh.repositories.base_repository import BaseRepository, READ_FLIGHTS
+from cryptomesh.utils.singleflight import coalesced
 from typing import Optional
 
 class ServicesRepository(BaseRepository[ServiceModel]):
+    versioned = True
+
     def __init__(self, collection: AsyncIOMotorCollection):
         super().__init__(collection, ServiceModel)
 
+    @coalesced(READ_FLIGHTS)
     async def get_by_id(self, service_id: str, id_field: str = "service_id") -> Optional[ServiceModel]:
         document = await self.collection.find_one({id_field: service_id})
         return ServiceModel(**document) if document else None
@@ -16,6 +20,8 @@ class ServicesRepository(BaseRepository[ServiceModel]):
             {"service_id": service_id},
             {"$addToSet": {"microservices": microservice_id}}
         )
+        if result.modified_count:
+            await self.touch()
         return result
 
     async def update_pull_microservice(self, service_id: str, microservice_id: str):
@@ -23,5 +29,7 @@ class ServicesRepository(BaseRepository[ServiceModel]):
             {"service_id": service_id},
             {"$pull": {"microservices": microservice_id}}
         )
+        if result.modified_count:
+            await self.touch()
         return result
 
@@ -0,0 +1,42 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+REVOCATIONS_COLLECTION = "token_revocations"
+
+class TokenRevocationsRepository:
+    """
+    Revoked credentials, shared by every API worker.
+
+    Each document looks like {"_id": "<kind>:<value>", "kind": "token" | "jti" | "subject",
+    "value": <str>, "revoked_at": <epoch seconds>, "expires_at": <datetime>}, where
+    token values are SHA-256 hashes (raw tokens are never stored). A TTL index on
+    expires_at lets MongoDB drop a revocation once everything it blocks has expired;
+    documents without expires_at (tokens that never expire) are kept.
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection):
+        self.collection = collection
+
+    async def ensure_indexes(self):
+        await self.collection.create_index("expires_at", expireAfterSeconds=0, name="expires_at_ttl")
+        await self.collection.create_index("revoked_at", name="revoked_at_1")
+
+    async def add(self, kind: str, value: str, revoked_at: float, expires_at: Optional[float] = None):
+        doc: Dict[str, Any] = {"_id": f"{kind}:{value}", "kind": kind, "value": value, "revoked_at": revoked_at}
+        if expires_at is not None:
+            doc["expires_at"] = datetime.fromtimestamp(expires_at, tz=timezone.utc)
+        await self.collection.replace_one({"_id": doc["_id"]}, doc, upsert=True)
+
+    async def since(self, revoked_at: float) -> List[Dict[str, Any]]:
+        """
+        Revocations made at or after `revoked_at`, with expires_at as epoch seconds (or None).
+        """
+        docs = []
+        async for doc in self.collection.find({"revoked_at": {"$gte": revoked_at}}):
+            expires_at = doc.get("expires_at")
+            if isinstance(expires_at, datetime):
+                # Naive datetimes read back from MongoDB are UTC.
+                expires_at = (expires_at if expires_at.tzinfo else expires_at.replace(tzinfo=timezone.utc)).timestamp()
+            docs.append({**doc, "expires_at": expires_at})
+        return docs
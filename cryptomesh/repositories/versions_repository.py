@@ -0,0 +1,80 @@
+import uuid
+from typing import Callable, Dict, List, Tuple
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ReturnDocument
+
+VERSIONS_COLLECTION = "collection_versions"
+VersionListener = Callable[[str, str], None]
+
+class CollectionVersionsRepository:
+    """
+    Monotonic per-collection write counters used to build ETags.
+
+    Each document looks like {"_id": <collection>, "version": <int>, "epoch": <uuid>}.
+    The epoch is generated when the counter is first created, so dropping the
+    database never makes an old ETag valid again.
+    """
+    listeners: List[VersionListener] = []
+    # collection -> last token bumped by this process
+    local_tokens: Dict[str, str] = {}
+
+    def __init__(self, collection: AsyncIOMotorCollection):
+        self.collection = collection
+
+    @classmethod
+    def subscribe(cls, listener: VersionListener):
+        """
+        Registers a callback invoked as listener(collection_name, token) after
+        every local bump, and after bumps of other processes seen by poll_versions.
+        """
+        cls.listeners.append(listener)
+
+    @classmethod
+    def notify(cls, name: str, token: str):
+        for listener in cls.listeners:
+            listener(name, token)
+
+    async def bump(self, name: str) -> str:
+        doc = await self.collection.find_one_and_update(
+            {"_id": name},
+            {"$inc": {"version": 1}, "$setOnInsert": {"epoch": uuid.uuid4().hex[:8]}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        token = self.token(doc)
+        self.local_tokens[name] = token
+        self.notify(name, token)
+        return token
+
+    async def get_all(self) -> Dict[str, str]:
+        return {doc["_id"]: self.token(doc) async for doc in self.collection.find({})}
+
+    async def get_many(self, names: List[str]) -> Dict[str, str]:
+        tokens = {name: "0" for name in names}
+        cursor = self.collection.find({"_id": {"$in": names}})
+        async for doc in cursor:
+            tokens[doc["_id"]] = self.token(doc)
+        return tokens
+
+    async def get(self, name: str) -> str:
+        return (await self.get_many([name]))[name]
+
+    @staticmethod
+    def token(doc: dict) -> str:
+        return f"{doc.get('epoch', '0')}.{doc.get('version', 0)}"
+
+    @staticmethod
+    def parse(token: str) -> Tuple[str, int]:
+        epoch, _, version = token.rpartition(".")
+        return epoch, int(version or 0)
+
+    @classmethod
+    def follows(cls, previous: str, current: str) -> bool:
+        """
+        True when `current` is the write immediately after `previous`.
+        """
+        prev_epoch, prev_version = cls.parse(previous)
+        epoch, version = cls.parse(current)
+        if prev_version == 0:
+            return version == 1
+        return epoch == prev_epoch and version == prev_version + 1
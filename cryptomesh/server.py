@@ -1,8 +1,25 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 import cryptomesh.controllers as Controllers
 import uvicorn
+import asyncio
 from contextlib import asynccontextmanager
-from cryptomesh.db import connect_to_mongo,close_mongo_connection
+from cryptomesh.db import connect_to_mongo,close_mongo_connection,get_collection,get_database
+from cryptomesh.policies.importer import PolicyImporter
+from cryptomesh.repositories.endpoint_state_repository import EndpointStateRepository
+from cryptomesh.cache.change_streams import watch_invalidations
+from cryptomesh.cache.version_polling import VersionPoller
+from cryptomesh.repositories.versions_repository import CollectionVersionsRepository, VERSIONS_COLLECTION
+from cryptomesh.services.security_policy_service import POLICY_CACHE
+from cryptomesh.services.roles_service import ROLE_CACHE
+from cryptomesh.services.hierarchy_service import HIERARCHY_SNAPSHOT
+from cryptomesh.auth import authorize
+from cryptomesh.auth.dependencies import TOKEN_VERIFIER, revocations_store
+from cryptomesh.storage import BLOB_RECLAIMER
+from cryptomesh.gateway import INVOCATION_GATEWAY
+from cryptomesh.admission import AdmissionMiddleware
+from cryptomesh.health import HEALTH_MONITOR, default_checks
+from cryptomesh.services.endpoints_services import summoner_params_from_env
+from cryptomesh.controllers.activeobjects_controller import storage_service
 import time as T
 from cryptomesh.log.logger import get_logger
 from cryptomesh import config
@@ -21,10 +38,49 @@ async def lifespan(app: FastAPI):
         "event":"DB.CONNECTED",
         "time":T.time() - t1 
     })
+    try:
+        await PolicyImporter(get_database()).ensure_indexes()
+        await revocations_store().ensure_indexes()
+        await EndpointStateRepository(get_collection("endpoint_states")).ensure_indexes()
+    except Exception as e:
+        L.error({"event": "DB.INDEXES.FAIL", "error": str(e)})
+    # Revocations made while this worker was down are enforced from the first request.
+    await TOKEN_VERIFIER.maintain(force=True)
+    try:
+        await HIERARCHY_SNAPSHOT.rebuild()
+    except Exception as e:
+        # The snapshot is built lazily on the first /hierarchy request otherwise.
+        L.error({"event": "HIERARCHY.SNAPSHOT.BUILD.FAIL", "error": str(e)})
+    try:
+        BLOB_RECLAIMER.start(storage_service())
+    except Exception as e:
+        # Deleted blobs stay queued until the reclaimer can be bound to a store.
+        L.error({"event": "BLOB.RECLAIMER.START.FAIL", "error": str(e)})
+    # /readyz answers from the results of these background checks.
+    HEALTH_MONITOR.start(default_checks(summoner_params_from_env()))
+    watchers = []
+    if config.CRYPTO_MESH_VERSION_POLL_INTERVAL > 0:
+        # Writes made by other workers or replicas invalidate this process's caches too.
+        poller = VersionPoller(CollectionVersionsRepository(get_collection(VERSIONS_COLLECTION)), config.CRYPTO_MESH_VERSION_POLL_INTERVAL)
+        watchers.append(asyncio.create_task(poller.run()))
+    if config.CRYPTO_MESH_CACHE_CHANGE_STREAMS:
+        watchers += [
+            asyncio.create_task(watch_invalidations(get_collection("security_policies"), POLICY_CACHE, "sp_id")),
+            asyncio.create_task(watch_invalidations(get_collection("roles"), ROLE_CACHE, "role_id")),
+        ]
     yield 
+    await HEALTH_MONITOR.stop()
+    for task in watchers:
+        task.cancel()
+    await BLOB_RECLAIMER.stop()
+    await INVOCATION_GATEWAY.close()
     await close_mongo_connection()
 
-app = FastAPI(title=config.CRYPTO_MESH_TITLE,lifespan=lifespan)
+# Every API route goes through the authorization dependency (a no-op unless CRYPTO_MESH_AUTH_ENABLED).
+app = FastAPI(title=config.CRYPTO_MESH_TITLE,lifespan=lifespan,dependencies=[Depends(authorize)])
+# Bounded concurrency per route class; added before CORS so shed responses still carry CORS headers.
+if config.CRYPTO_MESH_ADMISSION_ENABLED:
+    app.add_middleware(AdmissionMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173","*"],            # exact matches only, use ["*"] to allow all (not recommended in prod)
@@ -46,6 +102,11 @@ app.include_router(Controllers.roles_router, prefix=config.CRYPTO_MESH_API_PREFI
 app.include_router(Controllers.endpoint_state_router, prefix=config.CRYPTO_MESH_API_PREFIX, tags=["Endpoint State"])
 app.include_router(Controllers.function_state_router, prefix=config.CRYPTO_MESH_API_PREFIX, tags=["Function State"])
 app.include_router(Controllers.function_result_router, prefix=config.CRYPTO_MESH_API_PREFIX, tags=["Function Result"])
+app.include_router(Controllers.policies_router, prefix=config.CRYPTO_MESH_API_PREFIX, tags=["Policies"])
+app.include_router(Controllers.auth_router, prefix=config.CRYPTO_MESH_API_PREFIX, tags=["Auth"])
+app.include_router(Controllers.blobs_router, prefix=config.CRYPTO_MESH_API_PREFIX, tags=["Blobs"])
+# Probes live outside the API prefix, next to the orchestrator defaults.
+app.include_router(Controllers.health_router, tags=["Health"])
 if __name__ == "__main__":
     uvicorn.run(app, host=config.CRYPTO_MESH_HOST, port=config.CRYPTO_MESH_PORT)
 
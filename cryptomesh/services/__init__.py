@@ -8,4 +8,6 @@ from cryptomesh.services.roles_service import RolesService
 from cryptomesh.services.security_policy_service import SecurityPolicyService
 from cryptomesh.services.services_services import ServicesService
 from cryptomesh.services.storage_service import StorageService
-from cryptomesh.services.activeobjects_service import ActiveObjectsService
\ No newline at end of file
+from cryptomesh.services.activeobjects_service import ActiveObjectsService
+from cryptomesh.services.deployment_service import DeploymentService
+from cryptomesh.services.placement_service import PlacementService
@@ -1,10 +1,12 @@
 import time as T
-from typing import List,Dict
+from typing import List,Dict,Any,Optional,Set,Tuple
 import ast
+import asyncio
+import copy
 from datetime import datetime, timezone
 
 from cryptomesh.models import ActiveObjectModel, FunctionModel, ParameterSpec
-from cryptomesh.repositories.activeobjects_repository import ActiveObjectsRepository
+from cryptomesh.repositories.activeobjects_repository import ActiveObjectsRepository, LEAN_PROJECTION
 from cryptomesh.log.logger import get_logger
 from cryptomesh.errors import (
     CryptoMeshError,
@@ -12,24 +14,76 @@ from cryptomesh.errors import (
     ValidationError,
     CreationError,
 )
-from cryptomesh.dtos import SchemaDTO
+from cryptomesh.dtos import SchemaDTO, ActiveObjectResponseDTO
 from cryptomesh.utils import Utils
+from cryptomesh.services.hierarchy_service import HierarchySnapshot, HIERARCHY_SNAPSHOT
+from cryptomesh.storage.reclaimer import BlobReclaimer, BLOB_RECLAIMER
+from cryptomesh.utils.singleflight import SingleFlight
 
 
 L = get_logger(__name__)
 
+SCHEMA_FLIGHTS = SingleFlight("schema_extraction")
+
+
+async def extract_schema(code: str, code_hash: str) -> Dict[str, Any]:
+    """
+    Parses the schema of `code` in a worker thread. Concurrent requests for
+    the same code (e.g. a burst of deploys of one class) parse it only once.
+    """
+    return await SCHEMA_FLIGHTS.do(
+        code_hash,
+        lambda: asyncio.to_thread(lambda: Utils.extract_schema_from_code(code).model_dump()),
+        copy=copy.deepcopy
+    )
+
 
 class ActiveObjectsService:
     """
     Servicio encargado de gestionar los Active Objects en la base de datos.
     """
 
-    def __init__(self, repository: ActiveObjectsRepository):
+    def __init__(
+        self,
+        repository: ActiveObjectsRepository,
+        hierarchy: Optional[HierarchySnapshot] = None,
+        reclaimer: Optional[BlobReclaimer] = None,
+    ):
         self.repository = repository
+        self.hierarchy = hierarchy or HIERARCHY_SNAPSHOT
+        self.reclaimer = reclaimer or BLOB_RECLAIMER
 
     # ----------------------------
     # Helpers
     # ----------------------------
+    async def shared_storage(self, deleted: List[ActiveObjectModel]) -> Set[Tuple[str, Optional[str]]]:
+        """
+        Buckets (bucket_id, None), code objects and artifacts (bucket_id, key)
+        of `deleted` that active objects still in the database reference, so
+        the reclaimer leaves them alone. Call it after the deleted metadata is gone.
+        """
+        buckets = list({b for ao in deleted for b in (ao.axo_source_bucket_id, ao.axo_sink_bucket_id)})
+        code_buckets = list({ao.axo_bucket_id for ao in deleted})
+        artifact_buckets = list({ref.bucket_id for ao in deleted for ref in ao.axo_artifacts})
+        clauses: List[dict] = [
+            {"axo_source_bucket_id": {"$in": buckets}},
+            {"axo_sink_bucket_id": {"$in": buckets}},
+            {"axo_bucket_id": {"$in": code_buckets}},
+        ]
+        if artifact_buckets:
+            clauses.append({"axo_artifacts.bucket_id": {"$in": artifact_buckets}})
+        remaining = await self.repository.find_fields(
+            {"$or": clauses},
+            ["axo_source_bucket_id", "axo_sink_bucket_id", "axo_bucket_id", "axo_key", "axo_artifacts"]
+        )
+        in_use: Set[Tuple[str, Optional[str]]] = set()
+        for doc in remaining:
+            in_use.add((doc.get("axo_source_bucket_id"), None))
+            in_use.add((doc.get("axo_sink_bucket_id"), None))
+            in_use.add((doc.get("axo_bucket_id"), doc.get("axo_key")))
+            in_use.update((ref.get("bucket_id"), ref.get("key")) for ref in doc.get("axo_artifacts") or [])
+        return in_use
+
     @staticmethod
     def normalize_functions(functions) -> List[dict]:
         """
@@ -45,9 +99,38 @@ class ActiveObjectsService:
                 raise TypeError(f"Invalid function type: {type(f)}")
         return normalized
 
+    @staticmethod
+    def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+        """
+        Parses a comma separated sparse fieldset (?fields=a,b) and validates it
+        against the fields exposed by ActiveObjectResponseDTO.
+        """
+        if not fields:
+            return None
+        parsed = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [f for f in parsed if f not in ActiveObjectResponseDTO.model_fields]
+        if unknown:
+            raise ValidationError(f"Unknown active object fields: {', '.join(unknown)}")
+        return parsed
+
+    @staticmethod
+    def _normalize_model_functions(ao: ActiveObjectModel) -> ActiveObjectModel:
+        if ao.functions:
+            ao.functions = [
+                f if isinstance(f, FunctionModel) else FunctionModel(**f)
+                for f in ao.functions
+            ]
+        return ao
+
+    async def collection_version(self) -> str:
+        """
+        Version token of the underlying collection; changes on every write (used for ETags).
+        """
+        return await self.repository.version_token()
+
     async def create_active_object(self, active_object: ActiveObjectModel) -> ActiveObjectModel:
         t1 = T.time()
-        if await self.repository.get_by_id(active_object.active_object_id, id_field="active_object_id"):
+        if await self.repository.get_by_id(active_object.active_object_id, id_field="active_object_id", projection=LEAN_PROJECTION):
             elapsed = round(T.time() - t1, 4)
             L.error({
                 "event": "ACTIVE_OBJECT.CREATE.FAIL",
@@ -59,8 +142,9 @@ class ActiveObjectsService:
 
         if active_object.axo_code:
             try:
+                active_object.axo_code_hash = Utils.hash_code(active_object.axo_code)
                 # Generar axo_schema y functions
-                active_object.axo_schema = Utils.extract_schema_from_code(active_object.axo_code).model_dump()
+                active_object.axo_schema = await extract_schema(active_object.axo_code, active_object.axo_code_hash)
                 
                 functions = Utils.extract_functions_from_code(active_object.axo_code)
                 active_object.functions = [
@@ -83,6 +167,7 @@ class ActiveObjectsService:
 
         if not created:
             raise CreationError(f"Failed to create ActiveObject '{active_object.active_object_id}'")
+        self.hierarchy.upsert_active_object(created)
 
         L.info({
             "event": "ACTIVE_OBJECT.CREATED",
@@ -91,36 +176,63 @@ class ActiveObjectsService:
         })
         return created
 
-    async def list_active_objects(self) -> List[ActiveObjectModel]:
-        aos = await self.repository.get_all()
-        for ao in aos:
-            if ao.functions:
-                ao.functions = [
-                    f if isinstance(f, FunctionModel) else FunctionModel(**f)
-                    for f in ao.functions
-                ]
-        return aos
+    async def list_active_objects(self, include_heavy: bool = False) -> List[ActiveObjectModel]:
+        """
+        Lists active objects. axo_code and axo_schema are left out unless include_heavy is set.
+        """
+        aos = await self.repository.get_all(projection=None if include_heavy else LEAN_PROJECTION)
+        return [self._normalize_model_functions(ao) for ao in aos]
+
+    async def list_active_objects_fields(self, fields: List[str]) -> List[Dict[str, Any]]:
+        return await self.repository.find_fields({}, fields)
 
-    async def get_active_object(self, active_object_id: str) -> ActiveObjectModel:
-        ao = await self.repository.get_by_id(active_object_id, id_field="active_object_id")
+    async def get_active_object(self, active_object_id: str, include_heavy: bool = True) -> ActiveObjectModel:
+        ao = await self.repository.get_by_id(
+            active_object_id,
+            id_field="active_object_id",
+            projection=None if include_heavy else LEAN_PROJECTION
+        )
         if not ao:
             raise NotFoundError(active_object_id)
+        return self._normalize_model_functions(ao)
 
-        if ao.functions:
-            ao.functions = [
-                f if isinstance(f, FunctionModel) else FunctionModel(**f)
-                for f in ao.functions
-            ]
-        return ao
+    async def get_active_object_fields(self, active_object_id: str, fields: List[str]) -> Dict[str, Any]:
+        docs = await self.repository.find_fields({"active_object_id": active_object_id}, fields)
+        if not docs:
+            raise NotFoundError(active_object_id)
+        return docs[0]
+
+    async def get_code_hash(self, active_object_id: str) -> Optional[str]:
+        """
+        Returns only the stored hash of axo_code, without transferring the code itself.
+        """
+        doc = await self.repository.get_code_hash(active_object_id)
+        if doc is None:
+            raise NotFoundError(active_object_id)
+        return doc.get("axo_code_hash")
+
+    async def get_code(self, active_object_id: str) -> Tuple[str, str]:
+        """
+        Returns (axo_code, axo_code_hash). Documents created before the hash was
+        stored get it computed on the fly.
+        """
+        doc = await self.repository.get_code(active_object_id)
+        if doc is None:
+            raise NotFoundError(active_object_id)
+        code = doc.get("axo_code")
+        if not code:
+            raise NotFoundError(f"{active_object_id}/code")
+        return code, doc.get("axo_code_hash") or Utils.hash_code(code)
 
     async def update_active_object(self, active_object_id: str, updates: dict) -> ActiveObjectModel:
-        ao_exist = await self.repository.get_by_id(active_object_id, id_field="active_object_id")
+        ao_exist = await self.repository.get_by_id(active_object_id, id_field="active_object_id", projection=LEAN_PROJECTION)
         if not ao_exist:
             raise NotFoundError(active_object_id)
 
         if "axo_code" in updates and updates["axo_code"]:
             try:
-                updates["axo_schema"] = Utils.extract_schema_from_code(updates["axo_code"]).model_dump()
+                updates["axo_code_hash"] = Utils.hash_code(updates["axo_code"])
+                updates["axo_schema"] = await extract_schema(updates["axo_code"], updates["axo_code_hash"])
                 functions             = Utils.extract_functions_from_code(updates["axo_code"])
                 functions_dicts       = [ fo.model_dump() for fo in functions]
                 updates["functions"]  = self.normalize_functions(functions_dicts)
@@ -130,15 +242,49 @@ class ActiveObjectsService:
         updated = await self.repository.update({"active_object_id": active_object_id}, updates)
         if not updated:
             raise CryptoMeshError(f"Failed to update ActiveObject '{active_object_id}'")
+        self.hierarchy.upsert_active_object(updated)
         return updated
 
     async def delete_active_object(self, active_object_id: str) -> dict:
-        if not await self.repository.get_by_id(active_object_id, id_field="active_object_id"):
+        existing = await self.repository.get_by_id(active_object_id, id_field="active_object_id", projection=LEAN_PROJECTION)
+        if not existing:
             raise NotFoundError(active_object_id)
         success = await self.repository.delete({"active_object_id": active_object_id})
         if not success:
             raise CryptoMeshError(f"Failed to delete ActiveObject '{active_object_id}'")
+        self.hierarchy.remove_active_object(active_object_id)
+        # Blobs are removed in the background once the metadata is gone.
+        self.reclaimer.enqueue_active_objects([existing], await self.shared_storage([existing]))
         return {"detail": f"ActiveObject '{active_object_id}' deleted"}
 
-    async def list_by_microservice(self, microservice_id: str) -> List[ActiveObjectModel]:
-        return await self.repository.get_by_filter({"axo_microservice_id": microservice_id})
+    async def delete_by_microservices(self, microservice_ids: List[str]) -> int:
+        """
+        Cascade used by microservice and service deletes: removes every active
+        object of `microservice_ids` and queues their blobs for reclamation.
+        """
+        if not microservice_ids:
+            return 0
+        t1 = T.time()
+        query = {"axo_microservice_id": {"$in": microservice_ids}}
+        active_objects = await self.repository.get_by_filter(query, projection=LEAN_PROJECTION)
+        if not active_objects:
+            return 0
+        deleted = await self.repository.delete_many(
+            {"active_object_id": {"$in": [ao.active_object_id for ao in active_objects]}}
+        )
+        for ao in active_objects:
+            self.hierarchy.remove_active_object(ao.active_object_id)
+        self.reclaimer.enqueue_active_objects(active_objects, await self.shared_storage(active_objects))
+        L.info({
+            "event": "ACTIVE_OBJECT.CASCADE.DELETED",
+            "microservice_ids": microservice_ids,
+            "count": deleted,
+            "time": round(T.time() - t1, 4)
+        })
+        return deleted
+
+    async def list_by_microservice(self, microservice_id: str, include_heavy: bool = False) -> List[ActiveObjectModel]:
+        return await self.repository.get_by_filter(
+            {"axo_microservice_id": microservice_id},
+            projection=None if include_heavy else LEAN_PROJECTION
+        )
@@ -0,0 +1,208 @@
+import asyncio
+import time as T
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set
+
+from option import Result
+from pydantic import BaseModel, Field
+
+from cryptomesh import config
+from cryptomesh.errors import NotFoundError, ValidationError
+from cryptomesh.log.logger import get_logger
+from cryptomesh.models import ActiveObjectModel, EndpointModel
+from cryptomesh.repositories.activeobjects_repository import ActiveObjectsRepository, LEAN_PROJECTION
+from cryptomesh.repositories.endpoints_repository import EndpointsRepository
+from cryptomesh.utils.dag import topological_layers
+
+if TYPE_CHECKING:
+    from cryptomesh.services.placement_service import PlacementService
+
+L = get_logger(__name__)
+
+# deploy(endpoint_id, endpoint ids it depends on) -> Result (EndpointsService.deploy)
+EndpointDeployer = Callable[[str, List[str]], Awaitable[Result]]
+
+
+def node_key(kind: str, node_id: str) -> str:
+    return f"{kind}/{node_id}"
+
+
+def endpoint_env_dependencies(endpoint: EndpointModel) -> List[str]:
+    """
+    Endpoint ids listed in AXO_ENDPOINT_DEPENDENCIES (semicolon-separated).
+    """
+    raw = (endpoint.envs or {}).get("AXO_ENDPOINT_DEPENDENCIES", "")
+    return [dep.strip() for dep in raw.split(";") if dep.strip()]
+
+
+class DeploymentPlan(BaseModel):
+    """
+    Deployment order of a set of active objects, their dependencies and the
+    endpoints hosting them. Nodes are "active_objects/<id>" or "endpoints/<id>";
+    the nodes of one layer only depend on previous layers.
+    """
+    roots: List[str]
+    layers: List[List[str]] = Field(default_factory=list)
+    dependencies: Dict[str, List[str]] = Field(default_factory=dict)
+    # endpoint_id -> endpoints it must be able to reach (AXO_ENDPOINT_DEPENDENCIES)
+    endpoint_dependencies: Dict[str, List[str]] = Field(default_factory=dict)
+
+    @property
+    def nodes(self) -> List[str]:
+        return [node for layer in self.layers for node in layer]
+
+
+class DeploymentService:
+    """
+    Resolves axo_dependencies across active objects and endpoints into a DAG
+    and brings it up layer by layer, deploying the nodes of a layer
+    concurrently.
+
+    An active object depends on the endpoint that hosts it and on the active
+    objects it lists in axo_dependencies (by id or alias); its endpoint
+    therefore depends on the endpoints of those objects, plus the ones in
+    its own AXO_ENDPOINT_DEPENDENCIES. Endpoints are deployed through
+    `deploy_endpoint`; an active object is ready once its endpoint and its
+    dependencies are.
+    """
+
+    def __init__(
+        self,
+        activeobjects: ActiveObjectsRepository,
+        endpoints: EndpointsRepository,
+        deploy_endpoint: EndpointDeployer,
+        concurrency: Optional[int] = None,
+        placement: Optional["PlacementService"] = None,
+    ):
+        self.activeobjects   = activeobjects
+        self.endpoints       = endpoints
+        self.deploy_endpoint = deploy_endpoint
+        self.concurrency     = concurrency or config.CRYPTO_MESH_DEPLOY_CONCURRENCY
+        self.placement       = placement
+
+    async def _load_active_objects(self, refs: List[str]) -> Dict[str, ActiveObjectModel]:
+        """
+        Active objects reachable from `refs` through axo_dependencies, by id.
+        Dependencies may name an object by id or by alias.
+        """
+        found: Dict[str, ActiveObjectModel] = {}
+        resolved: Dict[str, str] = {}
+        pending = list(dict.fromkeys(refs))
+        while pending:
+            docs = await self.activeobjects.get_by_filter(
+                {"$or": [{"active_object_id": {"$in": pending}}, {"axo_alias": {"$in": pending}}]},
+                projection=LEAN_PROJECTION
+            )
+            for ao in docs:
+                found[ao.active_object_id] = ao
+                resolved[ao.active_object_id] = ao.active_object_id
+                if ao.axo_alias:
+                    resolved.setdefault(ao.axo_alias, ao.active_object_id)
+            missing = [ref for ref in pending if ref not in resolved]
+            if missing:
+                raise NotFoundError(f"active_objects/{', '.join(missing)}")
+            pending = list(dict.fromkeys(
+                dep for ao in docs for dep in ao.axo_dependencies if dep not in resolved
+            ))
+        for ao in found.values():
+            ao.axo_dependencies = [resolved[dep] for dep in ao.axo_dependencies]
+        return found
+
+    async def _load_endpoints(self, endpoint_ids: List[str]) -> Dict[str, EndpointModel]:
+        found: Dict[str, EndpointModel] = {}
+        pending = list(dict.fromkeys(endpoint_ids))
+        while pending:
+            docs = await self.endpoints.get_many(pending)
+            for endpoint in docs:
+                found[endpoint.endpoint_id] = endpoint
+            missing = [endpoint_id for endpoint_id in pending if endpoint_id not in found]
+            if missing:
+                raise NotFoundError(f"endpoints/{', '.join(missing)}")
+            pending = list(dict.fromkeys(
+                dep for endpoint in docs for dep in endpoint_env_dependencies(endpoint) if dep not in found
+            ))
+        return found
+
+    async def plan(self, active_object_ids: List[str]) -> DeploymentPlan:
+        """
+        Builds the DAG of `active_object_ids` and everything they depend on.
+        Objects without an endpoint are placed first when a PlacementService is
+        given (ValidationError otherwise). Raises NotFoundError for unknown
+        references and DependencyCycleError for cycles.
+        """
+        aos = await self._load_active_objects(active_object_ids)
+        unplaced = sorted(ao_id for ao_id, ao in aos.items() if not ao.axo_endpoint_id)
+        if unplaced and self.placement is not None:
+            for ao_id in unplaced:
+                aos[ao_id].axo_endpoint_id = (await self.placement.place(ao_id)).endpoint_id
+            unplaced = []
+        if unplaced:
+            raise ValidationError(f"Active objects without axo_endpoint_id: {', '.join(unplaced)}")
+        endpoints = await self._load_endpoints([ao.axo_endpoint_id for ao in aos.values()])
+
+        endpoint_deps: Dict[str, Set[str]] = {
+            endpoint_id: set(endpoint_env_dependencies(endpoint)) for endpoint_id, endpoint in endpoints.items()
+        }
+        graph: Dict[str, Set[str]] = {}
+        for ao_id, ao in aos.items():
+            graph[node_key("active_objects", ao_id)] = {node_key("endpoints", ao.axo_endpoint_id)} | {
+                node_key("active_objects", dep) for dep in ao.axo_dependencies
+            }
+            endpoint_deps[ao.axo_endpoint_id] |= {aos[dep].axo_endpoint_id for dep in ao.axo_dependencies}
+        for endpoint_id, deps in endpoint_deps.items():
+            deps.discard(endpoint_id)
+            graph[node_key("endpoints", endpoint_id)] = {node_key("endpoints", dep) for dep in deps}
+
+        nodes = [node_key("endpoints", e) for e in endpoints] + [node_key("active_objects", a) for a in aos]
+        return DeploymentPlan(
+            roots                 = list(active_object_ids),
+            layers                = topological_layers(nodes, graph),
+            dependencies          = {node: sorted(deps) for node, deps in graph.items()},
+            endpoint_dependencies = {endpoint_id: sorted(deps) for endpoint_id, deps in endpoint_deps.items()},
+        )
+
+    async def _deploy_node(self, plan: DeploymentPlan, node: str, layer: int, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        kind, node_id = node.split("/", 1)
+        t1 = T.time()
+        event = {"node": node, "kind": kind, "id": node_id, "layer": layer}
+        try:
+            if kind == "endpoints":
+                async with semaphore:
+                    res = await self.deploy_endpoint(node_id, plan.endpoint_dependencies.get(node_id, []))
+                if res.is_err:
+                    return {**event, "event": "node.failed", "error": str(res.unwrap_err()), "time": round(T.time() - t1, 4)}
+            return {**event, "event": "node.deployed", "time": round(T.time() - t1, 4)}
+        except Exception as e:
+            return {**event, "event": "node.failed", "error": str(e), "time": round(T.time() - t1, 4)}
+
+    async def execute(self, plan: DeploymentPlan) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Deploys `plan` layer by layer and yields a progress event per step:
+        plan, layer.started, node.deployed / node.failed (as each node
+        finishes), node.skipped for the layers after a failure, and a final
+        deployment.finished summary.
+        """
+        t1 = T.time()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        counts = {"deployed": 0, "failed": 0, "skipped": 0}
+        yield {"event": "plan", "roots": plan.roots, "layers": plan.layers}
+        failed = False
+        for index, layer in enumerate(plan.layers):
+            if failed:
+                # Dependents of a failed node would not come up correctly.
+                for node in layer:
+                    counts["skipped"] += 1
+                    yield {"event": "node.skipped", "node": node, "layer": index}
+                continue
+            yield {"event": "layer.started", "layer": index, "nodes": layer}
+            for finished in asyncio.as_completed([self._deploy_node(plan, node, index, semaphore) for node in layer]):
+                event = await finished
+                if event["event"] == "node.failed":
+                    failed = True
+                    counts["failed"] += 1
+                    L.error({"event": "DEPLOYMENT.NODE.FAIL", "node": event["node"], "error": event["error"]})
+                else:
+                    counts["deployed"] += 1
+                yield event
+        elapsed = round(T.time() - t1, 4)
+        L.info({"event": "DEPLOYMENT.FINISHED", "roots": plan.roots, **counts, "time": elapsed})
+        yield {"event": "deployment.finished", "ok": not failed, **counts, "time": elapsed}
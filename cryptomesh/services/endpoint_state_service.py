@@ -1,5 +1,6 @@
 import time as T
-from typing import List
+from datetime import datetime, timezone
+from typing import List, Optional
 from cryptomesh.models import EndpointStateModel
 from cryptomesh.repositories.endpoint_state_repository import EndpointStateRepository
 from cryptomesh.log.logger import get_logger
@@ -11,10 +12,28 @@ from cryptomesh.errors import (
     CreationError,
     UnauthorizedError,
     FunctionNotFound,
+    ConflictError,
+    InvalidTransitionError,
 )
+from cryptomesh.utils.state_machine import StateMachine
 
 L = get_logger(__name__)
 
+# Lifecycle of an endpoint container as reported by the runtimes.
+ENDPOINT_STATE_MACHINE = StateMachine("endpoint state", {
+    "cold":     ["warming", "warm", "failed"],
+    "warming":  ["warm", "cold", "failed"],
+    "warm":     ["draining", "cold", "failed"],
+    "draining": ["cold", "failed"],
+    "failed":   ["cold", "warming"],
+}, aliases={
+    # Free-form values reported before the state machine existed.
+    "pending": "warming",
+    "running": "warm",
+    "stopped": "cold",
+    "error":   "failed",
+})
+
 class EndpointStateService:
     """
     Servicio para gestionar los estados de los endpoints.
@@ -25,6 +44,7 @@ class EndpointStateService:
 
     async def create_state(self, state: EndpointStateModel) -> EndpointStateModel:
         t1 = T.time()
+        state.state = ENDPOINT_STATE_MACHINE.validate_state(state.state)
         if await self.repository.get_by_id(state.state_id):
             elapsed = round(T.time() - t1, 4)
             L.error({
@@ -86,32 +106,63 @@ class EndpointStateService:
         })
         return state
 
-    async def update_state(self, state_id: str, updates: dict) -> EndpointStateModel:
+    async def update_state(
+        self,
+        state_id: str,
+        updates: dict,
+        expected_state: Optional[str] = None,
+        expected_version: Optional[int] = None
+    ) -> EndpointStateModel:
+        """
+        Applies a transition atomically: the update is conditional on the stored
+        state being one the new state can be reached from (ENDPOINT_STATE_MACHINE),
+        and on `expected_state`/`expected_version` when the caller gives them.
+        A single find_one_and_update does the check and the write; the document
+        is only read back to explain a failure (404 or 409).
+        """
         t1 = T.time()
-        if not await self.repository.get_by_id(state_id, id_field="state_id"):
-            elapsed = round(T.time() - t1, 4)
-            L.warning({
-                "event": "ENDPOINT_STATE.UPDATE.NOT_FOUND",
-                "state_id": state_id,
-                "time": elapsed
-            })
-            raise NotFoundError(state_id)
-
-        updated = await self.repository.update({"state_id": state_id}, updates)
+        updates = {k: v for k, v in updates.items() if k not in ("_id", "state_id", "version")}
+        updates["timestamp"] = datetime.now(timezone.utc)
+        target = updates.get("state")
+        expected = {}
+        if target is not None:
+            target = updates["state"] = ENDPOINT_STATE_MACHINE.validate_state(target)
+            expected["state"] = {"$in": ENDPOINT_STATE_MACHINE.sources(target, expected_state)}
+        elif expected_state is not None:
+            expected["state"] = expected_state
+
+        updated = await self.repository.compare_and_set({"state_id": state_id}, expected, updates, expected_version)
         elapsed = round(T.time() - t1, 4)
 
         if not updated:
-            L.error({
-                "event": "ENDPOINT_STATE.UPDATE.FAIL",
+            current = await self.repository.get_by_id(state_id, id_field="state_id")
+            if not current:
+                L.warning({
+                    "event": "ENDPOINT_STATE.UPDATE.NOT_FOUND",
+                    "state_id": state_id,
+                    "time": elapsed
+                })
+                raise NotFoundError(state_id)
+            L.warning({
+                "event": "ENDPOINT_STATE.UPDATE.CONFLICT",
                 "state_id": state_id,
+                "current_state": current.state,
+                "current_version": current.version,
+                "target_state": target,
                 "time": elapsed
             })
-            raise CryptoMeshError(f"Failed to update endpoint state '{state_id}'")
+            if target is not None and not ENDPOINT_STATE_MACHINE.can(current.state, target):
+                raise InvalidTransitionError(ENDPOINT_STATE_MACHINE.name, current.state, target)
+            raise ConflictError(
+                f"Endpoint state '{state_id}' was modified concurrently "
+                f"(now '{current.state}', version {current.version})"
+            )
 
         L.info({
             "event": "ENDPOINT_STATE.UPDATED",
             "state_id": state_id,
             "updates": updates,
+            "version": updated.version,
             "time": elapsed
         })
         return updated
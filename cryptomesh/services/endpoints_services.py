@@ -1,23 +1,34 @@
+import asyncio
+import os
 import time as T
-from typing import Optional,List,Dict,Any
+from typing import TYPE_CHECKING,Optional,List,Dict,Any
 from option import Result,Ok,Err,Some
 import random
-# 
-import humanfriendly as HF
 from cryptomesh.models import EndpointModel,SummonerParams
 from cryptomesh.dtos.endpoints_dto import DeleteEndpointDTO
 from cryptomesh.repositories.endpoints_repository import EndpointsRepository
 from cryptomesh.services.security_policy_service import SecurityPolicyService
+from cryptomesh.services.topology_service import TopologyService, Topology
 from cryptomesh.log.logger import get_logger
 from cryptomesh.errors import (
     CryptoMeshError,
     NotFoundError,
     ValidationError,
 )
-from mictlanx.services.summoner.summoner import Summoner,SummonContainerPayload,SummonServiceResponse,ExposedPort,MountX,MountType
+
+if TYPE_CHECKING:
+    from mictlanx.services.summoner.summoner import Summoner
 
 L = get_logger(__name__)
 
+def summoner_params_from_env() -> SummonerParams:
+    return SummonerParams(
+        ip_addr     = os.environ.get("CRYPTOMESH_SUMMONER_IP_ADDR","localhost"),
+        api_version = int(os.environ.get("CRYPTOMESH_SUMMONER_API_VERSION","3")),
+        port        = int(os.environ.get("CRYPTOMESH_SUMMONER_PORT","15000")),
+        protocol    = os.environ.get("CRYPTOMESH_SUMMONER_PROTOCOL","http")
+    )
+
 class EndpointsService:
     """
     Servicio encargado de gestionar los endpoints y sus relaciones con las políticas de seguridad.
@@ -26,17 +37,31 @@ class EndpointsService:
     def __init__(self, 
         repository: EndpointsRepository, 
         security_policy_service: SecurityPolicyService,
-        summoner_params:Optional[SummonerParams] = SummonerParams()
+        summoner_params:Optional[SummonerParams] = SummonerParams(),
+        topology: Optional[TopologyService] = None
     ):
         self.repository = repository
         self.security_policy_service = security_policy_service
+        self.topology = topology or TopologyService()
         self.summoner_params = summoner_params
-        self.summoner = Summoner(
-            ip_addr     = summoner_params.ip_addr,
-            port        = summoner_params.port,
-            protocol    = summoner_params.protocol,
-            api_version = Some(summoner_params.api_version)
-        )
+        self._summoner: Optional["Summoner"] = None
+
+    @property
+    def summoner(self) -> "Summoner":
+        """
+        MictlanX Summoner client, created on first use: mictlanx is only imported
+        by the requests that deploy or detach containers.
+        """
+        if self._summoner is None:
+            from mictlanx.services.summoner.summoner import Summoner
+            self._summoner = Summoner(
+                ip_addr     = self.summoner_params.ip_addr,
+                port        = self.summoner_params.port,
+                protocol    = self.summoner_params.protocol,
+                api_version = Some(self.summoner_params.api_version)
+            )
+        return self._summoner
+
     async def get_count(self,filter:Dict[str,Any]={})->Result[int,Exception]:
         try:
             x = await self.repository.collection.count_documents(filter=filter)
@@ -56,16 +81,32 @@ class EndpointsService:
             return Ok(res1.is_ok and res2.is_ok)
         except Exception as e:
             return CryptoMeshError(message=str(e),code=500)
+    async def _topology(self, model: EndpointModel) -> Topology:
+        """
+        Gossip peers for `model`, unless its envs already set both AXO_GOSSIP_SEEDS and AXO_ENDPOINTS.
+        A failure here deploys the endpoint without peers instead of failing the deploy.
+        """
+        if model.envs.get("AXO_GOSSIP_SEEDS") and model.envs.get("AXO_ENDPOINTS"):
+            return Topology(seeds=[], endpoints=[])
+        try:
+            return await self.topology.topology_for(model)
+        except Exception as e:
+            L.error({"event": "ENDPOINT.TOPOLOGY.FAIL", "endpoint_id": model.endpoint_id, "error": str(e)})
+            return Topology(seeds=[], endpoints=[])
+
     async def deploy(self,endpoint_id:str,dependencies:List[str]=[],network_id:str = "axo-net",selected_node:str= None):
+        import humanfriendly as HF
+        from mictlanx.services.summoner.summoner import SummonContainerPayload,ExposedPort,MountX,MountType
         model = await self.get_endpoint(endpoint_id=endpoint_id)
         x_port = random.randrange(start=30000, stop=60000)
+        topology = await self._topology(model)
         envs = {
             # --- AXO core ---
             "AXO_ENDPOINT_ID": model.envs.get("AXO_ENDPOINT_ID", "axo-endpoint-0"),
             "AXO_GOSSIP_BIND_HOST": model.envs.get("AXO_GOSSIP_BIND_HOST", "0.0.0.0"),
             "AXO_GOSSIP_PORT": model.envs.get("AXO_GOSSIP_PORT", "7777"),
             "AXO_HEARTBEAT_INTERVAL": model.envs.get("AXO_HEARTBEAT_INTERVAL", "5.0"),
-            "AXO_GOSSIP_SEEDS": model.envs.get("AXO_GOSSIP_SEEDS", ""),  # space-separated
+            "AXO_GOSSIP_SEEDS": model.envs.get("AXO_GOSSIP_SEEDS") or " ".join(topology.seeds),  # space-separated
             "AXO_HEARTBEAT_TTL": model.envs.get("AXO_HEARTBEAT_TTL", "30"),
 
             "AXO_LOGGER_PATH": model.envs.get("AXO_LOGGER_PATH", "/log"),
@@ -79,13 +120,14 @@ class EndpointsService:
             "AXO_SOURCE_PATH": model.envs.get("AXO_SOURCE_PATH", "/axo/source"),
             "AXO_DATA_PATH": model.envs.get("AXO_DATA_PATH", "/data"),
             "AXO_ENDPOINT_IMAGE": model.envs.get("AXO_ENDPOINT_IMAGE", "nachocode/axo:endpoint-0.0.3a0"),
-            "AXO_ENDPOINT_DEPENDENCIES": model.envs.get("AXO_ENDPOINT_DEPENDENCIES", ""),  # semicolon-separated
+            # semicolon-separated; resolved from the active object DAG when deployed through DeploymentService
+            "AXO_ENDPOINT_DEPENDENCIES": ";".join(dependencies) if dependencies else model.envs.get("AXO_ENDPOINT_DEPENDENCIES", ""),
             "AXO_PROTOCOL": model.envs.get("AXO_PROTOCOL", "tcp"),
             "AXO_PUB_SUB_PORT": model.envs.get("AXO_PUB_SUB_PORT", "16666"),
             "AXO_REQ_RES_PORT": model.envs.get("AXO_REQ_RES_PORT", "16667"),
             "AXO_HOSTNAME": model.envs.get("AXO_HOSTNAME", "127.0.0.1"),
             "AXO_SUBSCRIBER_HOSTNAME": model.envs.get("AXO_SUBSCRIBER_HOSTNAME", "*"),
-            "AXO_ENDPOINTS": model.envs.get("AXO_ENDPOINTS", ""),  # space-separated
+            "AXO_ENDPOINTS": model.envs.get("AXO_ENDPOINTS") or " ".join(topology.endpoints),  # space-separated
             "AXO_HEATER_MAX_IDLE_TIME": model.envs.get("AXO_HEATER_MAX_IDLE_TIME", "1h"),
             "AXO_METADATA_TIMEOUT": model.envs.get("AXO_METADATA_TIMEOUT", "30"),
             "AXO_METRICS_COLLECTOR_DEFAULT_LIMIT": model.envs.get("AXO_METRICS_COLLECTOR_DEFAULT_LIMIT", "-1"),
@@ -145,7 +187,8 @@ class EndpointsService:
             selected_node = selected_node,
             shm_size      = None,
         )
-        return self.summoner.summon(payload=payload)
+        # The summoner client is blocking: keep the event loop free while it runs (deployments run in parallel).
+        return await asyncio.to_thread(self.summoner.summon, payload=payload)
 
     async def create_endpoint(self, data: EndpointModel):
         t1 = T.time()
@@ -1,4 +1,6 @@
 import time as T
+from datetime import datetime, timezone
+from typing import Optional
 from cryptomesh.models import FunctionStateModel
 from cryptomesh.repositories.function_state_repository import FunctionStateRepository
 from cryptomesh.log.logger import get_logger
@@ -10,10 +12,22 @@ from cryptomesh.errors import (
     CreationError,
     UnauthorizedError,
     FunctionNotFound,
+    ConflictError,
+    InvalidTransitionError,
 )
+from cryptomesh.utils.state_machine import StateMachine
 
 L = get_logger(__name__)
 
+# Lifecycle of a function execution as reported by the runtimes.
+FUNCTION_STATE_MACHINE = StateMachine("function state", {
+    "pending":   ["running", "failed", "cancelled"],
+    "running":   ["completed", "failed", "cancelled", "pending"],
+    "completed": ["pending"],
+    "failed":    ["pending"],
+    "cancelled": ["pending"],
+})
+
 class FunctionStateService:
     """
     Servicio encargado de gestionar los estados de funciones en la base de datos.
@@ -24,6 +38,7 @@ class FunctionStateService:
 
     async def create_state(self, state: FunctionStateModel):
         t1 = T.time()
+        FUNCTION_STATE_MACHINE.validate_state(state.state)
         if await self.repository.get_by_id(state.state_id):
             elapsed = round(T.time() - t1, 4)
             L.error({
@@ -85,32 +100,62 @@ class FunctionStateService:
         })
         return state
 
-    async def update_state(self, state_id: str, updates: dict):
+    async def update_state(
+        self,
+        state_id: str,
+        updates: dict,
+        expected_state: Optional[str] = None,
+        expected_version: Optional[int] = None
+    ):
+        """
+        Applies a transition atomically: the update is conditional on the stored
+        state being one the new state can be reached from (FUNCTION_STATE_MACHINE),
+        and on `expected_state`/`expected_version` when the caller gives them.
+        A single find_one_and_update does the check and the write; the document
+        is only read back to explain a failure (404 or 409).
+        """
         t1 = T.time()
-        if not await self.repository.get_by_id(state_id, id_field="state_id"):
-            elapsed = round(T.time() - t1, 4)
-            L.warning({
-                "event": "FUNCTION_STATE.UPDATE.NOT_FOUND",
-                "state_id": state_id,
-                "time": elapsed
-            })
-            raise NotFoundError(state_id)
-
-        updated = await self.repository.update({"state_id": state_id}, updates)
+        updates = {k: v for k, v in updates.items() if k not in ("_id", "state_id", "version")}
+        updates["timestamp"] = datetime.now(timezone.utc)
+        target = updates.get("state")
+        expected = {}
+        if target is not None:
+            expected["state"] = {"$in": FUNCTION_STATE_MACHINE.sources(target, expected_state)}
+        elif expected_state is not None:
+            expected["state"] = expected_state
+
+        updated = await self.repository.compare_and_set({"state_id": state_id}, expected, updates, expected_version)
         elapsed = round(T.time() - t1, 4)
 
         if not updated:
-            L.error({
-                "event": "FUNCTION_STATE.UPDATE.FAIL",
+            current = await self.repository.get_by_id(state_id, id_field="state_id")
+            if not current:
+                L.warning({
+                    "event": "FUNCTION_STATE.UPDATE.NOT_FOUND",
+                    "state_id": state_id,
+                    "time": elapsed
+                })
+                raise NotFoundError(state_id)
+            L.warning({
+                "event": "FUNCTION_STATE.UPDATE.CONFLICT",
                 "state_id": state_id,
+                "current_state": current.state,
+                "current_version": current.version,
+                "target_state": target,
                 "time": elapsed
             })
-            raise CryptoMeshError(f"Failed to update function state '{state_id}'")
+            if target is not None and not FUNCTION_STATE_MACHINE.can(current.state, target):
+                raise InvalidTransitionError(FUNCTION_STATE_MACHINE.name, current.state, target)
+            raise ConflictError(
+                f"Function state '{state_id}' was modified concurrently "
+                f"(now '{current.state}', version {current.version})"
+            )
 
         L.info({
             "event": "FUNCTION_STATE.UPDATED",
             "state_id": state_id,
             "updates": updates,
+            "version": updated.version,
             "time": elapsed
         })
         return updated
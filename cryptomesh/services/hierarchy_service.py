@@ -0,0 +1,295 @@
+import asyncio
+import hashlib
+import time as T
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from cryptomesh import config
+from cryptomesh.db import get_collection
+from cryptomesh.dtos.hierarchy_dto import (
+    ServiceHierarchyDTO,
+    MicroserviceHierarchyDTO,
+    ActiveObjectHierarchyDTO,
+    FunctionHierarchyDTO,
+    ParameterDTO,
+)
+from cryptomesh.errors import NotFoundError
+from cryptomesh.log.logger import get_logger
+from cryptomesh.models import ActiveObjectModel, FunctionModel, MicroserviceModel, ServiceModel
+from cryptomesh.repositories.versions_repository import CollectionVersionsRepository, VERSIONS_COLLECTION
+
+L = get_logger(__name__)
+
+HIERARCHY_COLLECTIONS = ("services", "microservices", "active_objects")
+AO_FIELDS = ("active_object_id", "axo_microservice_id", "axo_class_name", "axo_alias", "axo_version", "functions")
+
+
+class HierarchySnapshot:
+    """
+    Materialized Service -> Microservice -> ActiveObject -> Function tree.
+
+    Built once (at startup or on first use) with three projected queries and then
+    patched by the services after every create/update/delete. Each service subtree
+    is rendered to JSON once and reused until one of its nodes changes, so reads
+    cost a dict lookup.
+
+    Writes made by other processes are detected with the per-collection version
+    counters: a local bump that does not immediately follow the last known
+    version, or a periodic token check that does not match, triggers a rebuild.
+    """
+
+    def __init__(self, sync_interval: float, rebuild_interval: float, clock: Callable[[], float] = T.monotonic):
+        self.sync_interval    = sync_interval
+        self.rebuild_interval = rebuild_interval
+        self.clock            = clock
+        self.tokens: Dict[str, str] = {}
+        self.built            = False
+        self.stale            = False
+        self.rebuilds         = 0
+        self._built_at        = 0.0
+        self._checked_at      = 0.0
+        self._lock            = asyncio.Lock()
+        self._reset()
+
+    def _reset(self):
+        # Children are kept as insertion-ordered dicts so the output order matches Mongo's natural order.
+        self._services: Dict[str, str] = {}
+        self._microservices: Dict[str, str] = {}
+        self._ms_parent: Dict[str, str] = {}
+        self._ms_children: Dict[str, Dict[str, None]] = {}
+        self._active_objects: Dict[str, ActiveObjectHierarchyDTO] = {}
+        self._ao_parent: Dict[str, str] = {}
+        self._ao_children: Dict[str, Dict[str, None]] = {}
+        self._rendered: Dict[str, Tuple[bytes, str]] = {}
+        self._full: Optional[Tuple[bytes, str]] = None
+
+    # ----------------------------
+    # Build / consistency
+    # ----------------------------
+    async def _read_tokens(self) -> Dict[str, str]:
+        versions = CollectionVersionsRepository(get_collection(VERSIONS_COLLECTION))
+        return await versions.get_many(list(HIERARCHY_COLLECTIONS))
+
+    async def rebuild(self):
+        started = self.clock()
+        async with self._lock:
+            if self.built and not self.stale and self._built_at >= started:
+                return
+            t1 = T.time()
+            # Tokens are read first: a write racing with the build is then seen as newer and rebuilt again.
+            tokens = await self._read_tokens()
+            services = await get_collection("services").find({}, {"_id": 0, "service_id": 1, "name": 1}).to_list(length=None)
+            microservices = await get_collection("microservices").find(
+                {}, {"_id": 0, "microservice_id": 1, "name": 1, "service_id": 1}
+            ).to_list(length=None)
+            active_objects = await get_collection("active_objects").find(
+                {}, {"_id": 0, **{f: 1 for f in AO_FIELDS}}
+            ).to_list(length=None)
+
+            self._reset()
+            self.built = True
+            for doc in services:
+                self._services[doc["service_id"]] = doc.get("name", "")
+            for doc in microservices:
+                self._place_microservice(doc["microservice_id"], doc.get("name", ""), doc.get("service_id"))
+            for doc in active_objects:
+                self._place_active_object(doc)
+
+            self.tokens      = tokens
+            self.stale       = False
+            self.rebuilds   += 1
+            self._built_at   = self.clock()
+            self._checked_at = self._built_at
+            L.info({
+                "event": "HIERARCHY.SNAPSHOT.BUILT",
+                "services": len(self._services),
+                "microservices": len(self._microservices),
+                "active_objects": len(self._active_objects),
+                "time": round(T.time() - t1, 4)
+            })
+
+    async def ensure_fresh(self):
+        now = self.clock()
+        if self.built and not self.stale and now - self._built_at < self.rebuild_interval:
+            if now - self._checked_at < self.sync_interval:
+                return
+            tokens = await self._read_tokens()
+            self._checked_at = now
+            if tokens == self.tokens:
+                return
+            L.info({
+                "event": "HIERARCHY.SNAPSHOT.EXTERNAL_WRITE",
+                "known": self.tokens,
+                "current": tokens
+            })
+        await self.rebuild()
+
+    def invalidate(self):
+        """
+        Forces a rebuild on the next read (used after bulk writes that bypass the services).
+        """
+        self.stale = True
+
+    def on_version_bump(self, collection: str, token: str):
+        """
+        Version listener: local writes keep the snapshot in sync (the service
+        hook patches it right after), any gap means somebody else wrote too.
+        """
+        if not self.built or collection not in HIERARCHY_COLLECTIONS:
+            return
+        if CollectionVersionsRepository.follows(self.tokens.get(collection, "0"), token):
+            self.tokens[collection] = token
+        else:
+            self.stale = True
+
+    # ----------------------------
+    # Incremental patches
+    # ----------------------------
+    def _dirty(self, service_id: Optional[str]):
+        self._full = None
+        if service_id is not None:
+            self._rendered.pop(service_id, None)
+
+    def _place_microservice(self, microservice_id: str, name: str, service_id: Optional[str]):
+        previous = self._ms_parent.get(microservice_id)
+        if previous != service_id:
+            self._ms_children.get(previous, {}).pop(microservice_id, None)
+            self._dirty(previous)
+        self._microservices[microservice_id] = name
+        self._ms_parent[microservice_id] = service_id
+        self._ms_children.setdefault(service_id, {})[microservice_id] = None
+        self._dirty(service_id)
+
+    def _place_active_object(self, doc: Dict[str, Any]):
+        ao_id           = doc["active_object_id"]
+        microservice_id = doc.get("axo_microservice_id")
+        previous        = self._ao_parent.get(ao_id)
+        if previous != microservice_id:
+            self._ao_children.get(previous, {}).pop(ao_id, None)
+            self._dirty(self._ms_parent.get(previous))
+        self._active_objects[ao_id] = self._active_object_dto(doc)
+        self._ao_parent[ao_id] = microservice_id
+        self._ao_children.setdefault(microservice_id, {})[ao_id] = None
+        self._dirty(self._ms_parent.get(microservice_id))
+
+    @staticmethod
+    def _active_object_dto(doc: Dict[str, Any]) -> ActiveObjectHierarchyDTO:
+        functions = []
+        for f in doc.get("functions") or []:
+            fn = f if isinstance(f, FunctionModel) else FunctionModel(**f)
+            functions.append(FunctionHierarchyDTO(
+                function_id=fn.function_id,
+                name=fn.name,
+                init_params=[ParameterDTO(**p.model_dump()) for p in fn.init_params],
+                call_params=[ParameterDTO(**p.model_dump()) for p in fn.call_params],
+            ))
+        return ActiveObjectHierarchyDTO(
+            active_object_id=doc["active_object_id"],
+            object_name=doc.get("axo_class_name", ""),
+            alias=doc.get("axo_alias"),
+            version=doc.get("axo_version", 0),
+            functions=functions,
+        )
+
+    def upsert_service(self, service: ServiceModel):
+        if not self.built:
+            return
+        self._services[service.service_id] = service.name
+        self._dirty(service.service_id)
+
+    def remove_service(self, service_id: str):
+        if not self.built:
+            return
+        # Service deletes cascade to their microservices and active objects.
+        for microservice_id in list(self._ms_children.pop(service_id, {})):
+            self._drop_microservice(microservice_id)
+        self._services.pop(service_id, None)
+        self._dirty(service_id)
+
+    def upsert_microservice(self, microservice: MicroserviceModel):
+        if not self.built:
+            return
+        self._place_microservice(microservice.microservice_id, microservice.name, microservice.service_id)
+
+    def _drop_microservice(self, microservice_id: str) -> Optional[str]:
+        # Microservice deletes cascade to their active objects.
+        for ao_id in self._ao_children.pop(microservice_id, {}):
+            self._ao_parent.pop(ao_id, None)
+            self._active_objects.pop(ao_id, None)
+        self._microservices.pop(microservice_id, None)
+        return self._ms_parent.pop(microservice_id, None)
+
+    def remove_microservice(self, microservice_id: str):
+        if not self.built:
+            return
+        service_id = self._drop_microservice(microservice_id)
+        self._ms_children.get(service_id, {}).pop(microservice_id, None)
+        self._dirty(service_id)
+
+    def upsert_active_object(self, active_object: ActiveObjectModel):
+        if not self.built:
+            return
+        self._place_active_object(active_object.model_dump(include=set(AO_FIELDS)))
+
+    def remove_active_object(self, active_object_id: str):
+        if not self.built:
+            return
+        microservice_id = self._ao_parent.pop(active_object_id, None)
+        self._ao_children.get(microservice_id, {}).pop(active_object_id, None)
+        self._active_objects.pop(active_object_id, None)
+        self._dirty(self._ms_parent.get(microservice_id))
+
+    # ----------------------------
+    # Reads
+    # ----------------------------
+    def _render_service(self, service_id: str) -> Tuple[bytes, str]:
+        rendered = self._rendered.get(service_id)
+        if rendered is None:
+            dto = ServiceHierarchyDTO(
+                service_id=service_id,
+                service_name=self._services[service_id],
+                microservices=[
+                    MicroserviceHierarchyDTO(
+                        microservice_id=ms_id,
+                        microservice_name=self._microservices[ms_id],
+                        active_objects=[self._active_objects[ao_id] for ao_id in self._ao_children.get(ms_id, {})],
+                    )
+                    for ms_id in self._ms_children.get(service_id, {})
+                ],
+            )
+            body = dto.model_dump_json().encode("utf-8")
+            rendered = (body, hashlib.sha256(body).hexdigest()[:32])
+            self._rendered[service_id] = rendered
+        return rendered
+
+    def render(self) -> Tuple[bytes, str]:
+        """
+        Returns the JSON body of the whole hierarchy and its content digest (stable across workers).
+        """
+        if self._full is None:
+            body = b"[" + b",".join(self._render_service(sid)[0] for sid in self._services) + b"]"
+            self._full = (body, hashlib.sha256(body).hexdigest()[:32])
+        return self._full
+
+    def render_service(self, service_id: str) -> Tuple[bytes, str]:
+        if service_id not in self._services:
+            raise NotFoundError(service_id)
+        return self._render_service(service_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "built": self.built,
+            "stale": self.stale,
+            "rebuilds": self.rebuilds,
+            "services": len(self._services),
+            "microservices": len(self._microservices),
+            "active_objects": len(self._active_objects),
+            "rendered_services": len(self._rendered),
+            "tokens": dict(self.tokens),
+        }
+
+
+HIERARCHY_SNAPSHOT = HierarchySnapshot(
+    sync_interval    = config.CRYPTO_MESH_HIERARCHY_SYNC_INTERVAL,
+    rebuild_interval = config.CRYPTO_MESH_HIERARCHY_REBUILD_INTERVAL,
+)
+CollectionVersionsRepository.subscribe(HIERARCHY_SNAPSHOT.on_version_bump)
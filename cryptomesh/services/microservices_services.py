@@ -1,9 +1,12 @@
 import time as T
-from typing import List
+from typing import List, Optional
 from cryptomesh.models import MicroserviceModel
 from cryptomesh.repositories.microservices_repository import MicroservicesRepository
 from cryptomesh.repositories.services_repository import ServicesRepository
+from cryptomesh.repositories.activeobjects_repository import ActiveObjectsRepository
 from cryptomesh.db import get_collection
+from cryptomesh.services.hierarchy_service import HierarchySnapshot, HIERARCHY_SNAPSHOT
+from cryptomesh.services.activeobjects_service import ActiveObjectsService
 from cryptomesh.log.logger import get_logger
 from cryptomesh.errors import (
     CryptoMeshError,
@@ -22,8 +25,33 @@ class MicroservicesService:
     Servicio encargado de gestionar los microservicios en la base de datos.
     """
 
-    def __init__(self, repository: MicroservicesRepository):
+    def __init__(self, repository: MicroservicesRepository, hierarchy: Optional[HierarchySnapshot] = None):
         self.repository = repository
+        self.hierarchy = hierarchy or HIERARCHY_SNAPSHOT
+
+    def active_objects(self) -> ActiveObjectsService:
+        return ActiveObjectsService(ActiveObjectsRepository(get_collection("active_objects")), hierarchy=self.hierarchy)
+
+    async def delete_by_service(self, service_id: str) -> int:
+        """
+        Cascade used by service deletes: removes the microservices of
+        `service_id` together with their active objects (and blobs).
+        """
+        microservices = await self.repository.get_by_filter({"service_id": service_id})
+        if not microservices:
+            return 0
+        microservice_ids = [ms.microservice_id for ms in microservices]
+        await self.active_objects().delete_by_microservices(microservice_ids)
+        deleted = await self.repository.delete_many({"microservice_id": {"$in": microservice_ids}})
+        for microservice_id in microservice_ids:
+            self.hierarchy.remove_microservice(microservice_id)
+        return deleted
+
+    async def collection_version(self) -> str:
+        """
+        Version token of the underlying collection; changes on every write (used for ETags).
+        """
+        return await self.repository.version_token()
 
     async def create_microservice(self, microservice: MicroserviceModel) -> MicroserviceModel:
         t1 = T.time()
@@ -51,6 +79,7 @@ class MicroservicesService:
                 "time": elapsed
             })
             raise CryptoMeshError(f"Failed to create microservice '{microservice.microservice_id}'")
+        self.hierarchy.upsert_microservice(created)
 
         #Actualizar service padre
         service_collection = get_collection("services")
@@ -149,6 +178,7 @@ class MicroservicesService:
                 "time": elapsed
             })
             raise CryptoMeshError(f"Failed to update microservice '{microservice_id}'")
+        self.hierarchy.upsert_microservice(updated)
 
         # Actualizar services si cambió
         if new_service_id != old_service_id:
@@ -213,6 +243,8 @@ class MicroservicesService:
                 "time": elapsed
             })
             raise CryptoMeshError(f"Failed to delete microservice '{microservice_id}'")
+        self.hierarchy.remove_microservice(microservice_id)
+        await self.active_objects().delete_by_microservices([microservice_id])
 
         L.info({
             "event": "MICROSERVICE.DELETED",
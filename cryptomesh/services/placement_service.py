@@ -0,0 +1,177 @@
+import time as T
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+
+from pydantic import BaseModel, Field
+
+from cryptomesh import config
+from cryptomesh.errors import NotFoundError, ServiceUnavailableError
+from cryptomesh.log.logger import get_logger
+from cryptomesh.models import ActiveObjectModel, EndpointModel, ResourcesModel
+from cryptomesh.repositories.activeobjects_repository import ActiveObjectsRepository, LEAN_PROJECTION
+from cryptomesh.repositories.microservices_repository import MicroservicesRepository
+from cryptomesh.services.activeobjects_service import ActiveObjectsService
+from cryptomesh.services.topology_service import ENDPOINT_REGISTRY, EndpointRegistry
+
+L = get_logger(__name__)
+
+BUCKET_FIELDS = ("axo_bucket_id", "axo_source_bucket_id", "axo_sink_bucket_id")
+# Endpoints in these states do not receive new objects.
+UNAVAILABLE_STATES = ("failed", "draining")
+# Affinity of an endpoint that shares a MictlanX router with the data, without holding it.
+ROUTER_AFFINITY = 0.5
+
+
+def buckets_of(ao: ActiveObjectModel) -> Set[str]:
+    return {getattr(ao, field) for field in BUCKET_FIELDS if getattr(ao, field)}
+
+
+def routers_of(endpoint: EndpointModel) -> Set[str]:
+    """
+    Router ids of MICTLANX_ROUTERS ("<id>:<host>:<port> ..." separated by spaces).
+    """
+    raw = (endpoint.envs or {}).get("MICTLANX_ROUTERS", "")
+    return {entry.split(":", 1)[0] for entry in raw.split() if entry}
+
+
+def fits(endpoint: ResourcesModel, required: Optional[ResourcesModel]) -> bool:
+    if required is None:
+        return True
+    import humanfriendly as HF
+    return endpoint.cpu >= required.cpu and HF.parse_size(endpoint.ram) >= HF.parse_size(required.ram)
+
+
+class PlacementCandidate(BaseModel):
+    endpoint_id: str
+    score: float
+    data_affinity: float
+    load: float
+    hosted: int
+
+
+class PlacementDecision(BaseModel):
+    active_object_id: str
+    endpoint_id: str
+    changed: bool
+    candidates: List[PlacementCandidate] = Field(default_factory=list)
+
+
+class PlacementService:
+    """
+    Chooses the endpoint an active object runs on, moving compute to its data.
+
+    Data affinity averages, over the object's buckets (data, source and
+    sink), whether the endpoint already works with the bucket (objects it
+    hosts or its own MICTLANX_BUCKET_ID), or at least shares a MictlanX
+    router with an endpoint that does (ROUTER_AFFINITY).
+    Load is the number of hosted objects per CPU. Endpoints that are failed or
+    draining, or smaller than the object's microservice resources, are not
+    candidates.
+    """
+
+    def __init__(
+        self,
+        activeobjects: ActiveObjectsService,
+        microservices: MicroservicesRepository,
+        registry: Optional[EndpointRegistry] = None,
+        data_weight: Optional[float] = None,
+        load_weight: Optional[float] = None,
+    ):
+        self.activeobjects = activeobjects
+        self.microservices = microservices
+        self.registry      = registry or ENDPOINT_REGISTRY
+        self.data_weight   = config.CRYPTO_MESH_PLACEMENT_DATA_WEIGHT if data_weight is None else data_weight
+        self.load_weight   = config.CRYPTO_MESH_PLACEMENT_LOAD_WEIGHT if load_weight is None else load_weight
+
+    @property
+    def repository(self) -> ActiveObjectsRepository:
+        return self.activeobjects.repository
+
+    @staticmethod
+    def _affinity(wanted: Set[str], held: Set[str], routers: Set[str], bucket_routers: Dict[str, Set[str]]) -> float:
+        """
+        Mean over the object's buckets: 1 if the endpoint works with the bucket,
+        ROUTER_AFFINITY if it shares a router with an endpoint that does, else 0.
+        """
+        if not wanted:
+            return 0.0
+        total = 0.0
+        for bucket in wanted:
+            if bucket in held:
+                total += 1
+            elif routers & bucket_routers.get(bucket, set()):
+                total += ROUTER_AFFINITY
+        return total / len(wanted)
+
+    async def rank(self, ao: ActiveObjectModel) -> List[PlacementCandidate]:
+        microservice = await self.microservices.get_by_id(ao.axo_microservice_id)
+        required     = microservice.resources if microservice else None
+        placed = await self.repository.find_fields(
+            {"axo_endpoint_id": {"$nin": [None, ""]}, "active_object_id": {"$ne": ao.active_object_id}},
+            ["axo_endpoint_id", *BUCKET_FIELDS]
+        )
+        hosted: Dict[str, int] = defaultdict(int)
+        endpoint_buckets: Dict[str, Set[str]] = defaultdict(set)
+        for doc in placed:
+            hosted[doc["axo_endpoint_id"]] += 1
+            endpoint_buckets[doc["axo_endpoint_id"]] |= {doc[f] for f in BUCKET_FIELDS if doc.get(f)}
+
+        wanted = buckets_of(ao)
+        peers  = await self.registry.snapshot()
+        for peer in peers:
+            bucket = (peer.endpoint.envs or {}).get("MICTLANX_BUCKET_ID")
+            if bucket:
+                endpoint_buckets[peer.endpoint.endpoint_id].add(bucket)
+        # bucket -> MictlanX routers of the endpoints that already work with it
+        bucket_routers: Dict[str, Set[str]] = defaultdict(set)
+        for peer in peers:
+            for bucket in wanted & endpoint_buckets[peer.endpoint.endpoint_id]:
+                bucket_routers[bucket] |= routers_of(peer.endpoint)
+
+        candidates = []
+        for peer in peers:
+            endpoint = peer.endpoint
+            if peer.state in UNAVAILABLE_STATES or not fits(endpoint.resources, required):
+                continue
+            affinity = self._affinity(wanted, endpoint_buckets[endpoint.endpoint_id], routers_of(endpoint), bucket_routers)
+            load     = hosted[endpoint.endpoint_id] / max(endpoint.resources.cpu, 1)
+            candidates.append(PlacementCandidate(
+                endpoint_id   = endpoint.endpoint_id,
+                score         = round(self.data_weight * affinity - self.load_weight * load, 4),
+                data_affinity = round(affinity, 4),
+                load          = round(load, 4),
+                hosted        = hosted[endpoint.endpoint_id],
+            ))
+        candidates.sort(key=lambda c: (-c.score, c.load, c.endpoint_id))
+        return candidates
+
+    async def place(self, active_object_id: str, force: bool = False) -> PlacementDecision:
+        """
+        Records the best endpoint in axo_endpoint_id. Objects that already have
+        an endpoint keep it unless `force` is set.
+        """
+        t1 = T.time()
+        ao = await self.repository.get_by_id(active_object_id, id_field="active_object_id", projection=LEAN_PROJECTION)
+        if not ao:
+            raise NotFoundError(active_object_id)
+        if ao.axo_endpoint_id and not force:
+            return PlacementDecision(active_object_id=active_object_id, endpoint_id=ao.axo_endpoint_id, changed=False)
+
+        candidates = await self.rank(ao)
+        if not candidates:
+            L.error({"event": "PLACEMENT.NO_CANDIDATES", "active_object_id": active_object_id})
+            raise ServiceUnavailableError(f"No endpoint can host active object '{active_object_id}'", retry_after=30)
+        best = candidates[0]
+        changed = best.endpoint_id != ao.axo_endpoint_id
+        if changed:
+            await self.activeobjects.update_active_object(active_object_id, {"axo_endpoint_id": best.endpoint_id})
+        L.info({
+            "event": "PLACEMENT.DECIDED",
+            "active_object_id": active_object_id,
+            "endpoint_id": best.endpoint_id,
+            "score": best.score,
+            "data_affinity": best.data_affinity,
+            "candidates": len(candidates),
+            "time": round(T.time() - t1, 4)
+        })
+        return PlacementDecision(active_object_id=active_object_id, endpoint_id=best.endpoint_id, changed=changed, candidates=candidates)
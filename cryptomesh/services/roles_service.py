@@ -1,8 +1,11 @@
 import time as T
-from typing import List
+from typing import List, Optional, Dict, Any
 from cryptomesh.models import RoleModel
 from cryptomesh.repositories.roles_repository import RolesRepository
 from cryptomesh.log.logger import get_logger
+from cryptomesh.cache import TTLCache
+from cryptomesh.repositories.versions_repository import CollectionVersionsRepository
+from cryptomesh import config
 from cryptomesh.errors import (
     CryptoMeshError,
     NotFoundError,
@@ -15,13 +18,27 @@ from cryptomesh.errors import (
 
 L = get_logger(__name__)
 
+# Process-wide read-through cache shared by every RolesService instance
+# (services are built per request by the controllers' factories).
+ROLE_CACHE = TTLCache(
+    name     = "roles",
+    ttl      = config.CRYPTO_MESH_ROLE_CACHE_TTL,
+    max_size = config.CRYPTO_MESH_ROLE_CACHE_MAX_SIZE,
+)
+# Writes of other processes arrive as version bumps (cache.version_polling).
+CollectionVersionsRepository.subscribe(lambda name, token: ROLE_CACHE.clear() if name == "roles" else None)
+
 class RolesService:
     """
     Servicio encargado de gestionar los roles en la base de datos.
     """
 
-    def __init__(self, repository: RolesRepository):
+    def __init__(self, repository: RolesRepository, cache: Optional[TTLCache] = None):
         self.repository = repository
+        self.cache = cache if cache is not None else ROLE_CACHE
+
+    def cache_stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
 
     async def create_role(self, role: RoleModel) -> RoleModel:
         t1 = T.time()
@@ -67,6 +84,11 @@ class RolesService:
 
     async def get_role(self, role_id: str) -> RoleModel:
         t1 = T.time()
+        cached = self.cache.get(role_id)
+        if cached is not None:
+            # Copy so callers applying DTO updates never mutate the cached model.
+            return cached.model_copy(deep=True)
+
         role = await self.repository.get_by_id(role_id)
         elapsed = round(T.time() - t1, 4)
 
@@ -78,6 +100,7 @@ class RolesService:
             })
             raise NotFoundError(role_id)
 
+        self.cache.set(role_id, role.model_copy(deep=True))
         L.info({
             "event": "ROLE.FETCHED",
             "role_id": role_id,
@@ -97,6 +120,7 @@ class RolesService:
             raise NotFoundError(role_id)
 
         updated = await self.repository.update({"role_id": role_id}, updates)
+        self.cache.invalidate(role_id)
         elapsed = round(T.time() - t1, 4)
 
         if not updated:
@@ -127,6 +151,7 @@ class RolesService:
             raise NotFoundError(role_id)
 
         success = await self.repository.delete({"role_id": role_id})
+        self.cache.invalidate(role_id)
         elapsed = round(T.time() - t1, 4)
 
         if not success:
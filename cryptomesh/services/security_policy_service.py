@@ -1,8 +1,11 @@
 import time as T
-from typing import List
+from typing import List, Optional, Dict, Any
 from cryptomesh.models import SecurityPolicyModel
 from cryptomesh.repositories.security_policy_repository import SecurityPolicyRepository
 from cryptomesh.log.logger import get_logger
+from cryptomesh.cache import TTLCache
+from cryptomesh.repositories.versions_repository import CollectionVersionsRepository
+from cryptomesh import config
 from cryptomesh.errors import (
     CryptoMeshError,
     NotFoundError,
@@ -15,13 +18,27 @@ from cryptomesh.errors import (
 
 L = get_logger(__name__)
 
+# Process-wide read-through cache shared by every SecurityPolicyService instance
+# (services are built per request by the controllers' factories).
+POLICY_CACHE = TTLCache(
+    name     = "security_policies",
+    ttl      = config.CRYPTO_MESH_POLICY_CACHE_TTL,
+    max_size = config.CRYPTO_MESH_POLICY_CACHE_MAX_SIZE,
+)
+# Writes of other processes arrive as version bumps (cache.version_polling).
+CollectionVersionsRepository.subscribe(lambda name, token: POLICY_CACHE.clear() if name == "security_policies" else None)
+
 class SecurityPolicyService:
     """
     Servicio encargado de manejar políticas de seguridad en la base de datos.
     """
 
-    def __init__(self, repository: SecurityPolicyRepository):
+    def __init__(self, repository: SecurityPolicyRepository, cache: Optional[TTLCache] = None):
         self.repository = repository
+        self.cache = cache if cache is not None else POLICY_CACHE
+
+    def cache_stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
 
     async def create_policy(self, policy: SecurityPolicyModel) -> SecurityPolicyModel:
         t1 = T.time()
@@ -67,6 +84,11 @@ class SecurityPolicyService:
 
     async def get_policy(self, sp_id: str) -> SecurityPolicyModel:
         t1 = T.time()
+        cached = self.cache.get(sp_id)
+        if cached is not None:
+            # Copy so callers applying DTO updates never mutate the cached model.
+            return cached.model_copy(deep=True)
+
         policy = await self.repository.get_by_id(sp_id)
         elapsed = round(T.time() - t1, 4)
 
@@ -78,6 +100,7 @@ class SecurityPolicyService:
             })
             raise NotFoundError(sp_id)
 
+        self.cache.set(sp_id, policy.model_copy(deep=True))
         L.info({
             "event": "POLICY.FETCHED",
             "sp_id": sp_id,
@@ -97,6 +120,7 @@ class SecurityPolicyService:
             raise NotFoundError(sp_id)
 
         updated_policy = await self.repository.update({"sp_id": sp_id}, updates)
+        self.cache.invalidate(sp_id)
         elapsed = round(T.time() - t1, 4)
 
         if not updated_policy:
@@ -127,6 +151,7 @@ class SecurityPolicyService:
             raise NotFoundError(sp_id)
 
         success = await self.repository.delete({"sp_id": sp_id})
+        self.cache.invalidate(sp_id)
         elapsed = round(T.time() - t1, 4)
 
         if not success:
@@ -1,7 +1,12 @@
 import time as T
+from typing import Optional
 from cryptomesh.models import ServiceModel
 from cryptomesh.repositories.services_repository import ServicesRepository
 from cryptomesh.services.security_policy_service import SecurityPolicyService
+from cryptomesh.services.hierarchy_service import HierarchySnapshot, HIERARCHY_SNAPSHOT
+from cryptomesh.services.microservices_services import MicroservicesService
+from cryptomesh.repositories.microservices_repository import MicroservicesRepository
+from cryptomesh.db import get_collection
 from cryptomesh.log.logger import get_logger
 from cryptomesh.errors import (
     CryptoMeshError,
@@ -16,9 +21,16 @@ from cryptomesh.errors import (
 L = get_logger(__name__)
 
 class ServicesService:
-    def __init__(self, repository: ServicesRepository, security_policy_service: SecurityPolicyService = None):
+    def __init__(self, repository: ServicesRepository, security_policy_service: SecurityPolicyService = None, hierarchy: Optional[HierarchySnapshot] = None):
         self.repository = repository
         self.security_policy_service = security_policy_service
+        self.hierarchy = hierarchy or HIERARCHY_SNAPSHOT
+
+    async def collection_version(self) -> str:
+        """
+        Version token of the underlying collection; changes on every write (used for ETags).
+        """
+        return await self.repository.version_token()
 
     async def create_service(self, data: ServiceModel):
         t1 = T.time()
@@ -47,6 +59,7 @@ class ServicesService:
             })
             raise CreationError(f"Failed to create service '{data.service_id}'")
 
+        self.hierarchy.upsert_service(service)
         L.info({
             "event": "SERVICE.CREATED",
             "service_id": data.service_id,
@@ -109,6 +122,7 @@ class ServicesService:
             })
             raise CryptoMeshError(f"Failed to update service '{service_id}'")
 
+        self.hierarchy.upsert_service(updated)
         L.info({
             "event": "SERVICE.UPDATED",
             "service_id": service_id,
@@ -140,9 +154,13 @@ class ServicesService:
             })
             raise CryptoMeshError(f"Failed to delete service '{service_id}'")
 
+        self.hierarchy.remove_service(service_id)
+        microservices = MicroservicesService(MicroservicesRepository(get_collection("microservices")), hierarchy=self.hierarchy)
+        cascaded = await microservices.delete_by_service(service_id)
         L.info({
             "event": "SERVICE.DELETED",
             "service_id": service_id,
+            "microservices": cascaded,
             "time": elapsed
         })
         return {"detail": f"Service '{service_id}' deleted"}
\ No newline at end of file
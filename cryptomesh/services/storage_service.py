@@ -1,32 +1,196 @@
 from cryptomesh.dtos import ActiveObjectCreateDTO
 from option import Result,Ok,Err
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional
 from uuid import uuid4
+import json
 from cryptomesh.utils import Utils
-from axo.models import MetadataX
-from axo.storage import AxoStorage,AxoObjectBlob,AxoObjectBlobs
-from cryptomesh.models import ActiveObjectModel
+from cryptomesh.models import ActiveObjectModel, BlobRefModel
 from cryptomesh.log.logger import get_logger
-from cryptomesh.errors import CryptoMeshError
+from cryptomesh.errors import CryptoMeshError, ValidationError
+from cryptomesh.storage import BlobStore, HashingChunker, ReclaimTask
+from cryptomesh import config
 import time as T    
 
+if TYPE_CHECKING:
+    from axo.storage import AxoStorage
+
 
 L = get_logger(__name__)
 
 
+def metadata_key(key: str) -> str:
+    # Where the local backend keeps the metadata next to the code of `key`.
+    return f"{key}.meta.json"
+
+
 class StorageService:
-    def __init__(self,axo_storage:AxoStorage):
+    """
+    Active-object code and artifacts storage. With `axo_storage` the code is
+    stored as Axo blobs (MictlanX); without it (local backend) the code and
+    its metadata are written as plain objects through `blob_store`.
+    """
+    def __init__(self,axo_storage:Optional["AxoStorage"], blob_store: Optional[BlobStore] = None):
         self.axo_storage = axo_storage
+        self.blob_store  = blob_store
+
+    async def put_stream(
+        self,
+        bucket_id: str,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        expected_sha256: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> BlobRefModel:
+        """
+        Pipes `chunks` into the blob store in fixed-size pieces, hashing them
+        as they pass. When the store supports moves the stream is written to a
+        staging key and only promoted to `key` once it is complete and its
+        sha256 matches `expected_sha256`, so a failed upload never replaces
+        the blob already stored under `key`.
+        """
+        if self.blob_store is None:
+            raise CryptoMeshError("No blob store configured", code=500)
+        t1 = T.time()
+        chunker = HashingChunker(
+            chunks,
+            chunk_size = config.CRYPTO_MESH_UPLOAD_CHUNK_SIZE,
+            max_bytes  = config.CRYPTO_MESH_UPLOAD_MAX_BYTES,
+        )
+        staging = f"{key}.upload-{uuid4().hex}" if self.blob_store.supports_moves else key
+        stored  = False
+        try:
+            await self.blob_store.put_chunks(
+                bucket_id = bucket_id,
+                key       = staging,
+                chunks    = chunker,
+                tags      = {"content_type": content_type or "application/octet-stream"},
+            )
+            stored = True
+            if expected_sha256 and expected_sha256.lower() != chunker.sha256:
+                raise ValidationError(f"sha256 mismatch for {bucket_id}/{key}: expected {expected_sha256}, got {chunker.sha256}")
+            if staging != key:
+                await self.blob_store.move(bucket_id, staging, key)
+        except Exception as e:
+            L.error({
+                "event": "BLOB.UPLOAD.FAIL",
+                "bucket_id": bucket_id,
+                "key": key,
+                "size": chunker.size,
+                "reason": str(e),
+                "time": round(T.time() - t1, 4)
+            })
+            # Without staging, `key` is only touched once put_chunks has returned.
+            if staging != key or stored:
+                try:
+                    await self.blob_store.delete(bucket_id=bucket_id, key=staging)
+                except Exception:
+                    pass
+            raise
+
+        ref = BlobRefModel(
+            bucket_id    = bucket_id,
+            key          = key,
+            size         = chunker.size,
+            sha256       = chunker.sha256,
+            content_type = content_type,
+        )
+        L.info({
+            "event": "BLOB.UPLOADED",
+            **ref.model_dump(),
+            "time": round(T.time() - t1, 4)
+        })
+        return ref
+
+    def get_stream(self, bucket_id: str, key: str) -> AsyncIterator[bytes]:
+        if self.blob_store is None:
+            raise CryptoMeshError("No blob store configured", code=500)
+        if not self.blob_store.supports_reads:
+            raise CryptoMeshError(f"Storage backend '{config.CRYPTO_MESH_STORAGE_BACKEND}' does not serve blob reads", code=501)
+        return self.blob_store.get_chunks(bucket_id, key, config.CRYPTO_MESH_UPLOAD_CHUNK_SIZE)
+
+    async def _delete_local_object(self, bucket_id: str, key: str) -> Result[bool, Exception]:
+        await self.blob_store.delete(bucket_id, key)
+        await self.blob_store.delete(bucket_id, metadata_key(key))
+        return Ok(True)
 
     async def delete_blobs(self, bucket_id: str, key: str) -> Result[bool, CryptoMeshError]:
+        """
+        Deletes the code and attrs blobs that AxoStorage keeps for (bucket_id, key).
+        """
         t1 = T.time()
+        try:
+            if self.axo_storage is None:
+                res = await self._delete_local_object(bucket_id, key)
+            else:
+                res = await self.axo_storage.delete_object(
+                    bucket_id = bucket_id,
+                    key       = key
+                )
+        except Exception as e:
+            res = Err(e)
+        elapsed = round(T.time() - t1, 4)
+        if res.is_err:
+            e = res.unwrap_err()
+            L.error({
+                "event": "AXO_BLOB.DELETE.FAIL",
+                "bucket_id": bucket_id,
+                "key": key,
+                "reason": str(e),
+                "time": elapsed
+            })
+            return Err(CryptoMeshError(f"Failed to delete blobs {bucket_id}/{key}: {e}"))
+        L.debug({
+            "event": "AXO_BLOB.DELETED",
+            "bucket_id": bucket_id,
+            "key": key,
+            "time": elapsed
+        })
+        return Ok(True)
+
+    async def reclaim(self, task: ReclaimTask) -> None:
+        """
+        Executes one BlobReclaimer task; raising makes the reclaimer retry it.
+        """
+        if task.kind == "axo_object":
+            res = await self.delete_blobs(task.bucket_id, task.key)
+            if res.is_err:
+                raise res.unwrap_err()
+        elif self.blob_store is None:
+            raise CryptoMeshError("No blob store configured", code=500)
+        elif task.kind == "bucket":
+            await self.blob_store.delete_bucket(task.bucket_id)
+        else:
+            await self.blob_store.delete(task.bucket_id, task.key)
 
-        res = await self.axo_storage.delete_object(
+    async def _put_axo_object(self, bucket_id: str, key: str, code: str, metadata: Dict[str, Any], class_name: str):
+        from axo.models import MetadataX
+        from axo.storage import AxoObjectBlob
+        attrs = {
+            "_acx_metadata": MetadataX(**metadata),
+            "_acx_local":False,
+            "_acx_remote":True
+        }
+        blobs = AxoObjectBlob.from_code_and_attrs(
             bucket_id = bucket_id,
-            key       = key
+            key       = key,
+            code      = code,
+            attrs     = attrs,
         )
-        
-        return 
-      
+        return await self.axo_storage.put_blobs(
+            bucket_id  = bucket_id,
+            key        = key,
+            blobs      = blobs,
+            class_name = class_name
+        )
+
+    async def _put_local_object(self, bucket_id: str, key: str, code: str, metadata: Dict[str, Any]):
+        try:
+            await self.blob_store.put(bucket_id, key, code.encode())
+            await self.blob_store.put(bucket_id, metadata_key(key), json.dumps(metadata, default=str).encode())
+        except Exception as e:
+            return Err(CryptoMeshError(f"Failed to store {bucket_id}/{key}: {e}"))
+        return Ok(True)
+
     async def put_blobs(
         self, 
         dto: ActiveObjectCreateDTO,
@@ -51,37 +215,25 @@ class StorageService:
             "event": "API.ACTIVE_OBJECT.CREATING",
             **model.model_dump()
         })
-        attrs = {
-            "_acx_metadata": MetadataX(
-                axo_is_read_only     = False,
-                # This is the hack to related the source code with the attrs
-                axo_key              = model.axo_alias,
-                axo_bucket_id        = axo_bucket_id,
-                axo_sink_bucket_id   = model.axo_sink_bucket_id or uuid4().hex,
-                axo_source_bucket_id = model.axo_source_bucket_id or uuid4().hex,
-                axo_alias            = model.axo_alias,
-                axo_class_name       = axo_class_name,
-                axo_dependencies     = model.axo_dependencies,
-                axo_endpoint_id      = model.axo_endpoint_id,
-                axo_module           = model.axo_module or "GenericModule",
-                axo_uri              = model.axo_uri,
-                axo_version          = model.axo_version,
-            ),
-            "_acx_local":False,
-            "_acx_remote":True
-        }
-        blobs = AxoObjectBlob.from_code_and_attrs(
-            bucket_id = axo_bucket_id,
-            key       = axo_key,
-            code      = code,
-            attrs     = attrs,
-        )
-        res = await self.axo_storage.put_blobs(
-            bucket_id  = axo_bucket_id,
-            key        = axo_key,
-            blobs      = blobs,
-            class_name = model.axo_class_name
+        metadata = dict(
+            axo_is_read_only     = False,
+            # This is the hack to related the source code with the attrs
+            axo_key              = model.axo_alias,
+            axo_bucket_id        = axo_bucket_id,
+            axo_sink_bucket_id   = model.axo_sink_bucket_id or uuid4().hex,
+            axo_source_bucket_id = model.axo_source_bucket_id or uuid4().hex,
+            axo_alias            = model.axo_alias,
+            axo_class_name       = axo_class_name,
+            axo_dependencies     = model.axo_dependencies,
+            axo_endpoint_id      = model.axo_endpoint_id,
+            axo_module           = model.axo_module or "GenericModule",
+            axo_uri              = model.axo_uri,
+            axo_version          = model.axo_version,
         )
+        if self.axo_storage is None:
+            res = await self._put_local_object(axo_bucket_id, axo_key, code, metadata)
+        else:
+            res = await self._put_axo_object(axo_bucket_id, axo_key, code, metadata, axo_class_name)
         if res.is_err:
             L.error({
                 "event": "AXO_BLOB.CREATE.ERROR",
@@ -0,0 +1,158 @@
+import asyncio
+import random
+import time as T
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from cryptomesh import config
+from cryptomesh.db import get_collection
+from cryptomesh.log.logger import get_logger
+from cryptomesh.models import EndpointModel
+from cryptomesh.repositories.endpoint_state_repository import EndpointStateRepository
+from cryptomesh.repositories.versions_repository import CollectionVersionsRepository
+from cryptomesh.services.endpoint_state_service import ENDPOINT_STATE_MACHINE
+
+L = get_logger(__name__)
+
+DEFAULT_NETWORK_ID = "mictlanx"
+HEALTHY_STATES = ("warm", "warming")
+# endpoint_states is unversioned telemetry: new states are picked up on refresh_interval.
+TOPOLOGY_COLLECTIONS = ("endpoints",)
+
+
+def network_of(endpoint: EndpointModel) -> str:
+    return (endpoint.envs or {}).get("AXO_NETWORK_ID", DEFAULT_NETWORK_ID)
+
+
+def gossip_address(endpoint: EndpointModel) -> str:
+    # Containers are summoned with hostname = endpoint_id.
+    envs = endpoint.envs or {}
+    return f"{endpoint.endpoint_id}:{envs.get('AXO_GOSSIP_PORT', '7777')}"
+
+
+def endpoint_address(endpoint: EndpointModel) -> str:
+    # Same "<id>:<host>:<port>" layout as MICTLANX_ROUTERS, pointing at the req/res socket.
+    envs = endpoint.envs or {}
+    return f"{endpoint.endpoint_id}:{envs.get('NODE_IP_ADDR', endpoint.endpoint_id)}:{envs.get('AXO_REQ_RES_PORT', '16667')}"
+
+
+class Peer(NamedTuple):
+    endpoint: EndpointModel
+    state: Optional[str]
+    reported_at: Optional[datetime]
+
+
+class Topology(NamedTuple):
+    seeds: List[str]        # AXO_GOSSIP_SEEDS
+    endpoints: List[str]    # AXO_ENDPOINTS
+
+
+class EndpointRegistry:
+    """
+    In-memory view of every endpoint and its latest reported state, read with
+    two queries and reused until an endpoint is written (version bump) or
+    `refresh_interval` passes (new endpoint states, which are not versioned).
+    Health is evaluated against the clock at query time.
+    """
+
+    def __init__(self, refresh_interval: float, clock: Callable[[], float] = T.monotonic):
+        self.refresh_interval = refresh_interval
+        self.clock            = clock
+        self.peers: Dict[str, Peer] = {}
+        self.stale            = True
+        self.refreshes        = 0
+        self._loaded_at       = 0.0
+        self._lock            = asyncio.Lock()
+
+    def on_version_bump(self, name: str, token: str):
+        if name in TOPOLOGY_COLLECTIONS:
+            self.stale = True
+
+    async def refresh(self):
+        async with self._lock:
+            if not self.stale and self.clock() - self._loaded_at < self.refresh_interval:
+                return
+            t1 = T.time()
+            self.stale = False
+            self._loaded_at = self.clock()
+            endpoints = [EndpointModel(**doc) async for doc in get_collection("endpoints").find({})]
+            # No time window: an endpoint that last reported "failed" long ago is still failed.
+            latest = await EndpointStateRepository(get_collection("endpoint_states")).latest_by_endpoint(
+                [e.endpoint_id for e in endpoints]
+            )
+            for doc in latest.values():
+                # States stored before the state machine carry legacy names.
+                doc["state"] = ENDPOINT_STATE_MACHINE.canonical(doc.get("state"))
+            self.peers = {
+                e.endpoint_id: Peer(e, latest.get(e.endpoint_id, {}).get("state"), latest.get(e.endpoint_id, {}).get("timestamp"))
+                for e in endpoints
+            }
+            self.refreshes += 1
+            L.debug({"event": "TOPOLOGY.REGISTRY.REFRESHED", "endpoints": len(self.peers), "time": round(T.time() - t1, 4)})
+
+    async def snapshot(self) -> List[Peer]:
+        await self.refresh()
+        return list(self.peers.values())
+
+
+ENDPOINT_REGISTRY = EndpointRegistry(refresh_interval=config.CRYPTO_MESH_TOPOLOGY_REFRESH)
+CollectionVersionsRepository.subscribe(ENDPOINT_REGISTRY.on_version_bump)
+
+
+class TopologyService:
+    """
+    Chooses the gossip peers of an endpoint that is about to be deployed: up
+    to `fanout` random peers of the same AXO_NETWORK_ID, healthy ones first
+    (latest state warm/warming reported within `heartbeat_ttl`), then peers
+    that never reported a state. Failed, drained or silent peers are never
+    used. A random sample per deploy keeps the seed load spread across the
+    mesh while bounding the number of connections of each newcomer.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[EndpointRegistry] = None,
+        fanout: Optional[int] = None,
+        heartbeat_ttl: Optional[float] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        self.registry      = registry or ENDPOINT_REGISTRY
+        self.fanout        = config.CRYPTO_MESH_GOSSIP_FANOUT if fanout is None else fanout
+        self.heartbeat_ttl = heartbeat_ttl or config.CRYPTO_MESH_TOPOLOGY_HEARTBEAT_TTL
+        self.rng           = rng or random.Random()
+
+    def _is_healthy(self, peer: Peer, now: datetime) -> bool:
+        if peer.state not in HEALTHY_STATES or peer.reported_at is None:
+            return False
+        reported_at = peer.reported_at if peer.reported_at.tzinfo else peer.reported_at.replace(tzinfo=timezone.utc)
+        return (now - reported_at).total_seconds() <= self.heartbeat_ttl
+
+    async def topology_for(self, endpoint: EndpointModel) -> Topology:
+        now      = datetime.now(timezone.utc)
+        network  = network_of(endpoint)
+        healthy: List[Peer] = []
+        unknown: List[Peer] = []
+        for peer in await self.registry.snapshot():
+            if peer.endpoint.endpoint_id == endpoint.endpoint_id or network_of(peer.endpoint) != network:
+                continue
+            if self._is_healthy(peer, now):
+                healthy.append(peer)
+            elif peer.state is None:
+                unknown.append(peer)
+
+        chosen = self.rng.sample(healthy, min(self.fanout, len(healthy)))
+        missing = self.fanout - len(chosen)
+        if missing > 0:
+            chosen += self.rng.sample(unknown, min(missing, len(unknown)))
+        L.info({
+            "event": "TOPOLOGY.SEEDS.COMPUTED",
+            "endpoint_id": endpoint.endpoint_id,
+            "network": network,
+            "healthy": len(healthy),
+            "unknown": len(unknown),
+            "seeds": [p.endpoint.endpoint_id for p in chosen],
+        })
+        return Topology(
+            seeds     = [gossip_address(p.endpoint) for p in chosen],
+            endpoints = [endpoint_address(p.endpoint) for p in chosen],
+        )
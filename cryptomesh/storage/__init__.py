@@ -0,0 +1,3 @@
+from cryptomesh.storage.base import BlobStore
+from cryptomesh.storage.streams import HashingChunker
+from cryptomesh.storage.reclaimer import BlobReclaimer, ReclaimTask, BLOB_RECLAIMER, active_object_tasks
@@ -0,0 +1,67 @@
+import os
+from typing import Any, Optional
+
+from cryptomesh import config
+from cryptomesh.errors import CryptoMeshError
+from cryptomesh.log.logger import get_logger
+from cryptomesh.storage.base import BlobStore
+
+L = get_logger(__name__)
+
+MICTLANX_URI = os.environ.get("MICTLANX_URI", "mictlanx://mictlanx-router-0@localhost:60666?/api_version=4&protocol=http")
+BACKENDS = ("mictlanx", "local")
+
+_MICTLANX_STORAGE: Optional[Any] = None
+_BLOB_STORE: Optional[BlobStore] = None
+
+
+def backend() -> str:
+    name = config.CRYPTO_MESH_STORAGE_BACKEND
+    if name not in BACKENDS:
+        raise CryptoMeshError(f"Unknown storage backend '{name}' (expected one of {', '.join(BACKENDS)})", code=500)
+    return name
+
+
+def mictlanx_storage_service():
+    """
+    MictlanXStorageService shared by every request (one client and connection
+    pool per process). mictlanx/axo are only imported when this backend is used.
+    """
+    global _MICTLANX_STORAGE
+    if _MICTLANX_STORAGE is None:
+        from mictlanx import AsyncClient
+        from axo.storage.services import MictlanXStorageService
+        client = AsyncClient(
+            uri              = MICTLANX_URI,
+            log_output_path  = os.environ.get("MICTLANX_LOG_PATH", "/log/cryptomesh-mictlanx.log"),
+            capacity_storage = "4GB",
+            client_id        = "cryptomesh",
+            debug            = True,
+            eviction_policy  = "LRU",
+        )
+        _MICTLANX_STORAGE = MictlanXStorageService(client=client)
+    return _MICTLANX_STORAGE
+
+
+def get_blob_store() -> BlobStore:
+    global _BLOB_STORE
+    if _BLOB_STORE is None:
+        if backend() == "local":
+            from cryptomesh.storage.local_store import LocalBlobStore
+            _BLOB_STORE = LocalBlobStore(config.CRYPTO_MESH_LOCAL_STORAGE_PATH)
+        else:
+            from cryptomesh.storage.mictlanx_store import MictlanXBlobStore
+            _BLOB_STORE = MictlanXBlobStore(mictlanx_storage_service().client)
+        L.info({"event": "STORAGE.BACKEND.SELECTED", "backend": backend()})
+    return _BLOB_STORE
+
+
+def get_axo_storage():
+    """
+    AxoStorage over MictlanX, or None with the local backend (active-object
+    code and metadata are then written through the blob store).
+    """
+    if backend() == "local":
+        return None
+    from axo.storage import AxoStorage
+    return AxoStorage(storage=mictlanx_storage_service())
@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Dict, Optional
+
+
+class BlobStore(ABC):
+    """
+    Minimal byte-level interface over the object store used for active-object
+    artifacts. Implementations receive the content as an async iterator of
+    chunks and must not buffer more than one chunk at a time.
+
+    Stores that cannot serve reads set `supports_reads` to False; callers
+    check it before calling get_chunks. Stores that cannot rename a key in
+    place set `supports_moves` to False, and uploads are written straight to
+    their final key.
+    """
+    supports_reads: bool = True
+    supports_moves: bool = True
+
+    @abstractmethod
+    async def put_chunks(
+        self,
+        bucket_id: str,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        tags: Optional[Dict[str, str]] = None,
+    ) -> None:
+        ...
+
+    async def put(self, bucket_id: str, key: str, data: bytes) -> None:
+        async def single():
+            yield data
+        await self.put_chunks(bucket_id, key, single())
+
+    @abstractmethod
+    def get_chunks(self, bucket_id: str, key: str, chunk_size: int) -> AsyncIterator[bytes]:
+        ...
+
+    @abstractmethod
+    async def move(self, bucket_id: str, src_key: str, dst_key: str) -> None:
+        """
+        Atomically replaces `dst_key` with the blob stored under `src_key`.
+        """
+        ...
+
+    @abstractmethod
+    async def delete(self, bucket_id: str, key: str) -> None:
+        ...
+
+    @abstractmethod
+    async def delete_bucket(self, bucket_id: str) -> None:
+        ...
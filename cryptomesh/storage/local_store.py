@@ -0,0 +1,243 @@
+import asyncio
+import hashlib
+import mmap
+import os
+import shutil
+import tempfile
+import uuid
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import quote
+
+from cryptomesh.errors import NotFoundError
+from cryptomesh.log.logger import get_logger
+from cryptomesh.storage.base import BlobStore
+
+L = get_logger(__name__)
+
+
+class LocalBlobStore(BlobStore):
+    """
+    BlobStore on the local filesystem, for single-node deployments and
+    benchmarks that should not depend on a network object store.
+
+    Layout under `root`:
+        objects/<sha[:2]>/<sha>   content-addressed data (identical blobs are stored once)
+        refs/<bucket>/<key>       hard link to the object of that key
+        inodes/<inode>            sha256 of the object stored in that inode
+        tmp/                      in-flight uploads
+
+    A ref is a hard link, so resolving (bucket, key) is a single open() and
+    the object's link count doubles as its reference count: objects whose
+    only link is the one under objects/ are garbage. Deleting the last ref
+    finds its object through inodes/ and removes it right away;
+    collect_garbage() sweeps the whole store for anything left behind.
+    Reads are served from an mmap of the file, so chunks are memoryview
+    slices of the page cache.
+    """
+
+    def __init__(self, root: str):
+        self.root    = os.path.abspath(root)
+        self.objects = os.path.join(self.root, "objects")
+        self.refs    = os.path.join(self.root, "refs")
+        self.inodes  = os.path.join(self.root, "inodes")
+        self.tmp     = os.path.join(self.root, "tmp")
+        for path in (self.objects, self.refs, self.inodes, self.tmp):
+            os.makedirs(path, exist_ok=True)
+
+    # ----------------------------
+    # Paths
+    # ----------------------------
+    @staticmethod
+    def _safe(name: str) -> str:
+        # Bucket ids and keys are user supplied: never let them escape the store.
+        encoded = quote(name, safe="")
+        return encoded.replace(".", "%2E") if encoded in (".", "..") else encoded
+
+    def ref_path(self, bucket_id: str, key: str) -> str:
+        return os.path.join(self.refs, self._safe(bucket_id), self._safe(key))
+
+    def object_path(self, sha256: str) -> str:
+        return os.path.join(self.objects, sha256[:2], sha256)
+
+    def inode_path(self, inode: int) -> str:
+        return os.path.join(self.inodes, str(inode))
+
+    # ----------------------------
+    # Writes
+    # ----------------------------
+    def _link(self, tmp_path: str, sha256: str, bucket_id: str, key: str):
+        target = self.object_path(sha256)
+        ref    = self.ref_path(bucket_id, key)
+        staged = f"{ref}.{uuid.uuid4().hex}.tmp"
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.makedirs(os.path.dirname(ref), exist_ok=True)
+        try:
+            # Same content already stored: just add a link to it.
+            os.link(target, staged)
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            # The ref is linked before the object is published, so the
+            # garbage collector never sees a fresh object with a single link.
+            os.link(tmp_path, staged)
+            os.replace(tmp_path, target)
+            with open(self.inode_path(os.stat(target).st_ino), "w") as f:
+                f.write(sha256)
+        # Renaming over the ref keeps readers from ever seeing a missing key.
+        os.replace(staged, ref)
+
+    async def put_chunks(
+        self,
+        bucket_id: str,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        tags: Optional[Dict[str, str]] = None,
+    ) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.tmp)
+        digest = hashlib.sha256()
+        try:
+            with os.fdopen(fd, "wb") as f:
+                async for chunk in chunks:
+                    digest.update(chunk)
+                    await asyncio.to_thread(f.write, chunk)
+            await asyncio.to_thread(self._link, tmp_path, digest.hexdigest(), bucket_id, key)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    async def move(self, bucket_id: str, src_key: str, dst_key: str) -> None:
+        await asyncio.to_thread(self._move, bucket_id, src_key, dst_key)
+
+    def _move(self, bucket_id: str, src_key: str, dst_key: str):
+        src = self.ref_path(bucket_id, src_key)
+        dst = self.ref_path(bucket_id, dst_key)
+        if not os.path.exists(src):
+            raise NotFoundError(f"{bucket_id}/{src_key}")
+        try:
+            previous = os.stat(dst)
+        except FileNotFoundError:
+            previous = None
+        os.replace(src, dst)
+        if previous is not None and previous.st_ino != os.stat(dst).st_ino and previous.st_nlink <= 2:
+            # The replaced ref was the last one of its object.
+            self._remove_object(previous.st_ino)
+
+    # ----------------------------
+    # Reads
+    # ----------------------------
+    def open_mmap(self, bucket_id: str, key: str) -> Optional[mmap.mmap]:
+        """
+        Read-only map of the blob (None for empty blobs, which cannot be mapped).
+        """
+        try:
+            with open(self.ref_path(bucket_id, key), "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise NotFoundError(f"{bucket_id}/{key}")
+
+    async def get(self, bucket_id: str, key: str) -> bytes:
+        mapped = self.open_mmap(bucket_id, key)
+        if mapped is None:
+            return b""
+        with mapped:
+            return mapped[:]
+
+    def get_chunks(self, bucket_id: str, key: str, chunk_size: int) -> AsyncIterator[bytes]:
+        # The file is mapped before returning, so a missing key fails here and
+        # not in the middle of a streamed response.
+        mapped = self.open_mmap(bucket_id, key)
+        return self._iter_mapped(mapped, chunk_size)
+
+    @staticmethod
+    async def _iter_mapped(mapped: Optional[mmap.mmap], chunk_size: int) -> AsyncIterator[bytes]:
+        if mapped is None:
+            return
+        view = memoryview(mapped)
+        try:
+            for offset in range(0, len(view), chunk_size):
+                yield view[offset:offset + chunk_size]
+        finally:
+            view.release()
+            try:
+                mapped.close()
+            except BufferError:
+                # A consumer still holds the last slice; the map is closed
+                # when it is garbage collected.
+                pass
+
+    # ----------------------------
+    # Deletes
+    # ----------------------------
+    async def delete(self, bucket_id: str, key: str) -> None:
+        await asyncio.to_thread(self._delete, bucket_id, key)
+
+    def _delete(self, bucket_id: str, key: str):
+        self._unlink_ref(self.ref_path(bucket_id, key))
+
+    def _unlink_ref(self, ref: str):
+        try:
+            stat = os.stat(ref)
+            os.unlink(ref)
+        except FileNotFoundError:
+            return
+        if stat.st_nlink <= 2:
+            # That was the last ref of the object.
+            self._remove_object(stat.st_ino)
+
+    def _remove_object(self, inode: int):
+        index = self.inode_path(inode)
+        try:
+            with open(index) as f:
+                sha256 = f.read().strip()
+        except FileNotFoundError:
+            # Objects stored before the inode index are left to collect_garbage().
+            return
+        target = self.object_path(sha256)
+        try:
+            stat = os.stat(target)
+            if stat.st_ino == inode and stat.st_nlink > 1:
+                # Linked again by a concurrent upload of the same content.
+                return
+            if stat.st_ino == inode:
+                os.unlink(target)
+        except FileNotFoundError:
+            pass
+        os.unlink(index)
+
+    async def delete_bucket(self, bucket_id: str) -> None:
+        await asyncio.to_thread(self._delete_bucket, bucket_id)
+
+    def _delete_bucket(self, bucket_id: str):
+        bucket = os.path.join(self.refs, self._safe(bucket_id))
+        if not os.path.isdir(bucket):
+            return
+        for entry in os.scandir(bucket):
+            if entry.is_file():
+                self._unlink_ref(entry.path)
+        shutil.rmtree(bucket, ignore_errors=True)
+
+    def collect_garbage(self) -> int:
+        """
+        Full sweep: removes objects no ref links to any more (link count 1)
+        and index entries whose object is gone.
+        """
+        removed = 0
+        live = set()
+        for shard in os.scandir(self.objects):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                stat = entry.stat()
+                if stat.st_nlink == 1:
+                    os.unlink(entry.path)
+                    removed += 1
+                else:
+                    live.add(str(stat.st_ino))
+        for entry in os.scandir(self.inodes):
+            if entry.name not in live:
+                os.unlink(entry.path)
+        if removed:
+            L.debug({"event": "LOCAL_STORE.GC", "removed": removed})
+        return removed
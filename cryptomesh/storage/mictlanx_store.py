@@ -0,0 +1,50 @@
+from typing import AsyncIterator, Dict, Optional
+
+from mictlanx import AsyncClient
+
+from cryptomesh.errors import CryptoMeshError
+from cryptomesh.storage.base import BlobStore
+
+
+class MictlanXBlobStore(BlobStore):
+    """
+    BlobStore backed by a MictlanX router (the same client AxoStorage uses).
+    Write-only: blobs are read by the runtimes through MictlanX directly.
+    """
+    supports_reads = False
+    supports_moves = False
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def put_chunks(
+        self,
+        bucket_id: str,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        tags: Optional[Dict[str, str]] = None,
+    ) -> None:
+        res = await self.client.put_chunks(
+            bucket_id = bucket_id,
+            key       = key,
+            chunks    = chunks,
+            tags      = tags or {},
+        )
+        if res.is_err:
+            raise CryptoMeshError(f"MictlanX put failed for {bucket_id}/{key}: {res.unwrap_err()}", code=502)
+
+    def get_chunks(self, bucket_id: str, key: str, chunk_size: int) -> AsyncIterator[bytes]:
+        raise CryptoMeshError("Storage backend 'mictlanx' does not serve blob reads", code=501)
+
+    async def move(self, bucket_id: str, src_key: str, dst_key: str) -> None:
+        raise CryptoMeshError("Storage backend 'mictlanx' does not move blobs", code=501)
+
+    async def delete(self, bucket_id: str, key: str) -> None:
+        res = await self.client.delete(bucket_id=bucket_id, key=key)
+        if res.is_err:
+            raise CryptoMeshError(f"MictlanX delete failed for {bucket_id}/{key}: {res.unwrap_err()}", code=502)
+
+    async def delete_bucket(self, bucket_id: str) -> None:
+        res = await self.client.delete_bucket(bucket_id)
+        if res.is_err:
+            raise CryptoMeshError(f"MictlanX delete_bucket failed for {bucket_id}: {res.unwrap_err()}", code=502)
@@ -0,0 +1,188 @@
+import asyncio
+import time as T
+from collections import deque
+from typing import Any, Collection, Deque, Dict, Iterable, List, NamedTuple, Optional, Protocol, Set, Tuple
+
+from cryptomesh import config
+from cryptomesh.log.logger import get_logger
+from cryptomesh.models import ActiveObjectModel
+
+L = get_logger(__name__)
+
+
+class ReclaimTask(NamedTuple):
+    kind: str                  # axo_object | bucket | blob
+    bucket_id: str
+    key: Optional[str] = None
+
+
+class Reclaimable(Protocol):
+    async def reclaim(self, task: ReclaimTask) -> None: ...
+
+
+def active_object_tasks(model: ActiveObjectModel, in_use: Collection[Tuple[str, Optional[str]]] = ()) -> List[ReclaimTask]:
+    """
+    Everything an active object owns in the object store: its code/attrs
+    object, its source and sink buckets and the artifacts uploaded for it.
+    Buckets (bucket_id, None) and code objects or artifacts (bucket_id, key)
+    listed in `in_use` are still referenced by other active objects and are
+    left alone.
+    """
+    tasks = []
+    if (model.axo_bucket_id, model.axo_key) not in in_use:
+        tasks.append(ReclaimTask("axo_object", model.axo_bucket_id, model.axo_key))
+    tasks.extend(
+        ReclaimTask("bucket", bucket_id)
+        for bucket_id in dict.fromkeys((model.axo_source_bucket_id, model.axo_sink_bucket_id))
+        if (bucket_id, None) not in in_use
+    )
+    tasks.extend(
+        ReclaimTask("blob", ref.bucket_id, ref.key)
+        for ref in model.axo_artifacts
+        if (ref.bucket_id, ref.key) not in in_use
+    )
+    return tasks
+
+
+class BlobReclaimer:
+    """
+    Background queue that deletes blobs after their metadata is gone, so API
+    deletes never wait on the object store.
+
+    A single dispatcher takes up to `batch_size` tasks at a time and runs them
+    with at most `concurrency` in flight. Failed tasks are retried with
+    exponential backoff; after `max_attempts` they are kept in `failed` (a
+    bounded dead-letter list) and logged.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        concurrency: int,
+        max_attempts: int,
+        backoff: float,
+        queue_size: int,
+    ):
+        self.batch_size   = batch_size
+        self.concurrency  = concurrency
+        self.max_attempts = max_attempts
+        self.backoff      = backoff
+        self.queue: "asyncio.Queue[tuple]" = asyncio.Queue(maxsize=queue_size)
+        self.storage: Optional[Reclaimable] = None
+        self.failed: Deque[ReclaimTask] = deque(maxlen=1000)
+        self.reclaimed = 0
+        self.retried   = 0
+        self.dropped   = 0
+        self._retries: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def bind(self, storage: Reclaimable):
+        self.storage = storage
+
+    def enqueue(self, tasks: Iterable[ReclaimTask], attempt: int = 0):
+        for task in tasks:
+            try:
+                self.queue.put_nowait((task, attempt))
+            except asyncio.QueueFull:
+                self.dropped += 1
+                L.error({"event": "BLOB.RECLAIM.QUEUE_FULL", **task._asdict()})
+
+    def enqueue_active_objects(self, models: Iterable[ActiveObjectModel], in_use: Collection[Tuple[str, Optional[str]]] = ()):
+        # Objects deleted together may share buckets; each one is reclaimed once.
+        tasks = dict.fromkeys(task for model in models for task in active_object_tasks(model, in_use))
+        self.enqueue(tasks)
+
+    # ----------------------------
+    # Processing
+    # ----------------------------
+    async def _reclaim(self, task: ReclaimTask, attempt: int, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            try:
+                await self.storage.reclaim(task)
+                self.reclaimed += 1
+                return
+            except Exception as e:
+                error = str(e)
+        if attempt + 1 >= self.max_attempts:
+            self.failed.append(task)
+            L.error({"event": "BLOB.RECLAIM.FAILED", **task._asdict(), "attempts": attempt + 1, "reason": error})
+            return
+        self.retried += 1
+        L.warning({"event": "BLOB.RECLAIM.RETRY", **task._asdict(), "attempt": attempt + 1, "reason": error})
+        retry = asyncio.get_running_loop().create_task(self._retry_later(task, attempt + 1))
+        self._retries.add(retry)
+        retry.add_done_callback(self._retries.discard)
+
+    async def _retry_later(self, task: ReclaimTask, attempt: int):
+        await asyncio.sleep(self.backoff * (2 ** (attempt - 1)))
+        self.enqueue([task], attempt)
+
+    def _next_batch(self, first: tuple) -> List[tuple]:
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def process_batch(self, batch: List[tuple]):
+        t1 = T.time()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        await asyncio.gather(*(self._reclaim(task, attempt, semaphore) for task, attempt in batch))
+        for _ in batch:
+            self.queue.task_done()
+        L.debug({"event": "BLOB.RECLAIM.BATCH", "size": len(batch), "time": round(T.time() - t1, 4)})
+
+    async def run(self):
+        while True:
+            first = await self.queue.get()
+            await self.process_batch(self._next_batch(first))
+
+    async def drain(self):
+        """
+        Processes everything queued (including pending retries) in the current task.
+        """
+        while not self.queue.empty() or self._retries:
+            if self.queue.empty():
+                await asyncio.sleep(self.backoff / 2 or 0.01)
+                continue
+            await self.process_batch(self._next_batch(self.queue.get_nowait()))
+
+    def start(self, storage: Reclaimable):
+        self.bind(storage)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self):
+        # Pending retries are dropped with the rest of the in-memory queue.
+        for retry in list(self._retries):
+            retry.cancel()
+        if self._retries:
+            await asyncio.gather(*self._retries, return_exceptions=True)
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": self.queue.qsize(),
+            "retrying": len(self._retries),
+            "reclaimed": self.reclaimed,
+            "retried": self.retried,
+            "failed": len(self.failed),
+            "dropped": self.dropped,
+        }
+
+
+BLOB_RECLAIMER = BlobReclaimer(
+    batch_size   = config.CRYPTO_MESH_RECLAIM_BATCH_SIZE,
+    concurrency  = config.CRYPTO_MESH_RECLAIM_CONCURRENCY,
+    max_attempts = config.CRYPTO_MESH_RECLAIM_MAX_ATTEMPTS,
+    backoff      = config.CRYPTO_MESH_RECLAIM_BACKOFF,
+    queue_size   = config.CRYPTO_MESH_RECLAIM_QUEUE_SIZE,
+)
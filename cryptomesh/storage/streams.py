@@ -0,0 +1,43 @@
+import hashlib
+from typing import AsyncIterator, Optional
+
+from cryptomesh.errors import PayloadTooLargeError
+
+
+class HashingChunker:
+    """
+    Re-chunks an incoming byte stream (e.g. request.stream()) into pieces of
+    `chunk_size` bytes while computing its sha256 and size on the fly.
+
+    It is pull-based: the next piece is only read from the source when the
+    consumer asks for it, so at most one chunk (plus the remainder of the
+    current source chunk) is held in memory regardless of the object size.
+    """
+
+    def __init__(self, source: AsyncIterator[bytes], chunk_size: int, max_bytes: Optional[int] = None):
+        self.source     = source
+        self.chunk_size = chunk_size
+        self.max_bytes  = max_bytes
+        self.size       = 0
+        self._hash      = hashlib.sha256()
+
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        buffer = bytearray()
+        async for data in self.source:
+            if not data:
+                continue
+            self.size += len(data)
+            if self.max_bytes is not None and self.size > self.max_bytes:
+                raise PayloadTooLargeError(self.max_bytes)
+            self._hash.update(data)
+            buffer += data
+            while len(buffer) >= self.chunk_size:
+                chunk = bytes(buffer[:self.chunk_size])
+                del buffer[:self.chunk_size]
+                yield chunk
+        if buffer:
+            yield bytes(buffer)
@@ -1,5 +1,6 @@
 
 import ast
+import hashlib
 from typing import List, Optional
 from pydantic import ValidationError
 from cryptomesh.dtos import SchemaDTO
@@ -10,6 +11,13 @@ from cryptomesh.models import FunctionModel
 L = get_logger(__name__)
 
 class Utils:
+    @staticmethod
+    def hash_code(code: str) -> str:
+        """
+        Returns the hex sha256 digest of a source code string.
+        """
+        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
     @staticmethod
     def get_class_name_from_code(code_str: str) -> Optional[str]:
         """
@@ -0,0 +1,44 @@
+from typing import Dict, Hashable, Iterable, List, Mapping, Set, TypeVar
+
+from cryptomesh.errors import DependencyCycleError
+
+N = TypeVar("N", bound=Hashable)
+
+
+def topological_layers(nodes: Iterable[N], dependencies: Mapping[N, Iterable[N]]) -> List[List[N]]:
+    """
+    Groups `nodes` into layers (Kahn's algorithm) so that every node only depends
+    on nodes of previous layers; the nodes of one layer can run concurrently.
+
+    `dependencies[n]` lists the nodes `n` needs. Dependencies that are not in
+    `nodes` are ignored (they are assumed to exist already). The order inside
+    a layer follows the order of `nodes`.
+    """
+    ordered = list(dict.fromkeys(nodes))
+    known   = set(ordered)
+    pending: Dict[N, Set[N]] = {
+        n: {d for d in dependencies.get(n, ()) if d in known and d != n}
+        for n in ordered
+    }
+    dependents: Dict[N, List[N]] = {n: [] for n in ordered}
+    for n, deps in pending.items():
+        for d in deps:
+            dependents[d].append(n)
+
+    layers: List[List[N]] = []
+    current = [n for n in ordered if not pending[n]]
+    done = 0
+    while current:
+        layers.append(current)
+        done += len(current)
+        ready: Set[N] = set()
+        for n in current:
+            for dependent in dependents[n]:
+                pending[dependent].discard(n)
+                if not pending[dependent]:
+                    ready.add(dependent)
+        current = [n for n in ordered if n in ready]
+
+    if done != len(ordered):
+        raise DependencyCycleError([n for n in ordered if pending[n]])
+    return layers
@@ -0,0 +1,46 @@
+import hashlib
+from typing import Any, Optional
+from fastapi import Request, Response, status
+
+
+def quote_etag(value: str) -> str:
+    """
+    Wraps an opaque value as a strong ETag (RFC 9110 §8.8.3).
+    """
+    return f'"{value}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluates an If-None-Match header against the current ETag.
+    Supports lists of tags, the `*` wildcard and weak (W/) validators.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Builds a strong ETag from version tokens and request parameters
+    (e.g. collection versions, an entity id, a sparse fieldset).
+    """
+    raw = "|".join("" if p is None else str(p) for p in parts)
+    return quote_etag(hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32])
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    Returns a 304 response when the request's If-None-Match matches `etag`, otherwise None.
+    """
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
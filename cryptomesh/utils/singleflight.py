@@ -0,0 +1,95 @@
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls that share a key into a single execution.
+
+    The first caller (leader) starts the work as its own task; callers that
+    arrive while it is running await the same task instead of repeating it.
+    The work is shielded, so a caller that gives up (timeout, disconnect)
+    does not cancel it for the others. Followers can receive a copy of the
+    result (`copy`) when it is a mutable object callers may modify.
+
+    Only work whose result is the same for every caller may be collapsed:
+    reads and deterministic computations, never writes.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._flights: Dict[Hashable, asyncio.Task] = {}
+        self.executed  = 0
+        self.collapsed = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]], copy: Optional[Callable[[T], T]] = None) -> T:
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(fn())
+            self._flights[key] = task
+            task.add_done_callback(functools.partial(self._land, key))
+            self.executed += 1
+            return await asyncio.shield(task)
+        self.collapsed += 1
+        result = await asyncio.shield(task)
+        return result if copy is None or result is None else copy(result)
+
+    def _land(self, key: Hashable, task: asyncio.Task):
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        if not task.cancelled():
+            # Marks the exception as retrieved when every caller gave up.
+            task.exception()
+
+    def forget(self, predicate: Callable[[Hashable], bool]):
+        """
+        Later callers of matching keys start a new execution (e.g. after a
+        write made the running read stale); current waiters are unaffected.
+        """
+        for key in [k for k in self._flights if predicate(k)]:
+            del self._flights[key]
+
+    def stats(self) -> Dict[str, Any]:
+        calls = self.executed + self.collapsed
+        return {
+            "name": self.name,
+            "in_flight": len(self._flights),
+            "executed": self.executed,
+            "collapsed": self.collapsed,
+            "collapse_ratio": round(self.collapsed / calls, 4) if calls else 0.0,
+        }
+
+
+def copy_model(model: Any) -> Any:
+    """
+    Deep copy of a pydantic model (or list of models) for SingleFlight followers.
+    """
+    if isinstance(model, list):
+        return [copy_model(m) for m in model]
+    return model.model_copy(deep=True)
+
+
+def coalesced(flight: SingleFlight):
+    """
+    Decorates a repository read method so that concurrent calls with the same
+    arguments on the same collection share one query. Results are pydantic
+    models, so followers get their own copy.
+    """
+    def decorator(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs) -> T:
+            key = (self.collection.name, method.__name__, _freeze(args), _freeze(kwargs))
+            return await flight.do(key, lambda: method(self, *args, **kwargs), copy=copy_model)
+        return wrapper
+    return decorator
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
@@ -0,0 +1,65 @@
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from cryptomesh.errors import InvalidTransitionError, ValidationError
+
+
+class StateMachine:
+    """
+    Allowed transitions between the states of an entity. Staying in the same
+    state (e.g. a report that only changes metadata) is always allowed.
+
+    Besides validating a transition, the machine gives the states a target is
+    reachable from (`sources`), so a store can apply the transition with one
+    conditional update ("state in sources") instead of reading first.
+
+    `aliases` maps legacy state names to declared states: they are accepted
+    on input (and stored under the declared name), and documents still holding
+    a legacy name transition as if they held the declared one.
+    """
+
+    def __init__(self, name: str, transitions: Mapping[str, Iterable[str]], aliases: Optional[Mapping[str, str]] = None):
+        self.name = name
+        self.transitions: Dict[str, frozenset] = {s: frozenset(targets) for s, targets in transitions.items()}
+        self.aliases: Dict[str, str] = dict(aliases or {})
+        unknown = {t for targets in self.transitions.values() for t in targets} - set(self.transitions)
+        unknown |= set(self.aliases.values()) - set(self.transitions)
+        if unknown:
+            raise ValueError(f"{name}: transitions to undeclared states {sorted(unknown)}")
+
+    @property
+    def states(self) -> List[str]:
+        return list(self.transitions)
+
+    def canonical(self, state: str) -> str:
+        return self.aliases.get(state, state)
+
+    def validate_state(self, state: str) -> str:
+        """
+        Returns the declared name of `state` (resolving legacy aliases).
+        """
+        state = self.canonical(state)
+        if state not in self.transitions:
+            raise ValidationError(f"Unknown {self.name} state '{state}' (expected one of {', '.join(self.states)})")
+        return state
+
+    def can(self, current: str, target: str) -> bool:
+        current, target = self.canonical(current), self.canonical(target)
+        return current == target or target in self.transitions.get(current, ())
+
+    def check(self, current: str, target: str):
+        self.validate_state(target)
+        if not self.can(current, target):
+            raise InvalidTransitionError(self.name, current, target)
+
+    def sources(self, target: str, expected: Optional[str] = None) -> List[str]:
+        """
+        States from which `target` can be reached (narrowed to `expected` when
+        given), including the legacy aliases of those states.
+        """
+        self.validate_state(target)
+        if expected is not None:
+            self.check(expected, target)
+            sources = [self.canonical(expected)]
+        else:
+            sources = [s for s in self.transitions if self.can(s, target)]
+        return sources + [alias for alias, state in self.aliases.items() if state in sources]
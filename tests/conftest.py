@@ -11,6 +11,7 @@ pytest-asyncio. It includes configurations for:
 
 import asyncio
 import os
+from datetime import datetime, timedelta, timezone
 import pytest
 import pytest_asyncio
 from cryptomesh.db import connect_to_mongo, close_mongo_connection, get_client,get_database
@@ -102,6 +103,44 @@ async def clean_db(connect_and_get_client):
     await connect_and_get_client.drop_database(TEST_DB)
     yield
 
+# ───────────────────────────────
+# Fake Clock
+# ───────────────────────────────
+class FakeClock:
+    """
+    Manually advanced clock for components that take a `clock` callable.
+    Tests move time by setting or incrementing `now`.
+    """
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+# ───────────────────────────────
+# Endpoint Factory
+# ───────────────────────────────
+@pytest_asyncio.fixture
+async def insert_endpoint(get_db):
+    """
+    Factory that inserts an endpoint and, when `state` is given, a state
+    report made `age` seconds ago.
+
+    Returns:
+        Callable: insert(endpoint_id, state=None, age=0, cpu=1, ram="1GB", envs=None).
+    """
+    async def insert(endpoint_id: str, state: str = None, age: float = 0, cpu: int = 1, ram: str = "1GB", envs: dict = None):
+        await get_db["endpoints"].insert_one({
+            "endpoint_id": endpoint_id, "name": endpoint_id, "image": "axo", "security_policy": "sp",
+            "resources": {"cpu": cpu, "ram": ram}, "envs": envs or {},
+        })
+        if state:
+            await get_db["endpoint_states"].insert_one({
+                "state_id": f"st_{endpoint_id}", "endpoint_id": endpoint_id, "state": state, "metadata": {},
+                "timestamp": datetime.now(timezone.utc) - timedelta(seconds=age),
+            })
+    return insert
+
 @pytest_asyncio.fixture()
 async def client(event_loop):
     transport = ASGITransport(app=app)
@@ -0,0 +1,84 @@
+import asyncio
+import pytest
+
+from cryptomesh.admission import AdmissionController, RouteClass, classify
+from cryptomesh.errors import ServiceUnavailableError, TooManyRequestsError
+from conftest import FakeClock
+
+
+def _controller(clock=None, total: int = 2, max_queue: int = 10) -> AdmissionController:
+    def route_class(name, priority, limit):
+        return RouteClass(name, priority=priority, limit=limit, max_queue=max_queue, target=0.05, interval=0.5)
+    return AdmissionController(
+        [route_class("deploy", 0, 2), route_class("crud", 2, 2), route_class("telemetry", 3, 1)],
+        total_limit=total,
+        clock=clock or FakeClock(),
+    )
+
+
+def test_classify_routes():
+    assert classify("POST", "/api/v1/endpoint-states/") == "telemetry"
+    assert classify("GET", "/api/v1/endpoint-states/") == "crud"
+    assert classify("POST", "/api/v1/endpoints/deploy") == "deploy"
+    assert classify("POST", "/api/v1/functions/fn1/invoke") == "invoke"
+    assert classify("GET", "/api/v1/services/") == "crud"
+    assert classify("GET", "/healthz") is None
+
+
+@pytest.mark.asyncio
+async def test_freed_slots_go_to_higher_priority_first():
+    controller = _controller()
+    await controller.acquire("crud")
+    await controller.acquire("crud")
+
+    order = []
+
+    async def waiter(name):
+        await controller.acquire(name)
+        order.append(name)
+
+    tasks = [asyncio.create_task(waiter("telemetry")), asyncio.create_task(waiter("deploy"))]
+    await asyncio.sleep(0)
+    controller.release("crud")
+    await asyncio.sleep(0)
+    assert order == ["deploy"]
+    controller.release("crud")
+    await asyncio.gather(*tasks)
+    assert order == ["deploy", "telemetry"]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_shed_with_retry_after():
+    controller = _controller(total=10, max_queue=1)
+    await controller.acquire("telemetry")
+    queued = asyncio.create_task(controller.acquire("telemetry"))
+    await asyncio.sleep(0)
+    with pytest.raises(TooManyRequestsError) as e:
+        await controller.acquire("telemetry")
+    assert e.value.retry_after >= 1
+    assert controller.stats()["classes"]["telemetry"]["shed"] == 1
+    controller.release("telemetry")
+    await queued
+
+
+@pytest.mark.asyncio
+async def test_standing_queue_delay_is_shed():
+    clock = FakeClock()
+    controller = _controller(clock=clock, total=1)
+    await controller.acquire("crud")
+    waiters = [asyncio.create_task(controller.acquire("crud")) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    # First release above target starts the interval; the request is still admitted.
+    clock.now = 0.1
+    controller.release("crud")
+    await asyncio.sleep(0)
+    assert waiters[0].done() and waiters[0].exception() is None
+
+    # Delay stayed above target for a whole interval: queued requests are dropped.
+    clock.now = 0.7
+    controller.release("crud")
+    await asyncio.sleep(0)
+    assert isinstance(waiters[1].exception(), ServiceUnavailableError)
+    assert isinstance(waiters[2].exception(), ServiceUnavailableError)
+    assert controller.in_flight == 0
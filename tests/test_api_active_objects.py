@@ -161,3 +161,54 @@ async def test_delete_active_object(client):
     # Verificar que ya no existe
     get_res = await client.get(f"/api/v1/active-objects/{active_object_id}/")
     assert get_res.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_active_objects_omits_heavy_fields(client):
+    res = await client.get("/api/v1/active-objects/")
+    assert res.status_code == 200
+    for ao in res.json():
+        assert ao["axo_code"] is None
+        assert ao["axo_schema"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_active_objects_sparse_fields(client):
+    res = await client.get("/api/v1/active-objects/", params={"fields": "axo_alias,axo_version"})
+    assert res.status_code == 200
+    for ao in res.json():
+        assert set(ao.keys()) <= {"active_object_id", "axo_alias", "axo_version"}
+
+    bad = await client.get("/api/v1/active-objects/", params={"fields": "not_a_field"})
+    assert bad.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_active_object_code_with_etag(client):
+    create_dto = ActiveObjectCreateDTO(
+        axo_module           = "code.module",
+        axo_class_name       = "BellmanFord",
+        axo_version          = 1,
+        axo_alias            = "CodeAlias",
+        axo_bucket_id        = "test-bucket",
+        axo_code             = get_valid_code(),
+        axo_microservice_id  = "code-microservice",
+        axo_source_bucket_id = "source-bucket",
+        axo_sink_bucket_id   = "sink-bucket",
+        axo_key              = "code-key",
+    )
+    create_res = await client.post("/api/v1/active-objects/", json=create_dto.model_dump())
+    assert create_res.status_code == 201, create_res.text
+    active_object_id = create_res.json()["active_object_id"]
+
+    res = await client.get(f"/api/v1/active-objects/{active_object_id}/code")
+    assert res.status_code == 200
+    assert res.text == get_valid_code()
+    etag = res.headers["etag"]
+
+    not_modified = await client.get(
+        f"/api/v1/active-objects/{active_object_id}/code",
+        headers={"If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
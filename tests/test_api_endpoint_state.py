@@ -75,3 +75,45 @@ async def test_delete_endpoint_state(client):
 
     get_res = await client.get(f"/api/v1/endpoint-states/{state_id}/")
     assert get_res.status_code == 404
+
+
+# ✅ TEST: Las transiciones inválidas o con versión obsoleta devuelven 409
+@pytest.mark.asyncio
+async def test_update_endpoint_state_conflicts(client):
+    payload = {
+        "endpoint_id": "ep_test_conflict",
+        "state": "cold",
+        "metadata": {}
+    }
+    create_res = await client.post("/api/v1/endpoint-states/", json=payload)
+    assert create_res.status_code == 201
+    state_id = create_res.json()["state_id"]
+
+    res = await client.put(f"/api/v1/endpoint-states/{state_id}/", json={"state": "warm", "expected_version": 0})
+    assert res.status_code == 200
+    assert res.json()["version"] == 1
+
+    stale = await client.put(f"/api/v1/endpoint-states/{state_id}/", json={"state": "draining", "expected_version": 0})
+    assert stale.status_code == 409
+
+    invalid = await client.put(f"/api/v1/endpoint-states/{state_id}/", json={"state": "warming"})
+    assert invalid.status_code == 409
+
+    unknown = await client.put(f"/api/v1/endpoint-states/{state_id}/", json={"state": "exploded"})
+    assert unknown.status_code == 422
+
+
+# ✅ TEST: Los nombres de estado anteriores a la máquina de estados se aceptan y se normalizan
+@pytest.mark.asyncio
+async def test_legacy_endpoint_states(client, get_db):
+    create_res = await client.post("/api/v1/endpoint-states/", json={"endpoint_id": "ep_legacy", "state": "running", "metadata": {}})
+    assert create_res.status_code == 201
+    assert create_res.json()["state"] == "warm"
+
+    # Documents written before the state machine still transition.
+    await get_db["endpoint_states"].insert_one({
+        "state_id": "st_legacy_stored", "endpoint_id": "ep_legacy", "state": "pending", "metadata": {}, "version": 0,
+    })
+    res = await client.put("/api/v1/endpoint-states/st_legacy_stored/", json={"state": "warm"})
+    assert res.status_code == 200
+    assert res.json()["state"] == "warm"
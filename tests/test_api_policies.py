@@ -0,0 +1,61 @@
+import pytest
+
+from cryptomesh.policies.importer import PolicyImporter
+from cryptomesh.policies.plan import ID_FIELDS
+
+POLICY = """
+services:
+  s_import:
+    name: "Imported Service"
+    security_policy: "sp_import"
+    resources: {cpu: 1, ram: "1GB"}
+    policy_id: "policy_import"
+
+microservices:
+  ms_import:
+    name: "Imported Microservice"
+    service_id: "s_import"
+    resources: {cpu: 1, ram: "512MB"}
+    policy_id: "policy_import"
+"""
+
+
+@pytest.mark.asyncio
+async def test_import_policy(client, get_db):
+    headers = {"Content-Type": "application/yaml"}
+    response = await client.post("/api/v1/policies/import", content=POLICY, headers=headers)
+    assert response.status_code == 201
+    report = response.json()
+    assert report["entities"] == 2
+    assert report["collections"]["services"]["upserted"] == 1
+
+    service = await client.get("/api/v1/services/s_import/")
+    assert service.status_code == 200
+    assert service.json()["policy_id"] == "policy_import"
+    stored = await get_db["services"].find_one({"service_id": "s_import"})
+    assert stored["microservices"] == ["ms_import"]
+
+    # Re-importing the same file is idempotent.
+    again = await client.post("/api/v1/policies/import", content=POLICY, headers=headers)
+    assert again.status_code == 201
+    assert again.json()["collections"]["services"]["upserted"] == 0
+    assert await get_db["services"].count_documents({"service_id": "s_import"}) == 1
+
+    hierarchy = await client.get("/api/v1/hierarchy/s_import")
+    assert [ms["microservice_id"] for ms in hierarchy.json()["microservices"]] == ["ms_import"]
+
+
+@pytest.mark.asyncio
+async def test_import_invalid_policy(client):
+    response = await client.post("/api/v1/policies/import", content="services: [", headers={"Content-Type": "application/yaml"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_creates_unique_id_indexes(get_db):
+    # An import from an earlier version left a non-unique index behind.
+    await get_db["services"].create_index("service_id")
+    await PolicyImporter(get_db).ensure_indexes()
+    for kind, id_field in ID_FIELDS.items():
+        indexes = await get_db[kind].index_information()
+        assert indexes[f"{id_field}_1"].get("unique") is True
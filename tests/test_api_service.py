@@ -93,3 +93,32 @@ async def test_delete_service(client):
 
     get_res = await client.get(f"/api/v1/services/{service_id}/")
     assert get_res.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_services_conditional_get(client):
+    payload = {
+        "name": "ETag Service",
+        "security_policy": "sp_etag",
+        "resources": {"cpu": 1, "ram": "1GB"},
+        "policy_id": "policy_test_etag"
+    }
+    post_response = await client.post("/api/v1/services/", json=payload)
+    assert post_response.status_code == 201
+    service_id = post_response.json()["service_id"]
+
+    first = await client.get(f"/api/v1/services/{service_id}/")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    revalidated = await client.get(f"/api/v1/services/{service_id}/", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+
+    update = await client.put(f"/api/v1/services/{service_id}/", json={"security_policy": "sp_etag_2"})
+    assert update.status_code == 200
+
+    changed = await client.get(f"/api/v1/services/{service_id}/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["security_policy"] == "sp_etag_2"
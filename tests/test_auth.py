@@ -0,0 +1,149 @@
+import pytest
+
+from cryptomesh import config
+from cryptomesh.auth import AuthorizationEngine, Principal, compile_tables
+from cryptomesh.auth import dependencies
+from cryptomesh.auth.tokens import CachedTokenVerifier, HMACTokenVerifier, StaticTokenVerifier
+from cryptomesh.models import RoleModel, SecurityPolicyModel
+
+
+def _engine() -> AuthorizationEngine:
+    roles = [
+        RoleModel(role_id="r_reader", name="reader", description="", permissions=["read"]),
+        RoleModel(role_id="r_services", name="services_admin", description="", permissions=["services:*"]),
+    ]
+    policies = [
+        SecurityPolicyModel(sp_id="sp_api", name="api", roles=["reader", "r_services"], requires_authentication=True),
+        SecurityPolicyModel(sp_id="sp_open", name="open", roles=[], requires_authentication=False),
+    ]
+    engine = AuthorizationEngine(refresh_interval=60)
+    engine.load(compile_tables(roles, policies))
+    return engine
+
+
+def test_compiled_permission_checks():
+    engine = _engine()
+    reader = Principal("u1", frozenset({"r_reader"}))
+    admin = Principal("u2", frozenset({"services_admin"}))
+
+    assert engine.is_allowed(reader, "sp_api", "services", "read")
+    assert not engine.is_allowed(reader, "sp_api", "services", "write")
+    assert engine.is_allowed(admin, "sp_api", "services", "delete")
+    assert not engine.is_allowed(admin, "sp_api", "roles", "delete")
+    assert not engine.is_allowed(None, "sp_api", "services", "read")
+    assert engine.is_allowed(None, "sp_open", "services", "write")
+    assert not engine.is_allowed(reader, "unknown", "services", "read")
+    # Without a policy every role of the principal counts.
+    assert engine.is_allowed(admin, None, "services", "write")
+
+
+def test_engine_goes_stale_on_role_changes():
+    engine = _engine()
+    engine.on_version_bump("services", "e.1")
+    assert not engine.stale
+    engine.on_version_bump("roles", "e.1")
+    assert engine.stale
+
+
+@pytest.mark.asyncio
+async def test_api_requires_permission(client, monkeypatch):
+    # Policies may reference roles by name (as the YAML policy files do).
+    role = {"name": "auth_reader", "description": "", "permissions": ["read"]}
+    policy = {"sp_id": "sp_auth_api", "name": "api", "roles": ["auth_reader"], "requires_authentication": True}
+    assert (await client.post("/api/v1/roles/", json=role)).status_code == 201
+    assert (await client.post("/api/v1/security-policies/", json=policy)).status_code == 201
+
+    monkeypatch.setattr(config, "CRYPTO_MESH_AUTH_ENABLED", True)
+    monkeypatch.setattr(config, "CRYPTO_MESH_AUTH_POLICY", "sp_auth_api")
+    monkeypatch.setattr(dependencies, "TOKEN_VERIFIER", StaticTokenVerifier.from_spec("reader-token:auth_reader"))
+    headers = {"Authorization": "Bearer reader-token"}
+
+    assert (await client.get("/api/v1/roles/")).status_code == 401
+    assert (await client.get("/api/v1/roles/", headers=headers)).status_code == 200
+    denied = await client.delete("/api/v1/roles/any-role/", headers=headers)
+    assert denied.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_cached_token_verifier():
+    now = [1000.0]
+    signer = HMACTokenVerifier("secret", clock=lambda: now[0])
+    calls = []
+
+    class Counting:
+        async def verify(self, token):
+            calls.append(token)
+            return await signer.verify(token)
+
+    verifier = CachedTokenVerifier(Counting(), ttl=300, negative_ttl=30, max_size=16, clock=lambda: now[0])
+    token = signer.issue("alice", ["reader"], ttl=60)
+
+    principal = await verifier.verify(token)
+    assert principal.subject == "alice" and principal.roles == frozenset({"reader"})
+    assert await verifier.verify(token) == principal
+    assert len(calls) == 1
+
+    # Rejections are cached too, and tampered tokens never verify.
+    assert await verifier.verify(token[:-2] + "xx") is None
+    assert await verifier.verify(token[:-2] + "xx") is None
+    assert len(calls) == 2
+
+    # Cached claims never outlive the token.
+    now[0] += 61
+    assert await verifier.verify(token) is None
+
+    now[0] += 1
+    fresh = signer.issue("alice", ["reader"], ttl=60)
+    assert await verifier.verify(fresh) is not None
+    await verifier.revoke_subject("alice")
+    assert await verifier.verify(fresh) is None
+
+
+class _MemoryRevocations:
+    def __init__(self):
+        self.docs = {}
+
+    async def add(self, kind, value, revoked_at, expires_at=None):
+        self.docs[f"{kind}:{value}"] = {"kind": kind, "value": value, "revoked_at": revoked_at, "expires_at": expires_at}
+
+    async def since(self, revoked_at):
+        return [doc for doc in self.docs.values() if doc["revoked_at"] >= revoked_at]
+
+
+@pytest.mark.asyncio
+async def test_revocations_outlive_cache_and_reach_other_workers():
+    now = [1000.0]
+    clock = lambda: now[0]
+    signer = HMACTokenVerifier("secret", max_lifetime=3600, clock=clock)
+    store = _MemoryRevocations()
+    worker_a = CachedTokenVerifier(signer, ttl=300, negative_ttl=30, max_size=2, max_token_lifetime=3600, store=lambda: store, clock=clock)
+    worker_b = CachedTokenVerifier(signer, ttl=300, negative_ttl=30, max_size=2, max_token_lifetime=3600, store=lambda: store, clock=clock)
+
+    token = signer.issue("bob", ["reader"], ttl=1800)
+    assert await worker_b.verify(token) is not None
+    await worker_a.revoke(token=token)
+    # More revocations than max_size never evict the first one.
+    for i in range(5):
+        await worker_a.revoke(token_id=f"jti-{i}")
+    assert await worker_a.verify(token) is None
+
+    # The other worker drops its cached claims on the next sync.
+    now[0] += 3
+    assert await worker_b.verify(token) is None
+
+    # Revocations are forgotten once nothing they block can still be valid.
+    await worker_a.revoke_subject("bob")
+    now[0] += 3601
+    await worker_a.maintain(force=True)
+    assert worker_a.revoked_subjects == {} and worker_a.revoked == {}
+
+
+@pytest.mark.asyncio
+async def test_max_lifetime_bounds_signed_tokens():
+    now = [1000.0]
+    signer = HMACTokenVerifier("secret", clock=lambda: now[0])
+    bounded = HMACTokenVerifier("secret", max_lifetime=600, clock=lambda: now[0])
+    long_lived = signer.issue("carol", ["reader"], ttl=3600)
+    assert await signer.verify(long_lived) is not None
+    assert await bounded.verify(long_lived) is None
+    assert await bounded.verify(bounded.issue("carol", ["reader"], ttl=3600)) is not None
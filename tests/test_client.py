@@ -594,7 +594,7 @@ async def test_delete_function_result():
 async def test_create_endpoint_state():
     create_dto = EndpointStateCreateDTO(
         endpoint_id="e1",
-        state="running"
+        state="warm"
     )
 
     result = await client.create_endpoint_state(create_dto)
@@ -602,13 +602,13 @@ async def test_create_endpoint_state():
     endpoint_state_response = result.unwrap()
 
     assert endpoint_state_response.endpoint_id == "e1"
-    assert endpoint_state_response.state == "running"
+    assert endpoint_state_response.state == "warm"
 
 @pytest.mark.asyncio
 async def test_get_endpoint_state():
     create_dto = EndpointStateCreateDTO(
         endpoint_id="e1",
-        state="running"
+        state="warm"
     )
 
     result = await client.create_endpoint_state(create_dto)
@@ -621,13 +621,13 @@ async def test_get_endpoint_state():
 
     assert endpoint_state_get.state_id == endpoint_state_response.state_id
     assert endpoint_state_get.endpoint_id == "e1"
-    assert endpoint_state_get.state == "running"
+    assert endpoint_state_get.state == "warm"
 
 @pytest.mark.asyncio
 async def test_update_endpoint_state():
     create_dto = EndpointStateCreateDTO(
         endpoint_id="e1",
-        state="running"
+        state="warm"
     )
 
     result = await client.create_endpoint_state(create_dto)
@@ -635,20 +635,20 @@ async def test_update_endpoint_state():
     endpoint_state_response = result.unwrap()
 
     update_dto = EndpointStateUpdateDTO(
-        state="pending"
+        state="draining"
     )
 
     result = await client.update_endpoint_state(endpoint_state_response.state_id, update_dto)
     assert result.is_ok
     endpoint_state_update = result.unwrap()
 
-    assert endpoint_state_update.state == "pending"
+    assert endpoint_state_update.state == "draining"
 
 @pytest.mark.asyncio
 async def test_delete_endpoint_state():
     create_dto = EndpointStateCreateDTO(
         endpoint_id="e1",
-        state="running"
+        state="warm"
     )
 
     result = await client.create_endpoint_state(create_dto)
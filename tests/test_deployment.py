@@ -0,0 +1,89 @@
+import asyncio
+import json
+import pytest
+from option import Ok, Err
+
+from cryptomesh.controllers.activeobjects_controller import get_deployment_service
+from cryptomesh.errors import DependencyCycleError, NotFoundError
+from cryptomesh.repositories.activeobjects_repository import ActiveObjectsRepository
+from cryptomesh.repositories.endpoints_repository import EndpointsRepository
+from cryptomesh.server import app
+from cryptomesh.services.deployment_service import DeploymentService
+
+
+async def _active_object(get_db, active_object_id: str, endpoint_id: str, dependencies=(), alias: str = None):
+    await get_db["active_objects"].insert_one({
+        "active_object_id": active_object_id, "axo_module": "m", "axo_class_name": "C",
+        "axo_microservice_id": "ms", "axo_endpoint_id": endpoint_id, "axo_alias": alias,
+        "axo_dependencies": list(dependencies),
+    })
+
+
+def _service(get_db, deployed: list, fail: set = frozenset()) -> DeploymentService:
+    async def deploy_endpoint(endpoint_id, dependencies):
+        await asyncio.sleep(0.01)
+        deployed.append((endpoint_id, dependencies))
+        return Err(Exception("summoner down")) if endpoint_id in fail else Ok(None)
+
+    return DeploymentService(
+        ActiveObjectsRepository(get_db["active_objects"]),
+        EndpointsRepository(get_db["endpoints"]),
+        deploy_endpoint,
+    )
+
+
+@pytest.mark.asyncio
+async def test_deployment_plan_orders_layers_and_endpoint_dependencies(get_db, insert_endpoint):
+    await insert_endpoint("dep_ep_store")
+    await insert_endpoint("dep_ep_cache")
+    await insert_endpoint("dep_ep_api", envs={"AXO_ENDPOINT_DEPENDENCIES": "dep_ep_cache"})
+    await _active_object(get_db, "dep_ao_store", "dep_ep_store", alias="store")
+    await _active_object(get_db, "dep_ao_api", "dep_ep_api", dependencies=["store"])
+
+    deployed = []
+    svc = _service(get_db, deployed)
+    plan = await svc.plan(["dep_ao_api"])
+    assert plan.layers[0] == ["endpoints/dep_ep_store", "endpoints/dep_ep_cache"]
+    assert plan.layers[1] == ["endpoints/dep_ep_api", "active_objects/dep_ao_store"]
+    assert plan.layers[2] == ["active_objects/dep_ao_api"]
+    assert plan.endpoint_dependencies["dep_ep_api"] == ["dep_ep_cache", "dep_ep_store"]
+
+    events = [event async for event in svc.execute(plan)]
+    assert events[-1]["event"] == "deployment.finished" and events[-1]["deployed"] == 5
+    assert ("dep_ep_api", ["dep_ep_cache", "dep_ep_store"]) in deployed
+
+
+@pytest.mark.asyncio
+async def test_deployment_rejects_cycles_and_skips_after_failure(get_db, insert_endpoint):
+    await insert_endpoint("cyc_ep")
+    await _active_object(get_db, "cyc_a", "cyc_ep", dependencies=["cyc_b"])
+    await _active_object(get_db, "cyc_b", "cyc_ep", dependencies=["cyc_a"])
+    svc = _service(get_db, [], fail={"fail_ep"})
+    with pytest.raises(DependencyCycleError):
+        await svc.plan(["cyc_a"])
+    with pytest.raises(NotFoundError):
+        await svc.plan(["missing_ao"])
+
+    await insert_endpoint("fail_ep")
+    await _active_object(get_db, "fail_ao", "fail_ep")
+    events = [event async for event in svc.execute(await svc.plan(["fail_ao"]))]
+    assert [e["event"] for e in events] == ["plan", "layer.started", "node.failed", "node.skipped", "deployment.finished"]
+    assert events[-1]["ok"] is False
+
+
+@pytest.mark.asyncio
+async def test_deploy_active_objects_streams_ndjson(client, get_db, insert_endpoint):
+    await insert_endpoint("api_dep_ep")
+    await _active_object(get_db, "api_dep_ao", "api_dep_ep")
+    app.dependency_overrides[get_deployment_service] = lambda: _service(get_db, [])
+    try:
+        res = await client.post("/api/v1/active-objects/deploy", json={"active_object_ids": ["api_dep_ao"]})
+        assert res.status_code == 200
+        assert res.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in res.text.splitlines()]
+        assert events[0]["event"] == "plan" and events[-1]["ok"] is True
+
+        res = await client.post("/api/v1/active-objects/deploy", json={"active_object_ids": ["nope"]})
+        assert res.status_code == 404
+    finally:
+        app.dependency_overrides.pop(get_deployment_service, None)
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from cryptomesh.dtos.function_state_dto import (
     FunctionStateCreateDTO,
@@ -7,7 +8,7 @@ from cryptomesh.dtos.function_state_dto import (
 from cryptomesh.models import FunctionStateModel
 from cryptomesh.repositories.function_state_repository import FunctionStateRepository
 from cryptomesh.services.function_state_service import FunctionStateService
-from cryptomesh.errors import NotFoundError
+from cryptomesh.errors import NotFoundError, ConflictError, InvalidTransitionError
 
 @pytest.mark.asyncio
 async def test_create_function_state(get_db):
@@ -119,3 +120,47 @@ async def test_list_function_states(get_db):
 
     assert "fs_list_1" in state_ids
     assert "fs_list_2" in state_ids
+
+
+@pytest.mark.asyncio
+async def test_function_state_transitions_are_compare_and_set(get_db):
+    db = get_db
+    repo = FunctionStateRepository(db.function_states)
+    service = FunctionStateService(repo)
+
+    create_dto = FunctionStateCreateDTO(function_id="fn_cas", state="pending", metadata={})
+    created = await service.create_state(FunctionStateCreateDTO.to_model(create_dto, state_id="fs_cas"))
+
+    # Two reporters race from the same version: exactly one wins.
+    results = await asyncio.gather(
+        service.update_state(created.state_id, {"state": "running"}, expected_version=0),
+        service.update_state(created.state_id, {"state": "cancelled"}, expected_version=0),
+        return_exceptions=True
+    )
+    assert sum(isinstance(r, ConflictError) for r in results) == 1
+    winner = next(r for r in results if not isinstance(r, Exception))
+    assert winner.version == 1
+
+    with pytest.raises(ConflictError):
+        await service.update_state(created.state_id, {"metadata": {"x": "1"}}, expected_state="failed")
+
+    done = await service.update_state(created.state_id, {"state": "pending"})
+    assert done.version == 2
+    with pytest.raises(InvalidTransitionError):
+        await service.update_state(created.state_id, {"state": "completed"})
+    with pytest.raises(NotFoundError):
+        await service.update_state("missing", {"state": "running"})
+
+
+@pytest.mark.asyncio
+async def test_state_writes_are_not_versioned(get_db):
+    db = get_db
+    repo = FunctionStateRepository(db.function_states)
+    service = FunctionStateService(repo)
+
+    await service.create_state(FunctionStateCreateDTO.to_model(
+        FunctionStateCreateDTO(function_id="fn_unversioned", state="running", metadata={}),
+        state_id="fs_unversioned"
+    ))
+    # Telemetry writes are one round-trip: no collection_versions counter is bumped.
+    assert await db.collection_versions.find_one({"_id": "function_states"}) is None
@@ -0,0 +1,227 @@
+import asyncio
+import json
+import pytest
+
+from cryptomesh.controllers.functions_controller import get_invocation_gateway
+from cryptomesh.errors import ServiceUnavailableError
+from cryptomesh.gateway import ConnectionPool, InvocationGateway
+from cryptomesh.gateway.batcher import MicroBatcher
+from cryptomesh.gateway.pool import FRAME_HEADER
+from cryptomesh.gateway.result_cache import MemoryResultCache, cache_key
+from cryptomesh.server import app
+
+
+async def _serve(delay: float = 0.0, requests: list = None):
+    """
+    Fake AXO endpoint: answers every framed request with {"ok": true, "result": <echo>}
+    (one response per call for batch requests).
+    """
+    def answer(request, call):
+        return {"ok": True, "result": {"method": request["method"], **call["call_params"]}}
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                (size,) = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+                request = json.loads(await reader.readexactly(size))
+                if requests is not None:
+                    requests.append(request)
+                await asyncio.sleep(delay)
+                if "batch" in request:
+                    response = {"results": [answer(request, call) for call in request["batch"]]}
+                else:
+                    response = answer(request, request)
+                body = json.dumps(response).encode()
+                writer.write(FRAME_HEADER.pack(len(body)) + body)
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def _gateway(max_in_flight: int = 8) -> InvocationGateway:
+    pool = ConnectionPool(max_per_endpoint=4, idle_timeout=60, connect_timeout=1, max_frame_bytes=1 << 20)
+    return InvocationGateway(
+        pool, max_in_flight=max_in_flight, acquire_timeout=0.05, timeout=1, route_ttl=60, max_pending_results=100,
+        result_cache=MemoryResultCache(max_size=100),
+    )
+
+
+async def _deploy_function(get_db, function_id: str, port: int, **function):
+    await get_db["endpoints"].insert_one({
+        "endpoint_id": f"ep_{function_id}", "name": "ep", "image": "axo", "security_policy": "sp",
+        "resources": {"cpu": 1, "ram": "1GB"}, "envs": {"NODE_IP_ADDR": "127.0.0.1", "AXO_REQ_RES_PORT": str(port)},
+    })
+    await get_db["active_objects"].insert_one({
+        "active_object_id": f"ao_{function_id}", "axo_module": "m", "axo_class_name": "Calc",
+        "axo_microservice_id": "ms", "axo_endpoint_id": f"ep_{function_id}",
+        "axo_bucket_id": "b", "axo_key": "calc",
+        "functions": [{"function_id": function_id, "name": "add", **function}],
+    })
+
+
+@pytest.mark.asyncio
+async def test_invoke_function_reuses_connections_and_records_results(client, get_db):
+    server, port = await _serve()
+    gateway = _gateway()
+    app.dependency_overrides[get_invocation_gateway] = lambda: gateway
+    try:
+        await _deploy_function(get_db, "fn_invoke", port)
+        for i in range(3):
+            res = await client.post("/api/v1/functions/fn_invoke/invoke", json={"call_params": {"x": i}})
+            assert res.status_code == 200
+            assert res.json()["result"] == {"method": "add", "x": i}
+            assert res.json()["endpoint_id"] == "ep_fn_invoke"
+        assert gateway.pool.stats()["opened"] == 1
+        assert gateway.pool.stats()["reused"] == 2
+
+        await gateway.drain()
+        assert await get_db["function_results"].count_documents({"function_id": "fn_invoke"}) == 3
+
+        res = await client.post("/api/v1/functions/missing/invoke", json={})
+        assert res.status_code == 404
+    finally:
+        app.dependency_overrides.pop(get_invocation_gateway, None)
+        await gateway.close()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_invoke_rejects_when_saturated(get_db):
+    server, port = await _serve(delay=0.2)
+    gateway = _gateway(max_in_flight=1)
+    try:
+        await _deploy_function(get_db, "fn_busy", port)
+        results = await asyncio.gather(
+            gateway.invoke("fn_busy", {}, {}),
+            gateway.invoke("fn_busy", {}, {}),
+            return_exceptions=True,
+        )
+        assert sum(isinstance(r, ServiceUnavailableError) for r in results) == 1
+        assert gateway.stats()["rejected"] == 1
+    finally:
+        await gateway.close()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_cacheable_function_results_are_memoized(get_db):
+    server, port = await _serve()
+    gateway = _gateway()
+    try:
+        await _deploy_function(get_db, "fn_cached", port, cacheable=True)
+        await _deploy_function(get_db, "fn_uncached", port)
+
+        first = await gateway.invoke("fn_cached", {"a": 1, "b": 2}, {})
+        await gateway.drain()
+        second = await gateway.invoke("fn_cached", {"b": 2, "a": 1}, {})
+        assert not first.cached and second.cached
+        assert second.result == first.result
+        assert not (await gateway.invoke("fn_cached", {"a": 2, "b": 2}, {})).cached
+
+        await gateway.invoke("fn_uncached", {"a": 1}, {})
+        await gateway.drain()
+        assert not (await gateway.invoke("fn_uncached", {"a": 1}, {})).cached
+        assert gateway.stats()["cache_hits"] == 1
+    finally:
+        await gateway.close()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_writes_respect_zero_ttl_and_pending_budget(get_db):
+    server, port = await _serve()
+    gateway = _gateway()
+    try:
+        await _deploy_function(get_db, "fn_ttl_zero", port, cacheable=True, cache_ttl=0)
+        await _deploy_function(get_db, "fn_budget", port, cacheable=True)
+
+        await gateway.invoke("fn_ttl_zero", {"a": 1}, {})
+        await gateway.drain()
+        assert not (await gateway.invoke("fn_ttl_zero", {"a": 1}, {})).cached
+
+        gateway.max_pending_results = 0
+        await gateway.invoke("fn_budget", {"a": 1}, {})
+        assert gateway.stats()["uncached"] == 1 and gateway.stats()["pending_results"] == 0
+    finally:
+        await gateway.close()
+        server.close()
+
+
+def test_cache_key_includes_active_object_version():
+    assert cache_key("f", "1-abc", {}, {"x": [1, 2]}) == cache_key("f", "1-abc", {}, {"x": [1, 2]})
+    assert cache_key("f", "1-abc", {}, {"x": 1}) != cache_key("f", "2-def", {}, {"x": 1})
+
+
+@pytest.mark.asyncio
+async def test_identical_cacheable_invocations_are_coalesced(get_db):
+    server, port = await _serve(delay=0.05)
+    gateway = _gateway()
+    try:
+        await _deploy_function(get_db, "fn_burst", port, cacheable=True)
+        results = await asyncio.gather(*(gateway.invoke("fn_burst", {"x": 1}, {}) for _ in range(5)))
+        assert all(r.result == {"method": "add", "x": 1} for r in results)
+        assert gateway.stats()["invocations"] == 1
+        assert gateway.stats()["coalescing"]["collapsed"] == 4
+    finally:
+        await gateway.close()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_flushes_on_size_and_wait():
+    sent = []
+
+    async def send(calls):
+        sent.append(len(calls))
+        return [c.call_params["x"] * 2 for c in calls]
+
+    batcher = MicroBatcher(send, max_size=3, max_wait=0.01)
+    assert await asyncio.gather(*(batcher.submit({"x": i}, {}) for i in range(4))) == [0, 2, 4, 6]
+    assert sent == [3, 1]
+
+    async def fail(calls):
+        raise RuntimeError("endpoint down")
+
+    batcher = MicroBatcher(fail, max_size=2, max_wait=0.01)
+    results = await asyncio.gather(batcher.submit({}, {}), batcher.submit({}, {}), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_batched_function_sends_one_request_per_batch(get_db):
+    requests = []
+    server, port = await _serve(requests=requests)
+    gateway = _gateway()
+    try:
+        await _deploy_function(get_db, "fn_batched", port, batch_max_size=4, batch_max_wait=0.05)
+        results = await asyncio.gather(*(gateway.invoke("fn_batched", {"x": i}, {}) for i in range(4)))
+        assert [r.result["x"] for r in results] == [0, 1, 2, 3]
+        assert len(requests) == 1 and len(requests[0]["batch"]) == 4
+        assert gateway.stats()["batching"][f"fn_batched@127.0.0.1:{port}"]["batches"] == 1
+    finally:
+        await gateway.close()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_route_changes_drop_batchers(get_db):
+    requests = []
+    server, port = await _serve(requests=requests)
+    gateway = _gateway()
+    try:
+        await _deploy_function(get_db, "fn_rebatched", port, batch_max_size=2, batch_max_wait=0.01)
+        await gateway.invoke("fn_rebatched", {"x": 1}, {})
+        assert len(gateway.batchers) == 1
+
+        # A new version of the active object lives under another key.
+        await get_db["active_objects"].update_one({"active_object_id": "ao_fn_rebatched"}, {"$set": {"axo_key": "calc-v2", "axo_version": 2}})
+        gateway.on_version_bump("active_objects", "e.2")
+        assert gateway.batchers == {}
+
+        await gateway.invoke("fn_rebatched", {"x": 2}, {})
+        assert [r["key"] for r in requests] == ["calc", "calc-v2"]
+    finally:
+        await gateway.close()
+        server.close()
@@ -0,0 +1,80 @@
+import asyncio
+import pytest
+
+from cryptomesh.health import HEALTH_MONITOR, HealthMonitor, mictlanx_address
+from conftest import FakeClock
+
+
+@pytest.mark.asyncio
+async def test_readiness_follows_required_checks_and_goes_stale():
+    calls = {"mongo": 0}
+    mongo_up = {"ok": True}
+
+    async def mongo():
+        calls["mongo"] += 1
+        if not mongo_up["ok"]:
+            raise ConnectionError("connection refused")
+
+    async def summoner():
+        await asyncio.sleep(1)
+
+    clock = FakeClock(now=1000.0)
+    monitor = HealthMonitor(interval=5, timeout=0.05, required=["mongo"], clock=clock)
+    monitor.register("mongo", mongo)
+    monitor.register("summoner", summoner)
+    assert not monitor.ready and monitor.report()["status"] == "starting"
+
+    await monitor.run_once()
+    report = monitor.report()
+    # A slow optional dependency is reported but does not make the process unready.
+    assert monitor.ready and report["status"] == "ready"
+    assert report["checks"]["summoner"]["ok"] is False and "timed out" in report["checks"]["summoner"]["error"]
+
+    # Probes read the cached results: no check runs between rounds.
+    for _ in range(10):
+        monitor.report()
+    assert calls["mongo"] == 1
+
+    mongo_up["ok"] = False
+    await monitor.run_once()
+    assert not monitor.ready and monitor.report()["checks"]["mongo"]["error"] == "connection refused"
+
+    mongo_up["ok"] = True
+    await monitor.run_once()
+    assert monitor.ready
+    clock.now += 60
+    assert not monitor.ready
+
+    await monitor.stop()
+    assert monitor.report()["status"] == "stopping"
+
+
+def test_mictlanx_address_from_uri():
+    assert mictlanx_address("mictlanx://mictlanx-router-0@router.local:60777?/api_version=4&protocol=http") == ("router.local", 60777)
+
+
+@pytest.mark.asyncio
+async def test_probe_routes(client):
+    res = await client.get("/healthz")
+    assert res.status_code == 200 and res.json()["status"] == "ok"
+
+    checks, results, rounds = dict(HEALTH_MONITOR.checks), dict(HEALTH_MONITOR.results), HEALTH_MONITOR.rounds
+
+    async def failing():
+        raise ConnectionError("down")
+
+    try:
+        HEALTH_MONITOR.checks = {name: failing for name in HEALTH_MONITOR.required}
+        await HEALTH_MONITOR.run_once()
+        res = await client.get("/readyz")
+        assert res.status_code == 503 and res.json()["status"] == "unready"
+
+        async def passing():
+            return None
+
+        HEALTH_MONITOR.checks = {name: passing for name in HEALTH_MONITOR.required}
+        await HEALTH_MONITOR.run_once()
+        res = await client.get("/readyz")
+        assert res.status_code == 200 and res.json()["status"] == "ready"
+    finally:
+        HEALTH_MONITOR.checks, HEALTH_MONITOR.results, HEALTH_MONITOR.rounds = checks, results, rounds
@@ -1,6 +1,9 @@
 # tests/test_hierarchy.py
 import pytest
 from cryptomesh.dtos.hierarchy_dto import ServiceHierarchyDTO
+from cryptomesh.dtos import ActiveObjectCreateDTO
+from cryptomesh.models import MicroserviceModel, ServiceModel
+from cryptomesh.services.hierarchy_service import HierarchySnapshot
 
 @pytest.mark.asyncio
 async def test_get_hierarchy(client):
@@ -40,3 +43,66 @@ async def test_get_hierarchy(client):
                     assert "name" in method
                     assert "parameters" in method
                     assert isinstance(method["parameters"], list)
+
+
+
+@pytest.mark.asyncio
+async def test_hierarchy_snapshot_is_patched_on_writes(client):
+    """
+    Crear, mover y borrar nodos debe reflejarse en /hierarchy y /hierarchy/{service_id}.
+    """
+    service_ids = []
+    for name in ("Service H1", "Service H2"):
+        res = await client.post("/api/v1/services/", json={
+            "name": name,
+            "security_policy": "sp_h",
+            "resources": {"cpu": 1, "ram": "1GB"},
+            "policy_id": "policy_h"
+        })
+        assert res.status_code == 201
+        service_ids.append(res.json()["service_id"])
+    first, second = service_ids
+
+    res = await client.post("/api/v1/microservices/", json={
+        "service_id": first,
+        "name": "Microservice H",
+        "resources": {"cpu": 1, "ram": "1GB"}
+    })
+    assert res.status_code == 201
+    microservice_id = res.json()["microservice_id"]
+
+    subtree = await client.get(f"/api/v1/hierarchy/{first}")
+    assert subtree.status_code == 200
+    assert [ms["microservice_id"] for ms in subtree.json()["microservices"]] == [microservice_id]
+    etag = subtree.headers["etag"]
+
+    cached = await client.get(f"/api/v1/hierarchy/{first}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    res = await client.put(f"/api/v1/microservices/{microservice_id}/", json={"service_id": second})
+    assert res.status_code == 200
+
+    moved = await client.get(f"/api/v1/hierarchy/{first}", headers={"If-None-Match": etag})
+    assert moved.status_code == 200
+    assert moved.json()["microservices"] == []
+    target = await client.get(f"/api/v1/hierarchy/{second}")
+    assert [ms["microservice_id"] for ms in target.json()["microservices"]] == [microservice_id]
+
+    res = await client.delete(f"/api/v1/services/{second}/")
+    assert res.status_code == 204
+    assert (await client.get(f"/api/v1/hierarchy/{second}")).status_code == 404
+    full = await client.get("/api/v1/hierarchy")
+    assert second not in [svc["service_id"] for svc in full.json()]
+
+
+def test_removed_service_drops_its_subtree_from_the_snapshot():
+    snapshot = HierarchySnapshot(sync_interval=60, rebuild_interval=60)
+    snapshot.built = True
+    snapshot.upsert_service(ServiceModel(service_id="s_cascade", name="S", security_policy="sp", resources={"cpu": 1, "ram": "1GB"}, policy_id="p"))
+    snapshot.upsert_microservice(MicroserviceModel(microservice_id="ms_cascade", service_id="s_cascade", name="MS", resources={"cpu": 1, "ram": "1GB"}))
+    snapshot.upsert_active_object(ActiveObjectCreateDTO(axo_module="m", axo_class_name="C", axo_microservice_id="ms_cascade").to_model())
+
+    snapshot.remove_service("s_cascade")
+    stats = snapshot.stats()
+    assert (stats["services"], stats["microservices"], stats["active_objects"]) == (0, 0, 0)
+    assert snapshot.render()[0] == b"[]"
@@ -0,0 +1,24 @@
+from cryptomesh import launcher
+
+
+def test_server_options_fall_back_to_available_loop_and_parser(monkeypatch):
+    monkeypatch.setattr(launcher, "available", lambda module: module == "httptools")
+    monkeypatch.setattr(launcher, "default_workers", lambda: 6)
+    options = launcher.server_options(workers=0, backlog=4096, keep_alive=10, limit_concurrency=0)
+    assert options["workers"] == 6
+    assert options["loop"] == "asyncio" and options["http"] == "httptools"
+    assert options["backlog"] == 4096 and options["timeout_keep_alive"] == 10
+    assert options["limit_concurrency"] is None
+
+
+def test_main_runs_the_app_by_import_string_with_per_process_logs(monkeypatch):
+    calls = []
+    monkeypatch.setattr(launcher.uvicorn, "run", lambda app, **options: calls.append((app, options)))
+    monkeypatch.delenv("CRYPTO_MESH_LOG_PER_PROCESS", raising=False)
+    launcher.main(["--workers", "3", "--port", "19001", "--limit-concurrency", "500"])
+    app, options = calls[0]
+    # Workers import the app themselves, so it must be passed by import string.
+    assert app == "cryptomesh.server:app"
+    assert options["workers"] == 3 and options["port"] == 19001 and options["limit_concurrency"] == 500
+    assert launcher.os.environ["CRYPTO_MESH_LOG_PER_PROCESS"] == "1"
+    monkeypatch.delenv("CRYPTO_MESH_LOG_PER_PROCESS")
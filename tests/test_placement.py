@@ -0,0 +1,47 @@
+import pytest
+
+from cryptomesh.repositories.activeobjects_repository import ActiveObjectsRepository
+from cryptomesh.repositories.microservices_repository import MicroservicesRepository
+from cryptomesh.services.activeobjects_service import ActiveObjectsService
+from cryptomesh.services.placement_service import PlacementService
+from cryptomesh.services.topology_service import EndpointRegistry
+
+
+async def _active_object(get_db, active_object_id: str, endpoint_id: str = None, bucket: str = "plc-other"):
+    await get_db["active_objects"].insert_one({
+        "active_object_id": active_object_id, "axo_module": "m", "axo_class_name": "C",
+        "axo_microservice_id": "plc_ms", "axo_endpoint_id": endpoint_id,
+        "axo_bucket_id": bucket, "axo_source_bucket_id": f"{active_object_id}-src", "axo_sink_bucket_id": f"{active_object_id}-sink",
+    })
+
+
+@pytest.mark.asyncio
+async def test_placement_moves_compute_to_data(get_db, insert_endpoint):
+    await get_db["microservices"].insert_one({
+        "microservice_id": "plc_ms", "name": "ms", "service_id": "s", "resources": {"cpu": 2, "ram": "1GB"},
+    })
+    router = {"MICTLANX_ROUTERS": "plc-router-0:localhost:60666"}
+    await insert_endpoint("plc_data", cpu=2, ram="2GB", envs=router)
+    await insert_endpoint("plc_same_router", cpu=2, ram="2GB", envs=router)
+    await insert_endpoint("plc_failed", cpu=4, ram="2GB", state="failed")
+    await insert_endpoint("plc_small", cpu=1, ram="2GB", envs={"MICTLANX_BUCKET_ID": "plc-bucket"})
+    await _active_object(get_db, "plc_existing", "plc_data", bucket="plc-bucket")
+    await _active_object(get_db, "plc_on_failed", "plc_failed", bucket="plc-bucket")
+    await _active_object(get_db, "plc_new", bucket="plc-bucket")
+
+    repository = ActiveObjectsRepository(get_db["active_objects"])
+    svc = PlacementService(
+        ActiveObjectsService(repository),
+        MicroservicesRepository(get_db["microservices"]),
+        registry=EndpointRegistry(refresh_interval=60),
+    )
+    decision = await svc.place("plc_new")
+    assert decision.endpoint_id == "plc_data" and decision.changed
+    ranked = [c.endpoint_id for c in decision.candidates]
+    assert ranked.index("plc_same_router") == 1
+    assert "plc_failed" not in ranked and "plc_small" not in ranked
+    assert (await repository.get_by_id("plc_new")).axo_endpoint_id == "plc_data"
+
+    # Already placed objects keep their endpoint unless forced.
+    again = await svc.place("plc_new")
+    assert not again.changed and again.candidates == []
@@ -0,0 +1,114 @@
+import pytest
+from cryptomesh.errors import DependencyCycleError
+from cryptomesh.models import MicroserviceModel, ResourcesModel, ServiceModel
+from cryptomesh.policies import CMPolicyManager, COMPILED_POLICIES
+from cryptomesh.policies.plan import compute_plan
+from cryptomesh.utils.dag import topological_layers
+
+
+def test_topological_layers_groups_independent_nodes():
+    layers = topological_layers(
+        ["ms1", "svc", "fn", "ep", "ms2"],
+        {"ms1": ["svc"], "ms2": ["svc"], "fn": ["ms1", "ep"], "ep": ["external_sp"]}
+    )
+    assert layers == [["svc", "ep"], ["ms1", "ms2"], ["fn"]]
+
+
+def test_topological_layers_detects_cycles():
+    with pytest.raises(DependencyCycleError) as exc:
+        topological_layers(["a", "b", "c"], {"a": ["b"], "b": ["a"]})
+    assert exc.value.nodes == ["a", "b"]
+
+
+def test_policy_dependency_graph():
+    graph = CMPolicyManager("policies/example.yml").dependency_graph()
+    assert graph[("microservices", "ms_loader")] == {("services", "s_data")}
+    assert graph[("functions", "load_data")] == {("microservices", "ms_loader"), ("endpoints", "ep1")}
+    assert graph[("endpoints", "ep1")] == {("security_policies", "sp1")}
+
+
+def test_compute_plan_only_emits_changes():
+    resources = ResourcesModel(cpu=1, ram="1GB")
+    models = {
+        "services": {
+            "s1": ServiceModel(service_id="s1", name="S1", security_policy="sp1", resources=resources, policy_id="pol"),
+            "s2": ServiceModel(service_id="s2", name="S2", security_policy="sp1", resources=resources, policy_id="pol"),
+        },
+        "microservices": {
+            "m1": MicroserviceModel(microservice_id="m1", name="M1", service_id="s1", resources=resources, policy_id="pol"),
+        },
+    }
+    graph = {("services", "s1"): set(), ("services", "s2"): set(), ("microservices", "m1"): {("services", "s1")}}
+    # s1 exists with a server generated id, s2 is new, m1 changed its resources and "old" was removed from the file.
+    current = {
+        "services": [
+            {"service_id": "uuid-s1", "name": "S1", "security_policy": "sp1", "resources": {"cpu": 1, "ram": "1GB"}, "policy_id": "pol"},
+            {"service_id": "uuid-old", "name": "Old", "security_policy": "sp1", "resources": {"cpu": 1, "ram": "1GB"}, "policy_id": "pol"},
+            {"service_id": "uuid-other", "name": "Other", "security_policy": "sp1", "resources": {"cpu": 1, "ram": "1GB"}, "policy_id": "another"},
+        ],
+        "microservices": [
+            {"microservice_id": "uuid-m1", "name": "M1", "service_id": "uuid-s1", "resources": {"cpu": 2, "ram": "1GB"}, "policy_id": "pol"},
+        ],
+    }
+
+    plan = compute_plan("inline", models, graph, current)
+
+    assert plan.summary() == {"create": 1, "update": 1, "delete": 1, "unchanged": 1}
+    actions = {(a.action, a.kind, a.key): a for a in plan.actions}
+    assert ("create", "services", "s2") in actions
+    update = actions[("update", "microservices", "m1")]
+    assert update.server_id == "uuid-m1"
+    assert set(update.changes) == {"resources"}
+    assert ("delete", "services", "uuid-old") in actions
+
+
+def test_compute_plan_deletes_dependents_first():
+    resources = {"cpu": 1, "ram": "1GB"}
+    models = {"services": {"keep": ServiceModel(service_id="keep", name="Keep", security_policy="sp1",
+                                                 resources=ResourcesModel(**resources), policy_id="pol")}}
+    current = {
+        "services": [{"service_id": "svc-old", "name": "Old", "security_policy": "sp1", "resources": resources, "policy_id": "pol"}],
+        "microservices": [{"microservice_id": "ms-old", "name": "Old", "service_id": "svc-old", "resources": resources, "policy_id": "pol"}],
+        "functions": [{"function_id": "fn-old", "name": "Old", "microservice_id": "ms-old", "policy_id": "pol"}],
+    }
+    plan = compute_plan("inline", models, {("services", "keep"): set()}, current)
+    layers = {a.kind: a.layer for a in plan.actions if a.action == "delete"}
+    assert layers["functions"] < layers["microservices"] < layers["services"]
+
+
+SERVICE_YAML = """
+services:
+  s1:
+    name: "{name}"
+    security_policy: "sp1"
+    resources: {{cpu: 1, ram: "1GB"}}
+"""
+
+
+def test_policy_directory_merge_and_compiled_cache(tmp_path):
+    (tmp_path / "00-base.yml").write_text(SERVICE_YAML.format(name="Base"))
+    (tmp_path / "10-override.yaml").write_text(SERVICE_YAML.format(name="Override"))
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    manager = CMPolicyManager(str(tmp_path), cache_dir=str(tmp_path / ".cache"))
+    assert manager.as_models()["services"]["s1"].name == "Override"
+    assert len(list((tmp_path / ".cache").iterdir())) == 1
+
+    hits = COMPILED_POLICIES.hits
+    models = CMPolicyManager(str(tmp_path)).as_models()
+    assert COMPILED_POLICIES.hits == hits + 1
+    # Returned models are copies, the cached ones are never mutated.
+    models["services"]["s1"].name = "Changed"
+    models["services"]["s1"].resources.cpu = 64
+    fresh = CMPolicyManager(str(tmp_path)).as_models()["services"]["s1"]
+    assert fresh.name == "Override" and fresh.resources.cpu == 1
+
+    # The disk cache is plain JSON, validated back into models.
+    cached_file = next((tmp_path / ".cache").iterdir())
+    assert cached_file.suffix == ".json"
+    COMPILED_POLICIES.clear()
+    from_disk = CMPolicyManager(str(tmp_path), cache_dir=str(tmp_path / ".cache")).as_models()
+    assert from_disk["services"]["s1"].name == "Override" and from_disk["services"]["s1"].resources.cpu == 1
+
+    explicit = CMPolicyManager([str(tmp_path / "10-override.yaml"), str(tmp_path / "00-base.yml")])
+    assert explicit.as_models()["services"]["s1"].name == "Base"
@@ -4,6 +4,9 @@ from cryptomesh.models import RoleModel
 from cryptomesh.repositories.roles_repository import RolesRepository
 from cryptomesh.services.roles_service import RolesService
 from cryptomesh.errors import NotFoundError
+from cryptomesh.cache import TTLCache
+from cryptomesh.cache.version_polling import VersionPoller
+from cryptomesh.repositories.versions_repository import CollectionVersionsRepository, VERSIONS_COLLECTION
 
 @pytest.mark.asyncio
 async def test_create_role(get_db):
@@ -116,3 +119,59 @@ async def test_list_roles(get_db):
 
     assert "role_test_list_1" in role_ids
     assert "role_test_list_2" in role_ids
+
+
+@pytest.mark.asyncio
+async def test_get_role_is_cached_and_invalidated_on_update(get_db):
+    db = get_db
+    repo = RolesRepository(db.roles)
+    cache = TTLCache(name="roles-test", ttl=60, max_size=16)
+    role_svc = RolesService(repo, cache=cache)
+
+    created = await role_svc.create_role(RoleCreateDTO(
+        name="Cached Role",
+        description="Role served from cache",
+        permissions=["read"]
+    ).to_model(role_id="role_test_cached"))
+
+    await role_svc.get_role(created.role_id)
+    served = await role_svc.get_role(created.role_id)
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 1
+
+    # Mutating a list of a returned model must not leak into the cache.
+    served.permissions.append("admin")
+    assert (await role_svc.get_role(created.role_id)).permissions == ["read"]
+
+    await role_svc.update_role(created.role_id, {"permissions": ["read", "write"]})
+    fetched = await role_svc.get_role(created.role_id)
+    assert fetched.permissions == ["read", "write"]
+    assert cache.stats()["misses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_role_writes_of_other_processes_invalidate_the_cache(get_db):
+    db = get_db
+    role_svc = RolesService(RolesRepository(db.roles))
+    created = await role_svc.create_role(RoleCreateDTO(
+        name="Remote Role",
+        description="Role written by another worker",
+        permissions=["read"]
+    ).to_model(role_id="role_test_remote"))
+    await role_svc.get_role(created.role_id)
+
+    poller = VersionPoller(CollectionVersionsRepository(db[VERSIONS_COLLECTION]), interval=1)
+    await poller.poll_once()
+    # Another worker updates the role: the document and its collection version change, no local bump.
+    await db.roles.update_one({"role_id": created.role_id}, {"$set": {"permissions": ["read", "write"]}})
+    await db[VERSIONS_COLLECTION].update_one({"_id": "roles"}, {"$inc": {"version": 1}})
+    assert (await role_svc.get_role(created.role_id)).permissions == ["read"]
+
+    await poller.poll_once()
+    assert poller.replayed == 1
+    assert (await role_svc.get_role(created.role_id)).permissions == ["read", "write"]
+
+    # Bumps made by this process were already announced and are not replayed.
+    await role_svc.update_role(created.role_id, {"permissions": ["read"]})
+    await poller.poll_once()
+    assert poller.replayed == 1
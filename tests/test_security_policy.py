@@ -8,6 +8,7 @@ from cryptomesh.models import SecurityPolicyModel
 from cryptomesh.repositories.security_policy_repository import SecurityPolicyRepository
 from cryptomesh.services.security_policy_service import SecurityPolicyService
 from cryptomesh.errors import NotFoundError, ValidationError
+from cryptomesh.cache import TTLCache
 
 @pytest.mark.asyncio
 async def test_create_policy(get_db):
@@ -123,3 +124,32 @@ async def test_list_policies(get_db):
     assert "Policy List 2" in names
 
 
+
+@pytest.mark.asyncio
+async def test_get_policy_is_cached_and_invalidated_on_delete(get_db):
+    db = get_db
+    repo = SecurityPolicyRepository(collection=db.security_policies)
+    cache = TTLCache(name="security-policies-test", ttl=60, max_size=16)
+    service = SecurityPolicyService(repo, cache=cache)
+
+    created = await service.create_policy(SecurityPolicyDTO(
+        name="Cached Policy",
+        roles=["security_manager"],
+        requires_authentication=True
+    ).to_model())
+
+    first = await service.get_policy(created.sp_id)
+    second = await service.get_policy(created.sp_id)
+    assert first.sp_id == second.sp_id
+    assert cache.stats()["hits"] == 1
+
+    # Mutating a returned model must not leak into the cache.
+    second.name = "mutated"
+    second.roles.append("intruder")
+    third = await service.get_policy(created.sp_id)
+    assert third.name == "Cached Policy"
+    assert third.roles == ["security_manager"]
+
+    await service.delete_policy(created.sp_id)
+    with pytest.raises(NotFoundError):
+        await service.get_policy(created.sp_id)
@@ -10,6 +10,8 @@ from cryptomesh.repositories.services_repository import ServicesRepository
 from cryptomesh.services.services_services import ServicesService
 from cryptomesh.services.security_policy_service import SecurityPolicyService
 from cryptomesh.errors import NotFoundError
+from fastapi import HTTPException
+from pymongo.errors import PyMongoError
 
 
 @pytest.mark.asyncio
@@ -133,3 +135,27 @@ async def test_delete_service(get_db):
 
     with pytest.raises(NotFoundError):
         await service_svc.get_service(created.service_id)
+
+
+@pytest.mark.asyncio
+async def test_failed_version_bump_fails_the_write(get_db, monkeypatch):
+    db = get_db
+    repo = ServicesRepository(db.services)
+    service_svc = ServicesService(repo, SecurityPolicyService(None))
+    created = await service_svc.create_service(ServiceCreateDTO(
+        name="Bump Service",
+        security_policy="security_manager",
+        resources=ResourcesDTO(cpu=1, ram="1GB"),
+        policy_id="Leo_Policy"
+    ).to_model(service_id="s_test_bump"))
+    before = await repo.version_token()
+
+    async def failing_bump(name):
+        raise PyMongoError("versions unavailable")
+    monkeypatch.setattr(repo.versions, "bump", failing_bump)
+
+    # Swallowing the failure would keep serving the old ETag for the new document.
+    with pytest.raises(HTTPException):
+        await repo.update({"service_id": created.service_id}, {"name": "Renamed"})
+    monkeypatch.undo()
+    assert await repo.version_token() == before
@@ -0,0 +1,63 @@
+import asyncio
+import pytest
+
+from cryptomesh.models import RoleModel
+from cryptomesh.repositories.base_repository import READ_FLIGHTS
+from cryptomesh.repositories.roles_repository import RolesRepository
+from cryptomesh.utils.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test")
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"value": 1}
+
+    results = await asyncio.gather(*(flight.do("k", work, copy=dict) for _ in range(5)))
+    assert len(calls) == 1
+    assert all(r == {"value": 1} for r in results)
+    # Followers get their own copy.
+    assert len({id(r) for r in results}) == 5
+    assert flight.stats()["collapsed"] == 4
+
+    await flight.do("k", work)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_failures_and_cancellations_are_isolated():
+    flight = SingleFlight("test")
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        raise RuntimeError("boom")
+
+    impatient = asyncio.ensure_future(flight.do("k", work))
+    patient = asyncio.ensure_future(flight.do("k", work))
+    await asyncio.sleep(0)
+    impatient.cancel()
+    release.set()
+    with pytest.raises(RuntimeError):
+        await patient
+    assert flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_repository_reads_are_coalesced_until_a_write(get_db):
+    repository = RolesRepository(get_db["roles"])
+    await repository.create(RoleModel(role_id="r_flight", name="flight", description="", permissions=["read"]))
+    before = READ_FLIGHTS.stats()
+
+    roles = await asyncio.gather(*(repository.get_by_id("r_flight") for _ in range(10)))
+    assert all(r.role_id == "r_flight" for r in roles)
+    assert READ_FLIGHTS.stats()["executed"] - before["executed"] == 1
+    roles[0].name = "mutated"
+    assert roles[1].name == "flight"
+
+    await repository.update({"role_id": "r_flight"}, {"name": "renamed"})
+    assert (await repository.get_by_id("r_flight")).name == "renamed"
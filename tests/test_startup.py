@@ -0,0 +1,20 @@
+from benchmark.startup import eager_lazy_modules, parse_importtime, profile
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       900 |        900 | site
+import time:       120 |        120 |     humanfriendly.text
+import time:       300 |        420 |   humanfriendly
+import time:      2000 |       2420 | cryptomesh.server
+"""
+
+
+def test_parse_importtime_keeps_only_the_target_subtree():
+    modules = parse_importtime(SAMPLE, "cryptomesh.server")
+    assert modules == {"humanfriendly.text": 120, "humanfriendly": 420, "cryptomesh.server": 2420}
+    assert eager_lazy_modules(modules) == ["humanfriendly"]
+
+
+def test_server_import_does_not_pull_heavy_integrations():
+    result = profile()
+    assert result.total_us > 0
+    assert eager_lazy_modules(result.modules) == []
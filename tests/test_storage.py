@@ -0,0 +1,276 @@
+import hashlib
+import os
+import pytest
+
+from cryptomesh import config
+from cryptomesh.errors import CryptoMeshError, NotFoundError, PayloadTooLargeError, ValidationError
+from cryptomesh.dtos import ActiveObjectCreateDTO
+from cryptomesh.repositories.activeobjects_repository import ActiveObjectsRepository
+from cryptomesh.services import ActiveObjectsService, StorageService
+from cryptomesh.storage import BlobReclaimer, BlobStore, HashingChunker, ReclaimTask, active_object_tasks
+from cryptomesh.storage.local_store import LocalBlobStore
+
+
+class MemoryBlobStore(BlobStore):
+    def __init__(self):
+        self.objects = {}
+        self.chunk_sizes = []
+
+    async def put_chunks(self, bucket_id, key, chunks, tags=None):
+        data = bytearray()
+        async for chunk in chunks:
+            self.chunk_sizes.append(len(chunk))
+            data += chunk
+        self.objects[(bucket_id, key)] = bytes(data)
+
+    async def get_chunks(self, bucket_id, key, chunk_size):
+        data = self.objects[(bucket_id, key)]
+        for offset in range(0, len(data), chunk_size):
+            yield data[offset:offset + chunk_size]
+
+    async def move(self, bucket_id, src_key, dst_key):
+        self.objects[(bucket_id, dst_key)] = self.objects.pop((bucket_id, src_key))
+
+    async def delete(self, bucket_id, key):
+        self.objects.pop((bucket_id, key), None)
+
+    async def delete_bucket(self, bucket_id):
+        for key in [key for key in self.objects if key[0] == bucket_id]:
+            del self.objects[key]
+
+
+def test_blob_store_requires_full_interface():
+    class WriteOnly(BlobStore):
+        async def put_chunks(self, bucket_id, key, chunks, tags=None):
+            pass
+
+    with pytest.raises(TypeError):
+        WriteOnly()
+
+
+async def _stream(*parts):
+    for part in parts:
+        yield part
+
+
+@pytest.mark.asyncio
+async def test_hashing_chunker_rechunks_and_hashes():
+    chunker = HashingChunker(_stream(b"abc", b"defgh", b"", b"ij"), chunk_size=4)
+    chunks = [chunk async for chunk in chunker]
+    assert chunks == [b"abcd", b"efgh", b"ij"]
+    assert chunker.size == 10
+    assert chunker.sha256 == hashlib.sha256(b"abcdefghij").hexdigest()
+
+    with pytest.raises(PayloadTooLargeError):
+        [chunk async for chunk in HashingChunker(_stream(b"x" * 10), chunk_size=4, max_bytes=8)]
+
+
+@pytest.mark.asyncio
+async def test_put_stream_verifies_integrity(monkeypatch):
+    monkeypatch.setattr(config, "CRYPTO_MESH_UPLOAD_CHUNK_SIZE", 3)
+    store = MemoryBlobStore()
+    svc = StorageService(axo_storage=None, blob_store=store)
+    payload = b"model-bundle-bytes"
+
+    ref = await svc.put_stream("b1", "bundle", _stream(payload), expected_sha256=hashlib.sha256(payload).hexdigest())
+    assert ref.size == len(payload)
+    assert store.objects[("b1", "bundle")] == payload
+    assert max(store.chunk_sizes) == 3
+
+    with pytest.raises(ValidationError):
+        await svc.put_stream("b1", "corrupt", _stream(payload), expected_sha256="0" * 64)
+    assert ("b1", "corrupt") not in store.objects
+
+    # A corrupt re-upload leaves the stored version in place.
+    with pytest.raises(ValidationError):
+        await svc.put_stream("b1", "bundle", _stream(b"tampered"), expected_sha256="0" * 64)
+    assert store.objects == {("b1", "bundle"): payload}
+
+
+@pytest.mark.asyncio
+async def test_oversized_overwrite_keeps_the_stored_blob(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "CRYPTO_MESH_UPLOAD_CHUNK_SIZE", 4)
+    monkeypatch.setattr(config, "CRYPTO_MESH_UPLOAD_MAX_BYTES", 8)
+    store = LocalBlobStore(str(tmp_path))
+    svc = StorageService(axo_storage=None, blob_store=store)
+    await svc.put_stream("b1", "model", _stream(b"v1-bytes"))
+
+    with pytest.raises(PayloadTooLargeError):
+        await svc.put_stream("b1", "model", _stream(b"v2-", b"too-large"))
+    assert await store.get("b1", "model") == b"v1-bytes"
+    assert os.listdir(os.path.join(store.refs, "b1")) == ["model"]
+
+    # A complete upload replaces the old version and releases its object.
+    await svc.put_stream("b1", "model", _stream(b"v2-bytes"))
+    assert await store.get("b1", "model") == b"v2-bytes"
+    assert not os.path.exists(store.object_path(hashlib.sha256(b"v1-bytes").hexdigest()))
+
+
+@pytest.mark.asyncio
+async def test_local_blob_store_deduplicates_and_reads_mmap(tmp_path):
+    store = LocalBlobStore(str(tmp_path))
+    await store.put_chunks("b1", "model", _stream(b"weights-", b"v1"))
+    await store.put("b2", "../copy", b"weights-v1")
+    sha = hashlib.sha256(b"weights-v1").hexdigest()
+
+    assert os.stat(store.object_path(sha)).st_nlink == 3
+    assert store.ref_path("b2", "../copy").startswith(store.refs)
+    assert await store.get("b2", "../copy") == b"weights-v1"
+    chunks = [bytes(chunk) async for chunk in store.get_chunks("b1", "model", 4)]
+    assert chunks == [b"weig", b"hts-", b"v1"]
+    with pytest.raises(NotFoundError):
+        store.get_chunks("b1", "missing", 4)
+
+
+@pytest.mark.asyncio
+async def test_local_blob_store_collects_unreferenced_objects(tmp_path):
+    store = LocalBlobStore(str(tmp_path))
+    await store.put("b1", "a", b"shared")
+    await store.put("b2", "a", b"shared")
+    await store.put("b2", "b", b"")
+    await store.put("b3", "c", b"untouched")
+    sha = hashlib.sha256(b"shared").hexdigest()
+
+    # Deletes remove the object of their last ref without sweeping the store.
+    store.collect_garbage = lambda: pytest.fail("deletes must not sweep the store")
+    await store.delete("b1", "a")
+    assert os.path.exists(store.object_path(sha))
+    await store.delete_bucket("b2")
+    assert not os.path.exists(store.object_path(sha))
+    assert os.listdir(store.tmp) == []
+    assert len(os.listdir(store.inodes)) == 1
+    assert await store.get("b3", "c") == b"untouched"
+
+
+def test_get_stream_requires_a_readable_store():
+    class WriteOnlyStore(MemoryBlobStore):
+        supports_reads = False
+
+    with pytest.raises(CryptoMeshError) as e:
+        StorageService(axo_storage=None, blob_store=WriteOnlyStore()).get_stream("b1", "k")
+    assert e.value.code == 501
+
+
+@pytest.mark.asyncio
+async def test_local_backend_stores_active_object_code(tmp_path):
+    svc = StorageService(axo_storage=None, blob_store=LocalBlobStore(str(tmp_path)))
+    dto = ActiveObjectCreateDTO(axo_module="m", axo_class_name="C", axo_microservice_id="ms", axo_alias="calc", axo_bucket_id="b1", axo_code="class Calc:\n    pass\n")
+    model = (await svc.put_blobs(dto)).unwrap()
+    assert model.axo_class_name == "Calc"
+    assert await svc.blob_store.get("b1", "calc") == dto.axo_code.encode()
+    assert b'"axo_class_name": "Calc"' in await svc.blob_store.get("b1", "calc.meta.json")
+
+    assert (await svc.delete_blobs("b1", "calc")).is_ok
+    with pytest.raises(NotFoundError):
+        await svc.blob_store.get("b1", "calc.meta.json")
+
+
+class FlakyStorage:
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.reclaimed = []
+
+    async def reclaim(self, task):
+        if self.failures > 0:
+            self.failures -= 1
+            raise RuntimeError("object store unavailable")
+        self.reclaimed.append(task)
+
+
+def _reclaimer(storage, max_attempts=3):
+    reclaimer = BlobReclaimer(batch_size=2, concurrency=2, max_attempts=max_attempts, backoff=0.01, queue_size=100)
+    reclaimer.bind(storage)
+    return reclaimer
+
+
+@pytest.mark.asyncio
+async def test_reclaimer_retries_failed_tasks():
+    storage = FlakyStorage(failures=2)
+    reclaimer = _reclaimer(storage)
+    tasks = [ReclaimTask("bucket", f"b{i}") for i in range(5)]
+    reclaimer.enqueue(tasks)
+    await reclaimer.drain()
+    assert sorted(storage.reclaimed) == sorted(tasks)
+    assert reclaimer.stats()["retried"] == 2
+
+    storage.failures = 10
+    reclaimer.enqueue([ReclaimTask("blob", "b", "k")])
+    await reclaimer.drain()
+    assert list(reclaimer.failed) == [ReclaimTask("blob", "b", "k")]
+
+
+@pytest.mark.asyncio
+async def test_microservice_delete_cascades_to_active_objects(client, get_db, monkeypatch):
+    storage = FlakyStorage(failures=0)
+    reclaimer = _reclaimer(storage)
+    monkeypatch.setattr("cryptomesh.services.activeobjects_service.BLOB_RECLAIMER", reclaimer)
+
+    created = await client.post("/api/v1/microservices/", json={
+        "service_id": "s_reclaim", "name": "Reclaim", "resources": {"cpu": 1, "ram": "1GB"}
+    })
+    microservice_id = created.json()["microservice_id"]
+    active_object = ActiveObjectCreateDTO(
+        axo_module="m", axo_class_name="C", axo_microservice_id=microservice_id,
+        axo_artifacts=[{"bucket_id": "artifacts", "key": "bundle", "size": 1, "sha256": "0" * 64}],
+    ).to_model()
+    await ActiveObjectsService(ActiveObjectsRepository(get_db["active_objects"])).create_active_object(active_object)
+
+    assert (await client.delete(f"/api/v1/microservices/{microservice_id}/")).status_code == 204
+    assert await get_db["active_objects"].count_documents({"axo_microservice_id": microservice_id}) == 0
+
+    await reclaimer.drain()
+    assert set(storage.reclaimed) == set(active_object_tasks(active_object))
+
+
+@pytest.mark.asyncio
+async def test_reclaimer_stop_cancels_pending_retries():
+    storage = FlakyStorage(failures=10)
+    reclaimer = BlobReclaimer(batch_size=2, concurrency=2, max_attempts=3, backoff=60, queue_size=100)
+    reclaimer.bind(storage)
+    reclaimer.enqueue([ReclaimTask("bucket", "b")])
+    await reclaimer.process_batch(reclaimer._next_batch(reclaimer.queue.get_nowait()))
+    assert reclaimer.stats()["retrying"] == 1
+
+    await reclaimer.stop()
+    assert reclaimer.stats()["retrying"] == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_buckets_are_reclaimed_with_their_last_active_object(get_db):
+    storage = FlakyStorage(failures=0)
+    reclaimer = _reclaimer(storage)
+    service = ActiveObjectsService(ActiveObjectsRepository(get_db["active_objects"]), reclaimer=reclaimer)
+    shared = {"axo_source_bucket_id": "shared-source", "axo_sink_bucket_id": "shared-sink"}
+    first = ActiveObjectCreateDTO(axo_module="m", axo_class_name="A", axo_microservice_id="ms_shared", **shared).to_model()
+    second = ActiveObjectCreateDTO(axo_module="m", axo_class_name="B", axo_microservice_id="ms_shared", **shared).to_model()
+    await service.create_active_object(first)
+    await service.create_active_object(second)
+
+    await service.delete_active_object(first.active_object_id)
+    await reclaimer.drain()
+    assert storage.reclaimed == [ReclaimTask("axo_object", first.axo_bucket_id, first.axo_key)]
+
+    await service.delete_active_object(second.active_object_id)
+    await reclaimer.drain()
+    assert ReclaimTask("bucket", "shared-source") in storage.reclaimed
+    assert ReclaimTask("bucket", "shared-sink") in storage.reclaimed
+
+
+@pytest.mark.asyncio
+async def test_shared_code_is_reclaimed_with_its_last_active_object(get_db):
+    storage = FlakyStorage(failures=0)
+    reclaimer = _reclaimer(storage)
+    service = ActiveObjectsService(ActiveObjectsRepository(get_db["active_objects"]), reclaimer=reclaimer)
+    code = {"axo_bucket_id": "shared-code", "axo_key": "calc"}
+    first = ActiveObjectCreateDTO(axo_module="m", axo_class_name="A", axo_microservice_id="ms_code", **code).to_model()
+    second = ActiveObjectCreateDTO(axo_module="m", axo_class_name="B", axo_microservice_id="ms_code", **code).to_model()
+    await service.create_active_object(first)
+    await service.create_active_object(second)
+
+    await service.delete_active_object(first.active_object_id)
+    await reclaimer.drain()
+    assert ReclaimTask("axo_object", "shared-code", "calc") not in storage.reclaimed
+
+    await service.delete_active_object(second.active_object_id)
+    await reclaimer.drain()
+    assert ReclaimTask("axo_object", "shared-code", "calc") in storage.reclaimed
@@ -0,0 +1,65 @@
+import random
+import pytest
+from datetime import datetime, timezone
+
+from cryptomesh.models import EndpointModel
+from cryptomesh.repositories.endpoint_state_repository import EndpointStateRepository
+from cryptomesh.services.topology_service import EndpointRegistry, TopologyService
+
+NETWORK = "topo-test-net"
+
+
+def _envs(network: str = NETWORK) -> dict:
+    return {"AXO_NETWORK_ID": network, "AXO_GOSSIP_PORT": "7000"}
+
+
+@pytest.mark.asyncio
+async def test_gossip_seeds_prefer_healthy_peers_of_the_same_network(insert_endpoint):
+    await insert_endpoint("topo_warm_1", "warm", envs=_envs())
+    await insert_endpoint("topo_warm_2", "warming", envs=_envs())
+    await insert_endpoint("topo_new", envs=_envs())
+    await insert_endpoint("topo_failed", "failed", envs=_envs())
+    await insert_endpoint("topo_silent", "warm", age=600, envs=_envs())
+    await insert_endpoint("topo_other_net", "warm", envs=_envs("elsewhere"))
+
+    registry = EndpointRegistry(refresh_interval=60)
+    topology = TopologyService(registry=registry, fanout=2, heartbeat_ttl=60, rng=random.Random(7))
+    newcomer = EndpointModel(
+        endpoint_id="topo_newcomer", name="n", image="axo", security_policy="sp",
+        resources={"cpu": 1, "ram": "1GB"}, envs={"AXO_NETWORK_ID": NETWORK},
+    )
+
+    result = await topology.topology_for(newcomer)
+    assert sorted(result.seeds) == ["topo_warm_1:7000", "topo_warm_2:7000"]
+    assert sorted(result.endpoints) == ["topo_warm_1:topo_warm_1:16667", "topo_warm_2:topo_warm_2:16667"]
+
+    # Peers that never reported fill the remaining slots; failed and silent ones never do.
+    topology.fanout = 5
+    result = await topology.topology_for(newcomer)
+    assert sorted(result.seeds) == ["topo_new:7000", "topo_warm_1:7000", "topo_warm_2:7000"]
+
+    # The registry is reused until endpoints are written; endpoint states wait for refresh_interval.
+    refreshes = registry.refreshes
+    registry.on_version_bump("endpoint_states", "x.1")
+    await topology.topology_for(newcomer)
+    assert registry.refreshes == refreshes
+    registry.on_version_bump("endpoints", "x.1")
+    await topology.topology_for(newcomer)
+    assert registry.refreshes == refreshes + 1
+
+
+
+@pytest.mark.asyncio
+async def test_latest_state_per_endpoint_uses_its_index(get_db, insert_endpoint):
+    repository = EndpointStateRepository(get_db["endpoint_states"])
+    await repository.ensure_indexes()
+    assert "endpoint_id_1_timestamp_-1" in await get_db["endpoint_states"].index_information()
+
+    await insert_endpoint("topo_flapping", "warm", age=30, envs=_envs())
+    await get_db["endpoint_states"].insert_one({
+        "state_id": "st_topo_flapping_2", "endpoint_id": "topo_flapping", "state": "failed", "metadata": {},
+        "timestamp": datetime.now(timezone.utc),
+    })
+    latest = await repository.latest_by_endpoint(["topo_flapping", "topo_unknown"])
+    assert list(latest) == ["topo_flapping"]
+    assert latest["topo_flapping"]["state"] == "failed"